@@ -39,6 +39,38 @@ import numpy as np
 from typing import Any
 
 
+# Abbreviated arrays and dicts of arrays show their memory usage from this
+# size, so that large objects are noticed when working interactively.
+_MIN_NBYTES_TO_SHOW = 2**20
+
+
+def _format_nbytes(nbytes: int) -> str:
+    """
+    Format a number of bytes using binary units.
+
+    Parameters
+    ----------
+    nbytes:
+        The number of bytes.
+
+    Returns
+    -------
+    A string such as "512 B", "1.5 KiB" or "23.8 MiB".
+
+    """
+    if nbytes < 1024:
+        return f"{nbytes} B"
+    value = float(nbytes)
+    for unit in ["KiB", "MiB", "GiB"]:
+        value /= 1024
+        if value < 1024:
+            break
+    else:
+        value /= 1024
+        unit = "TiB"
+    return f"{value:.1f} {unit}"
+
+
 def _format_dict_entries(
     the_dict: Any, quotes: bool = True, overrides={}, hide_private=False
 ) -> str:
@@ -93,18 +125,33 @@ def _format_dict_entries(
             key_label = key_label[1:-1]
         key_label = " " * (widest - len(key_label)) + key_label
 
-        value = the_dict[key]
+        # Bypass any overridden __getitem__ (e.g., the copy-on-write arrays
+        # of TimeSeries.data): we only read the value to display it.
+        value = dict.__getitem__(the_dict, key)
 
         # Print the value
         if widest + len(repr(value)) <= max_width:
             value_label = repr(value)
         else:
             if isinstance(value, dict):
-                value_label = "<dict with " + str(len(value)) + " entries>"
+                value_label = "<dict with " + str(len(value)) + " entries"
+                nbytes = sum(
+                    [
+                        _.nbytes
+                        for _ in dict.values(value)
+                        if isinstance(_, np.ndarray)
+                    ]
+                )
+                if nbytes >= _MIN_NBYTES_TO_SHOW:
+                    value_label += ", " + _format_nbytes(nbytes)
+                value_label += ">"
             elif isinstance(value, list):
                 value_label = "<list of " + str(len(value)) + " items>"
             elif isinstance(value, np.ndarray):
-                value_label = "<array of shape " + str(np.shape(value)) + ">"
+                value_label = "<array of shape " + str(np.shape(value))
+                if value.nbytes >= _MIN_NBYTES_TO_SHOW:
+                    value_label += ", " + _format_nbytes(value.nbytes)
+                value_label += ">"
             else:
                 value_label = repr(value)
 
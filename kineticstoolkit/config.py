@@ -28,6 +28,9 @@ __license__ = "Apache 2.0"
 import os
 import warnings
 import platform
+from contextlib import contextmanager
+
+import numpy as np
 
 
 def __dir__() -> list[str]:
@@ -41,6 +44,12 @@ def __dir__() -> list[str]:
         "version",
         "pythonpath",
         "interactive_backend_warning",
+        "validation_level",
+        "temporary_validation_level",
+        "float_dtype",
+        "temporary_float_dtype",
+        "n_jobs",
+        "temporary_n_jobs",
     ]
 
 
@@ -87,3 +96,208 @@ if "SPY_PYTHONPATH" in env and "PYTHONPATH" not in env:
 
 # Others
 interactive_backend_warning = True
+
+# Level of validation of function parameters and TimeSeries integrity:
+# - "strict": every check is performed (default);
+# - "cheap": only the checks that do not depend on data size are performed,
+#   e.g., the type of the parameters but not of their contents, and the
+#   TimeSeries' time vector is not scanned for nans, duplicates or order.
+#   The order of the time vector, which selects binary searches in index
+#   lookups, is checked once per time vector: in-place modifications of the
+#   time vector (e.g., ts.time[3] = 0.0) are not detected;
+# - "off": no check is performed. Invalid inputs then lead to undefined
+#   results instead of clear error messages.
+validation_level = "strict"
+
+
+@contextmanager
+def _temporary_setting(name: str, value):
+    """
+    Temporarily set a configuration value of this module.
+
+    Parameters
+    ----------
+    name
+        Name of the configuration value, e.g., "validation_level".
+    value
+        Value to set. It must have been checked by the caller.
+
+    """
+    previous_value = globals()[name]
+    globals()[name] = value
+    try:
+        yield
+    finally:
+        globals()[name] = previous_value
+
+
+def temporary_validation_level(level: str):
+    """
+    Temporarily set the validation level.
+
+    Parameters
+    ----------
+    level
+        "strict", "cheap" or "off". See ktk.config.validation_level.
+
+    Example
+    -------
+    >>> import kineticstoolkit as ktk
+    >>> with ktk.config.temporary_validation_level("off"):
+    ...     ktk.config.validation_level
+    'off'
+    >>> ktk.config.validation_level
+    'strict'
+
+    """
+    _check_validation_level(level)
+    return _temporary_setting("validation_level", level)
+
+
+def _check_validation_level(level) -> str:
+    """Return the validation level, or raise if it is invalid."""
+    if level not in ["strict", "cheap", "off"]:
+        raise ValueError(
+            "The validation level must be either 'strict', 'cheap' or 'off'. "
+            f"However, a value of {level} was provided."
+        )
+    return level
+
+
+def _get_validation_level() -> str:
+    """Get the validation level, from ktk.config.validation_level."""
+    return _check_validation_level(validation_level)
+
+
+# Floating-point dtype of TimeSeries data and numerical results:
+# - None: floating-point data keep their dtype, and the results of resampling,
+#   filtering, geometry and cycle functions have the same floating-point
+#   dtype as their inputs (e.g., float32 data stay float32). Inputs that are
+#   not floating-point (e.g., int) give float64 results (default);
+# - a floating-point dtype (e.g., np.float32): floating-point data are
+#   converted to this dtype when they are assigned to a TimeSeries' data, and
+#   the numerical results are computed in this dtype.
+# The TimeSeries' time is not affected and stays float64.
+float_dtype = None
+
+
+def temporary_float_dtype(dtype):
+    """
+    Temporarily set the floating-point dtype.
+
+    Parameters
+    ----------
+    dtype
+        None, or a floating-point dtype such as np.float32 or "float64". See
+        ktk.config.float_dtype.
+
+    Example
+    -------
+    >>> import kineticstoolkit as ktk
+    >>> with ktk.config.temporary_float_dtype("float32"):
+    ...     ktk.config.float_dtype
+    'float32'
+    >>> print(ktk.config.float_dtype)
+    None
+
+    """
+    if dtype is not None:
+        _check_float_dtype(dtype)
+    return _temporary_setting("float_dtype", dtype)
+
+
+def _check_float_dtype(dtype) -> np.dtype:
+    """Return dtype as a np.dtype, or raise if it is not floating-point."""
+    try:
+        out = np.dtype(dtype)
+    except TypeError:
+        out = np.dtype(object)
+    if not np.issubdtype(out, np.floating):
+        raise ValueError(
+            "The floating-point dtype must be None or a floating-point "
+            f"dtype such as np.float32 or np.float64. However, a value of "
+            f"{dtype} was provided."
+        )
+    return out
+
+
+def _get_float_dtype(*dtypes) -> np.dtype:
+    """
+    Get the dtype of the floating-point result of an operation.
+
+    Parameters
+    ----------
+    dtypes
+        The dtypes of the operation's inputs.
+
+    Returns
+    -------
+    np.dtype
+        ktk.config.float_dtype if it is not None. Otherwise, the promoted
+        dtype of the inputs, where any input that is not floating-point
+        (e.g., int or bool) counts as float64. Without inputs, float64.
+
+    """
+    if float_dtype is not None:
+        return _check_float_dtype(float_dtype)
+    if len(dtypes) == 0:
+        return np.dtype(np.float64)
+    return np.result_type(
+        *[
+            dtype if np.issubdtype(dtype, np.inexact) else np.float64
+            for dtype in dtypes
+        ]
+    )
+
+
+# Number of threads used to filter data in the filters module, where the
+# data keys or columns are processed concurrently. 1 means no parallelism
+# (default), -1 means one thread per CPU.
+n_jobs = 1
+
+
+def temporary_n_jobs(jobs: int):
+    """
+    Temporarily set the number of threads.
+
+    Parameters
+    ----------
+    jobs
+        A positive number of threads, or -1 for one thread per CPU. See
+        ktk.config.n_jobs.
+
+    Example
+    -------
+    >>> import kineticstoolkit as ktk
+    >>> with ktk.config.temporary_n_jobs(4):
+    ...     ktk.config.n_jobs
+    4
+    >>> ktk.config.n_jobs
+    1
+
+    """
+    _check_n_jobs(jobs)
+    return _temporary_setting("n_jobs", jobs)
+
+
+def _check_n_jobs(jobs) -> int:
+    """Return the number of threads, or raise if jobs is invalid."""
+    if not isinstance(jobs, int) or isinstance(jobs, bool):
+        raise TypeError(
+            f"The number of jobs must be an int. However, a value of {jobs} "
+            "was provided."
+        )
+    if jobs == -1:
+        cpu_count = os.cpu_count()
+        return 1 if cpu_count is None else cpu_count
+    if jobs < 1:
+        raise ValueError(
+            "The number of jobs must be a positive integer or -1. However, "
+            f"a value of {jobs} was provided."
+        )
+    return jobs
+
+
+def _get_n_jobs() -> int:
+    """Get the number of threads to use, from ktk.config.n_jobs."""
+    return _check_n_jobs(n_jobs)
@@ -27,9 +27,9 @@ __license__ = "Apache 2.0"
 import numpy as np
 from typing import cast
 from kineticstoolkit.timeseries import TimeSeries, TimeSeriesEvent
-from kineticstoolkit.exceptions import TimeSeriesEventNotFoundError
 from tqdm import tqdm
 from kineticstoolkit.typing_ import ArrayLike, check_param
+from bisect import bisect_right
 
 
 def __dir__():
@@ -236,9 +236,10 @@ def detect_cycles(
                 valid_events.append(TimeSeriesEvent(time3, "_"))
 
     # Form the output timeseries
-    tsout = ts.copy()
-    for event in valid_events:
-        tsout = tsout.add_event(event.time, event.name)
+    tsout = ts.add_events(
+        [event.time for event in valid_events],
+        [event.name for event in valid_events],
+    )
     tsout.sort_events()
 
     return tsout
@@ -332,37 +333,27 @@ def time_normalize(
 
     dest_data = {}  # type: dict[str, list[np.ndarray]]
     dest_data_shape = {}  # type: dict[str, tuple[int, ...]]
+    dest_event_times = []  # type: list[float]
+    dest_event_names = []  # type: list[str]
+
+    # Prepare what is common to all cycles: the interpolators and the sorted
+    # events.
+    interpolator = ts.get_interpolator(extrapolate=True)
+    sorted_events = ts.sort_events().events
+    sorted_event_times = sorted_events._get_columns()[0]
+    begin_times = [
+        ts.events[i].time for i in ts._get_event_indexes(event_name1)
+    ]
+    end_times = [ts.events[i].time for i in ts._get_event_indexes(event_name2)]
 
     # Go through all cycles
     i_cycle = 0
-    break_now = False
-    while True:
-        # Get the begin time for this cycle
-        try:
-            event_index = ts._get_event_index(event_name1, i_cycle)
-        except TimeSeriesEventNotFoundError:
-            break_now = True
-        else:
-            begin_time = ts.events[event_index].time
-
-        if break_now:
-            break
-
-        # Get the end time for this cycle
-        end_cycle = 0
-        end_time = ts.events[ts._get_event_index(event_name2, end_cycle)].time
-        while end_time <= begin_time:
-            end_cycle += 1
-            try:
-                end_time = ts.events[
-                    ts._get_event_index(event_name2, end_cycle)
-                ].time
-            except TimeSeriesEventNotFoundError:
-                break_now = True
-                break
-
-        if break_now:
+    for begin_time in begin_times:
+        # Get the end time for this cycle: the first end event after begin
+        end_cycle = bisect_right(end_times, begin_time)
+        if end_cycle == len(end_times):
             break
+        end_time = end_times[end_cycle]
 
         # Get the extended begin and end times considering relative_span
         extended_begin_time = begin_time + span[0] / n_points * (
@@ -372,42 +363,31 @@ def time_normalize(
             end_time - begin_time
         )
 
-        # Extract this cycle
-        subts = ts.get_ts_between_times(
-            extended_begin_time, extended_end_time, inclusive=True
-        )
-
-        if subts.time.shape[0] == 0:
+        # Check that this cycle contains data
+        first_index = np.searchsorted(ts.time, extended_begin_time, "left")
+        last_index = np.searchsorted(ts.time, extended_end_time, "right")
+        if first_index == last_index:
             raise ValueError("")
 
         # Resample this cycle on span + 1 point
         # (and remove the last point after)
-        subts = subts.resample(
+        cycle_data = interpolator.interpolate_data(
             np.linspace(
                 extended_begin_time,
                 extended_end_time,
                 span[1] - span[0] + 1,
-            ),
-            extrapolate=True,
-        )
-
-        # Keep only the first points (the last one belongs to the next cycle)
-        subts = subts.get_ts_between_indexes(
-            0, span[1] - span[0] - 1, inclusive=True
+            )
         )
 
-        # Keep only the events in the unextended span
-        events = []
-        for event in subts.events:
-            if event.time >= begin_time and event.time < end_time:
-                events.append(event)
-        subts.events = events
-        subts = subts.sort_events()
+        # Keep only the events in the unextended span, sorted by time
+        first_event = np.searchsorted(sorted_event_times, begin_time)
+        last_event = np.searchsorted(sorted_event_times, end_time)
+        events = sorted_events[first_event:last_event]
 
         # Separate start/end events from the other
         start_end_events = []
         other_events = []
-        for event in subts.events:
+        for event in events:
             if event.name == event_name1 or event.name == event_name2:
                 start_end_events.append(event)
             else:
@@ -415,12 +395,14 @@ def time_normalize(
 
         # Add event_name1 at the beginning and end (duplicates will be
         # cancelled at the end)
-        dest_ts = dest_ts.add_event(
-            float(-span[0] + i_cycle * (span[1] - span[0])), event_name1
+        dest_event_times.append(
+            float(-span[0] + i_cycle * (span[1] - span[0]))
         )
-        dest_ts = dest_ts.add_event(
-            float(-span[0] + n_points + i_cycle * (span[1] - span[0])), "_"
+        dest_event_names.append(event_name1)
+        dest_event_times.append(
+            float(-span[0] + n_points + i_cycle * (span[1] - span[0]))
         )
+        dest_event_names.append("_")
 
         # Add the other events
         def time_to_normalized_time(time):
@@ -432,14 +414,16 @@ def time_normalize(
         for i_event, event in enumerate(other_events):
             # Resample
             new_time = time_to_normalized_time(event.time)
-            dest_ts = dest_ts.add_event(new_time, event.name)
+            dest_event_times.append(new_time)
+            dest_event_names.append(event.name)
 
-        # Add this cycle to dest_time and dest_data
-        for key in subts.data:
+        # Add this cycle to dest_time and dest_data, keeping only the first
+        # points (the last one belongs to the next cycle)
+        for key in cycle_data:
             if key not in dest_data:
                 dest_data[key] = []
                 dest_data_shape[key] = ts.data[key].shape
-            dest_data[key].append(subts.data[key])
+            dest_data[key].append(cycle_data[key][0 : span[1] - span[0]])
 
         i_cycle += 1
 
@@ -454,6 +438,7 @@ def time_normalize(
         new_shape[0] = n_cycles * (span[1] - span[0])
         dest_ts.data[key] = np.reshape(temp, new_shape)
 
+    dest_ts.add_events(dest_event_times, dest_event_names, in_place=True)
     dest_ts = dest_ts.sort_events()
     return dest_ts
 
@@ -38,6 +38,8 @@ import subprocess
 import shutil
 import webbrowser
 import doctest
+import time
+import numpy as np
 
 
 def run_unit_tests() -> None:  # pragma: no cover
@@ -147,6 +149,49 @@ def upload_to_pypi() -> None:  # pragma: no cover
     )
 
 
+def run_interpolation_benchmark(
+    n_keys: int = 200, n_samples: int = 10000
+) -> None:  # pragma: no cover
+    """
+    Compare batched vs per-key interpolation of a TimeSeries.
+
+    A TimeSeries of n_keys markers with a few common occlusions is resampled
+    and filled as a whole, which interpolates the markers that miss the
+    same samples together, then one marker at a time, which was the former
+    behaviour.
+
+    """
+    import kineticstoolkit as ktk
+
+    ts = ktk.TimeSeries(time=np.arange(n_samples) / 100)
+    for i_key in range(n_keys):
+        ts.data[f"Marker{i_key}"] = np.random.rand(n_samples, 4)
+        # Markers share one of four occlusion patterns
+        start = n_samples // 10 * (1 + i_key % 4)
+        ts.data[f"Marker{i_key}"][start : start + n_samples // 20] = np.nan
+
+    def per_key(function):
+        for key in ts.data:
+            function(ts.get_subset(key))
+
+    for name, function in [
+        ("resample", lambda ts: ts.resample(200.0)),
+        ("fill_missing_samples", lambda ts: ts.fill_missing_samples(0)),
+    ]:
+        tic = time.perf_counter()
+        function(ts)
+        batched = time.perf_counter() - tic
+
+        tic = time.perf_counter()
+        per_key(function)
+        separate = time.perf_counter() - tic
+
+        print(
+            f"{name}: {batched:.3f} s batched, {separate:.3f} s per key "
+            f"({n_keys} keys of {n_samples} samples)."
+        )
+
+
 def run_tests() -> None:  # pragma: no cover
     """Run all testing and building functions."""
     run_style_formatter()
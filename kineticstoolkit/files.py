@@ -203,8 +203,11 @@ def _load_object_hook(obj):
             out.data_info = obj["data_info"]
             for key in obj["data"]:
                 out.data[key] = np.array(obj["data"][key])
-            for event in obj["events"]:
-                out = out.add_event(event["time"], event["name"])
+            out.add_events(
+                [event["time"] for event in obj["events"]],
+                [event["name"] for event in obj["events"]],
+                in_place=True,
+            )
             return out
 
         elif to_class == "pandas.DataFrame":
@@ -566,17 +569,14 @@ def read_c3d(
         )
 
     # Add events
-    for i_event in range(len(event_names)):
-        event_time = event_times[i_event]
-        if include_event_context:
-            event_name = event_contexts[i_event] + ":" + event_names[i_event]
-        else:
-            event_name = event_names[i_event]
-        points.add_event(
-            event_time,
-            event_name,
-            in_place=True,
-        )
+    if include_event_context:
+        point_event_names = [
+            event_contexts[i_event] + ":" + event_names[i_event]
+            for i_event in range(len(event_names))
+        ]
+    else:
+        point_event_names = event_names
+    points.add_events(event_times, point_event_names, in_place=True)
     points.sort_events(in_place=True)
 
     # Add to output
@@ -642,8 +642,7 @@ def read_c3d(
             )
 
         # Add events
-        for i_event, event_name in enumerate(event_names):
-            analogs.add_event(event_times[i_event], event_name, in_place=True)
+        analogs.add_events(event_times, event_names, in_place=True)
         analogs.sort_events(in_place=True)
 
         output["Analogs"] = analogs
@@ -689,10 +688,7 @@ def read_c3d(
             platforms.add_data_info(key, "Unit", moment_unit, in_place=True)
 
         # Add events
-        for i_event, event_name in enumerate(event_names):
-            platforms.add_event(
-                event_times[i_event], event_name, in_place=True
-            )
+        platforms.add_events(event_times, event_names, in_place=True)
         platforms.sort_events(in_place=True)
 
         output["ForcePlates"] = platforms
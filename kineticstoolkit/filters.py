@@ -29,31 +29,559 @@ import numpy as np
 import scipy.signal as sgl
 import scipy.ndimage as ndi
 import warnings
+import threading
+import kineticstoolkit.config
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from kineticstoolkit import TimeSeries
 from kineticstoolkit.typing_ import check_param
-from typing import cast
+from typing import Callable, cast
 
 import kineticstoolkit as ktk  # For doctests
 
 
 def __dir__():
-    return ["savgol", "smooth", "butter", "deriv", "median"]
+    return [
+        "savgol",
+        "smooth",
+        "butter",
+        "StreamingButter",
+        "deriv",
+        "median",
+        "get_cache_info",
+        "clear_cache",
+    ]
+
+
+@lru_cache(maxsize=128)
+def _design_butter(
+    order: int, fc: float | tuple[float, float], btype: str, fs: float
+) -> np.ndarray:
+    """
+    Design a Butterworth filter as second-order sections.
+
+    The result is cached: filtering many TimeSeries with the same settings
+    and sample rate designs the filter only once.
+
+    Returns
+    -------
+    np.ndarray
+        The second-order sections, as given by scipy.signal.butter. Since
+        this array is shared between calls, it must not be modified. It is
+        not made read-only because scipy.signal.sosfilt does not accept
+        read-only sections.
+
+    """
+    return sgl.butter(order, fc, btype, analog=False, output="sos", fs=fs)
+
+
+@lru_cache(maxsize=128)
+def _design_savgol(
+    window_length: int, poly_order: int, deriv: int, delta: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the coefficients of a Savitzky-Golay filter.
+
+    The result is cached: filtering many TimeSeries with the same settings
+    and sample rate computes the coefficients only once.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The read-only convolution kernel, of shape (window_length,), and the
+        read-only matrix of shape (window_length, window_length) that
+        applies the filter on a signal of window_length samples. The first
+        and last rows of this matrix give the polynomial fit at the edges of
+        any signal, as in scipy.signal.savgol_filter with mode="interp".
+
+    """
+    kernel = sgl.savgol_coeffs(
+        window_length, poly_order, deriv=deriv, delta=delta
+    )
+    matrix = sgl.savgol_filter(
+        np.eye(window_length),
+        window_length,
+        poly_order,
+        deriv,
+        delta=delta,
+        axis=0,
+    )
+    kernel.flags.writeable = False
+    matrix.flags.writeable = False
+    return (kernel, matrix)
+
+
+def _savgol_filter(
+    values: np.ndarray,
+    window_length: int,
+    poly_order: int,
+    deriv: int,
+    delta: float,
+) -> np.ndarray:
+    """
+    Apply a Savitzky-Golay filter along the first axis, using cached kernels.
+
+    This is equivalent to scipy.signal.savgol_filter with axis=0.
+    """
+    n_samples = values.shape[0]
+    if window_length > n_samples or window_length <= poly_order:
+        # Let scipy raise its usual error.
+        return sgl.savgol_filter(
+            values, window_length, poly_order, deriv, delta=delta, axis=0
+        )
+
+    # As in scipy, filter integers and other types as float64.
+    if values.dtype != np.float32 and values.dtype != np.float64:
+        values = values.astype(np.float64)
+
+    kernel, matrix = _design_savgol(window_length, poly_order, deriv, delta)
+    filtered = ndi.convolve1d(values, kernel, axis=0, mode="constant")
+
+    # Polynomial fit at the edges
+    half_length = window_length // 2
+    filtered[:half_length] = np.tensordot(
+        matrix[:half_length], values[:window_length], axes=(1, 0)
+    )
+    filtered[n_samples - half_length :] = np.tensordot(
+        matrix[window_length - half_length :],
+        values[n_samples - window_length :],
+        axes=(1, 0),
+    )
+    return filtered
+
+
+def get_cache_info() -> dict[str, dict[str, int]]:
+    """
+    Get statistics on the cache of filter coefficients.
+
+    The coefficients of the Butterworth and Savitzky-Golay filters are
+    cached, so that filtering many TimeSeries with the same settings and
+    sample rate computes these coefficients only once.
+
+    Returns
+    -------
+    dict[str, dict[str, int]]
+        A dict with the entries "butter" and "savgol", each of them being a
+        dict with the entries "Hits", "Misses", "Size" and "MaxSize".
+
+    See Also
+    --------
+    ktk.filters.clear_cache
+
+    Example
+    -------
+    >>> ktk.filters.clear_cache()
+    >>> ts = ktk.TimeSeries(time=np.arange(100) / 100)
+    >>> ts = ts.add_data("signal", np.random.rand(100))
+    >>> for i in range(3):
+    ...     ts_filtered = ktk.filters.butter(ts, 10.0)
+    >>> ktk.filters.get_cache_info()["butter"]
+    {'Hits': 2, 'Misses': 1, 'Size': 1, 'MaxSize': 128}
+
+    """
+    out = {}
+    for name, function in [
+        ("butter", _design_butter),
+        ("savgol", _design_savgol),
+    ]:
+        info = function.cache_info()
+        out[name] = {
+            "Hits": info.hits,
+            "Misses": info.misses,
+            "Size": info.currsize,
+            "MaxSize": info.maxsize,
+        }
+    return out
+
+
+def clear_cache() -> None:
+    """
+    Clear the cache of filter coefficients, and reset its statistics.
+
+    See Also
+    --------
+    ktk.filters.get_cache_info
+
+    """
+    _design_butter.cache_clear()
+    _design_savgol.cache_clear()
+
+
+def _fill_missing_samples(
+    time: np.ndarray, values: np.ndarray, is_missing: np.ndarray
+) -> np.ndarray:
+    """
+    Fill missing samples by linear interpolation.
+
+    This gives the same result as TimeSeries.fill_missing_samples(0), but the
+    interpolation is only evaluated on the missing samples.
+
+    Parameters
+    ----------
+    time
+        Array of shape (n,).
+    values
+        Array of shape (n, ...).
+    is_missing
+        Array of bool of shape (n,), as given by TimeSeries.isnan.
+
+    Returns
+    -------
+    np.ndarray
+        A copy of values, where the missing samples are interpolated, or
+        extrapolated from the two nearest samples before the first or after
+        the last visible sample. If there are less than 3 visible samples,
+        every sample is NaN.
+
+    """
+    visible = np.flatnonzero(~is_missing)
+    if visible.shape[0] < 3:
+        return np.full(
+            values.shape,
+            np.nan,
+            dtype=kineticstoolkit.config._get_float_dtype(values.dtype),
+        )
+
+    missing = np.flatnonzero(is_missing)
+
+    # Previous and next visible samples of each missing sample
+    i_after = np.clip(np.searchsorted(visible, missing), 1, len(visible) - 1)
+    before = visible[i_after - 1]
+    after = visible[i_after]
+
+    ratio = (time[missing] - time[before]) / (time[after] - time[before])
+    ratio = np.reshape(ratio, (-1,) + (1,) * (values.ndim - 1))
+
+    out = values.copy()
+    out[missing] = values[before] + ratio * (values[after] - values[before])
+    return out
+
+
+# Thread pools shared by every filter call, one per value of
+# ktk.config.n_jobs, created on first use. They are never shut down, so that
+# a thread that still uses a pool is not affected by a change of n_jobs.
+_executors = {}  # type: dict[int, ThreadPoolExecutor]
+_executors_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool shared by the filters.
+
+    The pool has ktk.config.n_jobs threads. It is kept between calls so that
+    its threads are not started again by each filter call, or by each key or
+    segment of a filter call.
+
+    """
+    n_jobs = kineticstoolkit.config._get_n_jobs()
+    with _executors_lock:
+        if n_jobs not in _executors:
+            _executors[n_jobs] = ThreadPoolExecutor(max_workers=n_jobs)
+        return _executors[n_jobs]
+
+
+def _apply_on_columns(
+    function: Callable[[np.ndarray], np.ndarray], values: np.ndarray
+) -> np.ndarray:
+    """
+    Apply a column-wise filter, splitting the columns between threads.
+
+    The number of threads is given by ktk.config.n_jobs. The threads are
+    those of the shared pool returned by _get_executor.
+
+    Parameters
+    ----------
+    function
+        A function that filters each column of an array of shape
+        (n_samples, n_columns) and returns an array of the same shape.
+    values
+        Array of shape (n_samples, n_columns).
+
+    Returns
+    -------
+    np.ndarray
+        The filtered array.
+
+    """
+    n_jobs = min(kineticstoolkit.config._get_n_jobs(), values.shape[1])
+    if n_jobs <= 1:
+        return function(values)
+
+    bounds = np.linspace(0, values.shape[1], n_jobs + 1).astype(int)
+    results = list(
+        _get_executor().map(
+            lambda i: function(values[:, bounds[i] : bounds[i + 1]]),
+            range(n_jobs),
+        )
+    )
+    return np.concatenate(results, axis=1)
+
+
+def _apply_on_keys(
+    function: Callable[[np.ndarray], np.ndarray],
+    ts: TimeSeries,
+    keys: list[str],
+) -> dict[str, np.ndarray]:
+    """
+    Apply a function on several data keys, splitting the keys between threads.
+
+    The number of threads is given by ktk.config.n_jobs. The threads are
+    those of the shared pool returned by _get_executor.
+
+    Parameters
+    ----------
+    function
+        A function that takes a data array and returns a new array.
+    ts
+        The TimeSeries that contains the data.
+    keys
+        The data keys to process.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The new array of each data key.
+
+    """
+    arrays = [ts.data._get_without_copy(key) for key in keys]
+    n_jobs = min(kineticstoolkit.config._get_n_jobs(), len(keys))
+    if n_jobs <= 1:
+        return {key: function(array) for key, array in zip(keys, arrays)}
+
+    return dict(zip(keys, _get_executor().map(function, arrays)))
+
+
+def _split_columns(
+    values: np.ndarray, shapes: list[tuple[int, ...]]
+) -> list[np.ndarray]:
+    """
+    Split an array of concatenated columns back into arrays of given shapes.
+
+    Parameters
+    ----------
+    values
+        Array of shape (n_samples, n_columns).
+    shapes
+        The shapes of the output arrays, which all begin with n_samples and
+        which sum to n_columns columns once reshaped to two dimensions.
 
+    Returns
+    -------
+    list[np.ndarray]
+        One new contiguous array per shape.
 
-def _interpolate(ts: TimeSeries, key: str) -> tuple[TimeSeries, np.ndarray]:
-    """Interpolate NaNs in a given data key in a TimeSeries."""
-    ts = ts.get_subset(key)
-    nan_index = ts.isnan(key)
+    """
+    out = []
+    start = 0
+    for shape in shapes:
+        n_columns = int(np.prod(shape[1:]))
+        array = np.empty(shape, dtype=values.dtype)
+        np.reshape(array, (shape[0], n_columns))[:] = values[
+            :, start : start + n_columns
+        ]
+        start += n_columns
+        out.append(array)
+    return out
+
+
+def _filter_keys(
+    ts: TimeSeries,
+    keys: list[str],
+    function: Callable[[np.ndarray], np.ndarray],
+) -> None:
+    """
+    Filter several data keys of a TimeSeries at once, in place.
+
+    The missing samples of every key are first interpolated linearly, then
+    the keys of same dtype are concatenated column-wise in one array of shape
+    (n_samples, n_columns) that is filtered by a single call to `function`
+    along the first axis. The result is split back into the original keys,
+    and the originally missing samples are set back to NaN.
 
-    if not np.all(~nan_index):
+    Parameters
+    ----------
+    ts
+        The TimeSeries to filter in place.
+    keys
+        The data keys to filter.
+    function
+        A function that filters each column of an array of shape
+        (n_samples, n_columns) and returns an array of the same shape.
+
+    """
+    filled = {}  # type: dict[str, np.ndarray]
+    nan_indexes = {}  # type: dict[str, np.ndarray]
+
+    for key in keys:
+        values = ts.data._get_without_copy(key)
+        nan_index = ts.isnan(key)
+        if np.any(nan_index):
+            nan_indexes[key] = nan_index
+            values = _fill_missing_samples(ts.time, values, nan_index)
+        filled[key] = values
+
+    if len(nan_indexes) > 0:
         # There were NaNs, issue a warning.
-        ts = ts.fill_missing_samples(0)
         warnings.warn(
             "NaNs found in the signal. They have been "
             "interpolated before filtering, and then put "
             "back in the filtered data."
         )
-    return (ts, nan_index)
+
+    # Group the keys by dtype
+    groups = {}  # type: dict[np.dtype, list[str]]
+    for key in keys:
+        groups.setdefault(filled[key].dtype, []).append(key)
+
+    n_samples = ts.time.shape[0]
+    for dtype, group_keys in groups.items():
+        filtered = _apply_on_columns(
+            function,
+            np.concatenate(
+                [
+                    np.reshape(filled[key], (n_samples, -1))
+                    for key in group_keys
+                ],
+                axis=1,
+            ),
+        ).astype(kineticstoolkit.config._get_float_dtype(dtype), copy=False)
+
+        # Split back the columns, and put back NaNs
+        for key, values in zip(
+            group_keys,
+            _split_columns(
+                filtered, [filled[key].shape for key in group_keys]
+            ),
+        ):
+            if key in nan_indexes:
+                values[nan_indexes[key]] = np.nan
+            ts.data._set_without_copy(key, values)
+
+
+def _filter_keys_by_segments(
+    ts: TimeSeries,
+    keys: list[str],
+    function: Callable[[np.ndarray], np.ndarray],
+    min_length: int,
+) -> None:
+    """
+    Filter each segment of non-missing samples of several data keys, in place.
+
+    Instead of interpolating the missing samples as in _filter_keys, each
+    segment of consecutive non-missing samples is filtered independently.
+    The keys that miss the same samples and that have the same dtype are
+    concatenated column-wise and filtered together. Every segment of every
+    group is then submitted at once to the shared thread pool, with the
+    columns split into blocks when there are less segments than threads.
+
+    Parameters
+    ----------
+    ts
+        The TimeSeries to filter in place.
+    keys
+        The data keys to filter.
+    function
+        A function that filters each column of an array of shape
+        (n_samples, n_columns) and returns an array of the same shape.
+    min_length
+        The minimal number of samples of a segment for it to be filtered.
+        Shorter segments are set to NaN.
+
+    """
+    if len(keys) == 0:
+        return
+
+    n_samples = ts.time.shape[0]
+    has_short_segments = False
+
+    # (values, filtered, start, stop) of every segment to filter
+    segments = []  # type: list[tuple[np.ndarray, np.ndarray, int, int]]
+    groups = []  # type: list[tuple[list[str], list[tuple], np.ndarray]]
+
+    for is_visible, group_keys in ts.get_subset(
+        keys
+    )._group_by_missing_samples():
+        arrays = [ts.data._get_without_copy(key) for key in group_keys]
+        values = np.concatenate(
+            [np.reshape(array, (n_samples, -1)) for array in arrays], axis=1
+        )
+        filtered = np.full(
+            values.shape,
+            np.nan,
+            dtype=kineticstoolkit.config._get_float_dtype(values.dtype),
+        )
+        groups.append(
+            (group_keys, [array.shape for array in arrays], filtered)
+        )
+
+        # Find the segments of consecutive non-missing samples
+        changes = np.diff(np.concatenate(([0], is_visible, [0])).astype(int))
+        starts = np.flatnonzero(changes == 1)
+        stops = np.flatnonzero(changes == -1)
+
+        for start, stop in zip(starts, stops):
+            if stop - start < min_length:
+                has_short_segments = True
+            else:
+                segments.append((values, filtered, start, stop))
+
+    # Filter every segment, each job writing to its own part of filtered.
+    def filter_block(job):
+        values, filtered, start, stop, first, last = job
+        filtered[start:stop, first:last] = function(
+            values[start:stop, first:last]
+        )
+
+    n_jobs = kineticstoolkit.config._get_n_jobs()
+    if n_jobs <= 1:
+        for values, filtered, start, stop in segments:
+            filter_block((values, filtered, start, stop, 0, values.shape[1]))
+    elif len(segments) > 0:
+        n_blocks = max(1, n_jobs // len(segments))
+        jobs = []
+        for values, filtered, start, stop in segments:
+            bounds = np.linspace(
+                0, values.shape[1], min(n_blocks, values.shape[1]) + 1
+            ).astype(int)
+            for first, last in zip(bounds[:-1], bounds[1:]):
+                jobs.append((values, filtered, start, stop, first, last))
+        # Consume the iterator to wait for every job and raise any error.
+        list(_get_executor().map(filter_block, jobs))
+
+    for group_keys, shapes, filtered in groups:
+        for key, values in zip(group_keys, _split_columns(filtered, shapes)):
+            ts.data._set_without_copy(key, values)
+
+    if has_short_segments:
+        warnings.warn(
+            "Some segments of consecutive non-missing samples were too short "
+            f"to be filtered (less than {min_length} samples). They have "
+            "been set to NaN in the filtered data."
+        )
+
+
+def _check_fc(fc: float | tuple[float, float]) -> float | tuple[float, float]:
+    """Check the cut-off frequency of a Butterworth filter."""
+    try:
+        check_param("fc", fc, float)
+    except TypeError:
+        try:
+            fc = cast(tuple[float, float], fc)
+            fc = cast(tuple[float, float], tuple(fc))
+            check_param("fc", fc, tuple, length=2, contents_type=float)
+        except TypeError:
+            raise TypeError("fc must be an integer or a tuple or 2 floats.")
+    return fc
+
+
+def _check_gaps(gaps: str) -> None:
+    """Check the gaps parameter of a filter."""
+    check_param("gaps", gaps, str)
+    if gaps not in ["interpolate", "split"]:
+        raise ValueError(
+            "gaps must be either 'interpolate' or 'split'. However, "
+            f"{gaps} was provided."
+        )
 
 
 def _validate_input(ts):
@@ -61,9 +589,12 @@ def _validate_input(ts):
     Check that time is not null, that sample rate is constant, and that
     time unit is s.
     """
+    validation_level = kineticstoolkit.config._get_validation_level()
+    if validation_level == "off":
+        return
     if ts.time.shape[0] == 0:
         raise ValueError("There is no data to filter.")
-    if np.isnan(ts.get_sample_rate()):
+    if validation_level == "strict" and np.isnan(ts.get_sample_rate()):
         raise ValueError("Sample rate must be constant.")
     try:
         assert ts.time_info["Unit"] == "s"
@@ -74,7 +605,13 @@ def _validate_input(ts):
 
 
 def savgol(
-    ts: TimeSeries, /, *, window_length: int, poly_order: int, deriv: int = 0
+    ts: TimeSeries,
+    /,
+    *,
+    window_length: int,
+    poly_order: int,
+    deriv: int = 0,
+    gaps: str = "interpolate",
 ) -> TimeSeries:
     """
     Apply a Savitzky-Golay filter on a TimeSeries.
@@ -82,7 +619,8 @@ def savgol(
     Filtering occurs on the first axis (time). If the TimeSeries contains
     missing samples, a warning is issued, missing samples are interpolated
     using a first-order interpolation before filtering, and then replaced by
-    np.nan in the filtered signal.
+    np.nan in the filtered signal. Use gaps="split" to filter each segment
+    between missing samples independently instead.
 
     Parameters
     ----------
@@ -97,6 +635,13 @@ def savgol(
     deriv
         Optional. The order of the derivative to compute. The default is 0,
         which means to filter the data without differentiating.
+    gaps
+        Optional. How missing samples are handled. If "interpolate", missing
+        samples are interpolated before filtering, then set back to NaN. If
+        "split", each segment of consecutive non-missing samples is filtered
+        independently, so that no interpolated value contaminates the
+        filtered data; segments shorter than window_length are set to NaN.
+        Default is "interpolate".
 
     Returns
     -------
@@ -118,44 +663,43 @@ def savgol(
     check_param("window_length", window_length, int)
     check_param("poly_order", poly_order, int)
     check_param("deriv", deriv, int)
+    _check_gaps(gaps)
     _validate_input(ts)
 
     tsout = ts.copy()
 
     delta = ts.time[1] - ts.time[0]
 
+    keys = []
     for key in tsout.data.keys():
-        (subts, nan_index) = _interpolate(tsout, key)
-
-        if np.sum(~nan_index) < poly_order + 1:
+        if np.sum(~tsout.isnan(key)) < poly_order + 1:
             # We can't do anything without more points
             warnings.warn(f"Not enough non-missing samples to filter {key}.")
-            continue
-
-        input_signal = subts.data[key]
-
-        # Filter
-        filtered_data = sgl.savgol_filter(
-            input_signal, window_length, poly_order, deriv, delta=delta, axis=0
-        )
+        else:
+            keys.append(key)
 
-        # Put back NaNs
-        filtered_data[nan_index] = np.nan
+    def function(values):
+        return _savgol_filter(values, window_length, poly_order, deriv, delta)
 
-        # Assign it to the output
-        tsout.data[key] = filtered_data
+    if gaps == "split":
+        _filter_keys_by_segments(tsout, keys, function, window_length)
+    else:
+        _filter_keys(tsout, keys, function)
 
     return tsout
 
 
-def smooth(ts: TimeSeries, /, window_length: int) -> TimeSeries:
+def smooth(
+    ts: TimeSeries, /, window_length: int, *, gaps: str = "interpolate"
+) -> TimeSeries:
     """
     Apply a smoothing (moving average) filter on a TimeSeries.
 
     Filtering occurs on the first axis (time). If the TimeSeries contains
     missing samples, a warning is issued, missing samples are interpolated
     using a first-order interpolation before filtering, and then replaced by
-    np.nan in the filtered signal.
+    np.nan in the filtered signal. Use gaps="split" to filter each segment
+    between missing samples independently instead.
 
     Parameters
     ----------
@@ -164,6 +708,13 @@ def smooth(ts: TimeSeries, /, window_length: int) -> TimeSeries:
     window_length
         The length of the filter window. window_length must be a positive
         odd integer less or equal than the length of the TimeSeries.
+    gaps
+        Optional. How missing samples are handled. If "interpolate", missing
+        samples are interpolated before filtering, then set back to NaN. If
+        "split", each segment of consecutive non-missing samples is filtered
+        independently, so that no interpolated value contaminates the
+        filtered data; segments shorter than window_length are set to NaN.
+        Default is "interpolate".
 
     Returns
     -------
@@ -183,9 +734,10 @@ def smooth(ts: TimeSeries, /, window_length: int) -> TimeSeries:
     """
     check_param("ts", ts, TimeSeries)
     check_param("window_length", window_length, int)
+    _check_gaps(gaps)
     _validate_input(ts)
 
-    tsout = savgol(ts, window_length=window_length, poly_order=0)
+    tsout = savgol(ts, window_length=window_length, poly_order=0, gaps=gaps)
     return tsout
 
 
@@ -197,6 +749,7 @@ def butter(
     order: int = 2,
     btype: str = "lowpass",
     filtfilt: bool = True,
+    gaps: str = "interpolate",
 ) -> TimeSeries:
     """
     Apply a Butterworth filter to a TimeSeries.
@@ -204,7 +757,8 @@ def butter(
     Filtering occurs on the first axis (time). If the TimeSeries contains
     missing samples, a warning is issued, missing samples are interpolated
     using a first-order interpolation before filtering, and then replaced by
-    np.nan in the filtered signal.
+    np.nan in the filtered signal. Use gaps="split" to filter each segment
+    between missing samples independently instead.
 
     Parameters
     ----------
@@ -223,6 +777,14 @@ def butter(
         Optional. If True, the filter is applied two times in reverse direction
         to eliminate time lag. If False, the filter is applied only in forward
         direction. Default is True.
+    gaps
+        Optional. How missing samples are handled. If "interpolate", missing
+        samples are interpolated before filtering, then set back to NaN. If
+        "split", each segment of consecutive non-missing samples is filtered
+        independently, so that no interpolated value contaminates the
+        filtered data; segments that are too short for
+        scipy.signal.sosfiltfilt (when filtfilt is True) are set to NaN.
+        Default is "interpolate".
 
     Returns
     -------
@@ -237,18 +799,11 @@ def butter(
 
     """
     check_param("ts", ts, TimeSeries)
-    try:
-        check_param("fc", fc, float)
-    except TypeError:
-        try:
-            fc = cast(tuple[float, float], fc)
-            fc = cast(tuple[float, float], tuple(fc))
-            check_param("fc", fc, tuple, length=2, contents_type=float)
-        except TypeError:
-            raise TypeError("fc must be an integer or a tuple or 2 floats.")
+    fc = _check_fc(fc)
     check_param("order", order, int)
     check_param("btype", btype, str)
     check_param("filtfilt", filtfilt, bool)
+    _check_gaps(gaps)
     _validate_input(ts)
 
     ts = ts.copy()
@@ -258,26 +813,271 @@ def butter(
     if np.isnan(fs):
         raise ValueError("The TimeSeries' time vector must not contain NaNs.")
 
-    sos = sgl.butter(order, fc, btype, analog=False, output="sos", fs=fs)
+    sos = _design_butter(order, fc, btype, fs)
 
-    for data in ts.data:
-        (subts, missing) = _interpolate(ts, data)
+    if filtfilt is True:
 
-        # Filter
-        if filtfilt is True:
-            subts.data[data] = sgl.sosfiltfilt(sos, subts.data[data], axis=0)
-        else:
-            subts.data[data] = sgl.sosfilt(sos, subts.data[data], axis=0)
+        def function(values):
+            return sgl.sosfiltfilt(sos, values, axis=0)
+
+        # Minimal length accepted by sosfiltfilt with its default padding
+        n_taps = 2 * sos.shape[0] + 1
+        n_taps -= min(np.sum(sos[:, 2] == 0), np.sum(sos[:, 5] == 0))
+        min_length = 3 * int(n_taps) + 1
+
+    else:
+
+        def function(values):
+            return sgl.sosfilt(sos, values, axis=0)
 
-        # Put back nans
-        subts.data[data][missing] = np.nan
+        min_length = 1
 
-        # Put back in main TimeSeries
-        ts.data[data] = subts.data[data]
+    if gaps == "split":
+        _filter_keys_by_segments(ts, list(ts.data), function, min_length)
+    else:
+        _filter_keys(ts, list(ts.data), function)
 
     return ts
 
 
+class StreamingButter:
+    """
+    Causal Butterworth filter for TimeSeries that arrive in chunks.
+
+    Each call to `filter` receives the next chunk of a TimeSeries (e.g., from
+    an acquisition device) and returns this chunk filtered. The state of the
+    filter is kept for each data key between calls, so that filtering
+    successive chunks gives exactly the same result as filtering the whole
+    TimeSeries at once with a new StreamingButter, without transients at the
+    chunks' boundaries.
+
+    Parameters
+    ----------
+    fc
+        Cut-off frequency in Hz. This is a float for single-frequency filters
+        (lowpass, highpass), or a tuple of two floats (e.g., (10., 13.)
+        for two-frequency filters (bandpass, bandstop)).
+    order
+        Optional. Order of the filter. Default is 2.
+    btype
+        Optional. Can be either "lowpass", "highpass", "bandpass" or
+        "bandstop". Default is "lowpass".
+
+    See Also
+    --------
+    ktk.filters.butter
+
+    Notes
+    -----
+    - The sample rate is obtained from the first chunk, which must have at
+      least two samples. Every following chunk must have the same sample
+      rate, and its first sample must come one sample period after the last
+      sample of the previous chunk.
+
+    - Contrary to `ktk.filters.butter`, the filter starts in the steady
+      state of the first sample of each data key, instead of starting
+      from zero. This removes the transient at the beginning of the stream.
+
+    - Since future samples are not known, missing samples cannot be
+      interpolated as in `ktk.filters.butter`. Instead, the last non-missing
+      sample is repeated until the next non-missing sample, and the missing
+      samples are set back to NaN in the filtered chunk.
+
+    Example
+    -------
+    >>> ts = ktk.TimeSeries(time=np.arange(100) / 100)
+    >>> ts = ts.add_data("signal", np.sin(np.arange(100)))
+
+    >>> stream = ktk.filters.StreamingButter(10.0)
+    >>> chunk1 = stream.filter(ts.get_ts_before_index(49, inclusive=True))
+    >>> chunk2 = stream.filter(ts.get_ts_after_index(50, inclusive=True))
+
+    >>> whole = ktk.filters.StreamingButter(10.0).filter(ts)
+    >>> np.allclose(chunk2.data["signal"], whole.data["signal"][50:])
+    True
+
+    """
+
+    def __init__(
+        self,
+        fc: float | tuple[float, float],
+        *,
+        order: int = 2,
+        btype: str = "lowpass",
+    ):
+        self._fc = _check_fc(fc)
+        check_param("order", order, int)
+        check_param("btype", btype, str)
+        self._order = order
+        self._btype = btype
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the sample rate and the state of every data key."""
+        self._sos = None  # type: np.ndarray | None
+        self._sample_rate = np.nan
+        self._last_time = -np.inf
+        # Filter state (zi) of each data key, and last non-missing sample.
+        self._states = {}  # type: dict[str, np.ndarray]
+        self._last_samples = {}  # type: dict[str, np.ndarray]
+
+    def filter(self, ts: TimeSeries, /) -> TimeSeries:
+        """
+        Filter the next chunk of the TimeSeries.
+
+        Parameters
+        ----------
+        ts
+            The next chunk of the TimeSeries.
+
+        Returns
+        -------
+        TimeSeries
+            A copy of the chunk, which each data being filtered.
+
+        Raises
+        ------
+        ValueError
+            If the first chunk has less than two samples, if the sample rate
+            changes between chunks, or if the chunk does not start one sample
+            period after the end of the previous chunk.
+
+        """
+        check_param("ts", ts, TimeSeries)
+        ts._check_well_shaped()
+        ts = ts.copy()
+        if ts.time.shape[0] == 0:
+            return ts
+
+        # Design the filter on the first chunk, then check the sample rate
+        sos = self._sos
+        sample_rate = self._sample_rate
+        if ts.time.shape[0] >= 2:
+            chunk_sample_rate = ts.get_sample_rate()
+            if np.isnan(chunk_sample_rate):
+                raise ValueError("Sample rate must be constant.")
+            if sos is None:
+                sample_rate = chunk_sample_rate
+                sos = _design_butter(
+                    self._order, self._fc, self._btype, sample_rate
+                )
+            elif not np.isclose(chunk_sample_rate, sample_rate):
+                raise ValueError(
+                    f"The sample rate of this chunk ({chunk_sample_rate} Hz) "
+                    "is different from the sample rate of the first chunk "
+                    f"({sample_rate} Hz)."
+                )
+        if sos is None:
+            raise ValueError(
+                "The first chunk must have at least two samples to find the "
+                "sample rate."
+            )
+        if self._sos is not None:
+            expected_time = self._last_time + 1 / sample_rate
+            if not np.isclose(
+                ts.time[0], expected_time, rtol=0, atol=0.01 / sample_rate
+            ):
+                raise ValueError(
+                    "Each chunk must start one sample period after the end of "
+                    f"the previous chunk, i.e., at {expected_time} s. "
+                    f"However, this chunk starts at {ts.time[0]} s."
+                )
+
+        # Filter every key before updating the state of the stream, so that
+        # a chunk that fails can be filtered again.
+        has_nans = False
+        filtered = {}  # type: dict[str, np.ndarray]
+        states = {}  # type: dict[str, tuple[np.ndarray, np.ndarray]]
+        for key in ts.data:
+            values = ts.data._get_without_copy(key)
+            is_missing = ts.isnan(key)
+            has_nans = has_nans or bool(np.any(is_missing))
+            filtered[key], state = self._filter_values(
+                sos, key, values, is_missing
+            )
+            if state is not None:
+                states[key] = state
+
+        self._sos = sos
+        self._sample_rate = sample_rate
+        self._last_time = ts.time[-1]
+        for key, (zi, last_sample) in states.items():
+            self._states[key] = zi
+            self._last_samples[key] = last_sample
+        for key, values in filtered.items():
+            ts.data._set_without_copy(key, values)
+
+        if has_nans:
+            warnings.warn(
+                "NaNs found in the signal. The last non-missing samples have "
+                "been repeated before filtering, and the missing samples "
+                "have been put back in the filtered data."
+            )
+
+        return ts
+
+    def _filter_values(
+        self,
+        sos: np.ndarray,
+        key: str,
+        values: np.ndarray,
+        is_missing: np.ndarray,
+    ) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray] | None]:
+        """
+        Filter the next chunk of a data key, without updating its state.
+
+        Returns
+        -------
+        tuple[np.ndarray, tuple[np.ndarray, np.ndarray] | None]
+            The filtered values, and the new (zi, last_sample) state of this
+            key, or None if the key has no state yet.
+
+        """
+        out = np.full(
+            values.shape,
+            np.nan,
+            dtype=kineticstoolkit.config._get_float_dtype(values.dtype),
+        )
+
+        # Index of the last non-missing sample at each sample, or -1 if the
+        # chunk has not had any non-missing sample yet.
+        last_index = np.where(is_missing, -1, np.arange(values.shape[0]))
+        last_index = np.maximum.accumulate(last_index)
+
+        # Start the filter in the steady state of the first non-missing
+        # sample of the stream.
+        start = 0
+        if key in self._states:
+            zi = self._states[key]
+            last_sample = self._last_samples[key]
+        else:
+            if np.all(is_missing):
+                return (out, None)
+            start = int(np.argmax(~is_missing))
+            zi = sgl.sosfilt_zi(sos)
+            zi = (
+                np.reshape(zi, zi.shape + (1,) * (values.ndim - 1))
+                * values[start]
+            )
+            last_sample = values[start]
+
+        # Repeat the last non-missing samples over the missing samples
+        filled = values[start:].copy()
+        last_index = last_index[start:]
+        is_missing = is_missing[start:]
+        filled[is_missing & (last_index >= 0)] = values[
+            last_index[is_missing & (last_index >= 0)]
+        ]
+        filled[last_index < 0] = last_sample
+        if not np.all(is_missing):
+            last_sample = values[last_index[-1]]
+
+        filtered, zi = sgl.sosfilt(sos, filled, axis=0, zi=zi)
+        filtered[is_missing] = np.nan
+        out[start:] = filtered
+        return (out, (zi, last_sample))
+
+
 def deriv(ts: TimeSeries, /, n: int = 1) -> TimeSeries:
     """
     Calculate the nth numerical derivative.
@@ -342,11 +1142,17 @@ def deriv(ts: TimeSeries, /, n: int = 1) -> TimeSeries:
     for i in range(n):
         out_ts.time = (out_ts.time[1:] + out_ts.time[0:-1]) / 2
 
-    for key in ts.data:
-        out_ts.data[key] = (
-            np.diff(ts.data[key], n=n, axis=0) / (ts.time[1] - ts.time[0]) ** n
+    period = ts.time[1] - ts.time[0]
+
+    def derive(values: np.ndarray) -> np.ndarray:
+        return (np.diff(values, n=n, axis=0) / period**n).astype(
+            kineticstoolkit.config._get_float_dtype(values.dtype), copy=False
         )
 
+    derived = _apply_on_keys(derive, ts, list(ts.data))
+    for key in derived:
+        out_ts.data[key] = derived[key]
+
     return out_ts
 
 
@@ -376,11 +1182,15 @@ def median(ts: TimeSeries, /, window_length: int = 3) -> TimeSeries:
     check_param("ts", ts, TimeSeries)
     check_param("window_length", window_length, int)
 
-    out_ts = ts.copy()
-    for key in ts.data:
-        window_shape = [1 for i in range(len(ts.data[key].shape))]
+    def filter_values(values: np.ndarray) -> np.ndarray:
+        window_shape = [1 for i in range(len(values.shape))]
         window_shape[0] = window_length
-        out_ts.data[key] = ndi.median_filter(ts.data[key], size=window_shape)
+        return ndi.median_filter(values, size=window_shape)
+
+    out_ts = ts.copy()
+    filtered = _apply_on_keys(filter_values, ts, list(ts.data))
+    for key in filtered:
+        out_ts.data[key] = filtered[key]
 
     return out_ts
 
@@ -31,6 +31,7 @@ __license__ = "Apache 2.0"
 
 import numpy as np
 import scipy.spatial.transform as transform
+import kineticstoolkit.config
 import kineticstoolkit.external.icp as icp
 from kineticstoolkit.typing_ import ArrayLike, check_param
 
@@ -100,7 +101,12 @@ def matmul(op1: ArrayLike, op2: ArrayLike, /) -> np.ndarray:
 
     # Get the expected shape by performing the first multiplication
     temp = perform_mul(op1_array[0], op2_array[0])
-    result = np.empty((n_samples, *temp.shape))
+    result = np.empty(
+        (n_samples, *np.shape(temp)),
+        dtype=kineticstoolkit.config._get_float_dtype(
+            op1_array.dtype, op2_array.dtype
+        ),
+    )
 
     # Perform the multiplication
     for i_sample in range(n_samples):
@@ -151,7 +157,10 @@ def inv(matrix_series: ArrayLike, /) -> np.ndarray:
     invT = -matmul(invR, matrix_series[:, 0:3, 3])
 
     # output
-    out = np.zeros(matrix_series.shape)
+    out = np.zeros(
+        matrix_series.shape,
+        dtype=kineticstoolkit.config._get_float_dtype(matrix_series.dtype),
+    )
     out[:, 0:3, 0:3] = invR
     out[:, 0:3, 3] = invT
     out[:, 3, 3] = 1
@@ -270,6 +279,19 @@ def create_transforms(
     else:
         scales_array = np.array(scales)
 
+    # Output dtype, from the provided inputs only
+    dtype = kineticstoolkit.config._get_float_dtype(
+        *[
+            array.dtype
+            for (array, provided) in [
+                (translations_array, translations is not None),
+                (angles_array, angles is not None),
+                (scales_array, scales is not None),
+            ]
+            if provided
+        ]
+    )
+
     # Convert scales to a series of scaling matrices
     temp = np.zeros((scales_array.shape[0], 4, 4))
     temp[:, 0, 0] = scales_array
@@ -304,7 +326,7 @@ def create_transforms(
     T[:, 3, 3] = 1
 
     # Return the scaling + transform
-    return T @ scales_array
+    return (T @ scales_array).astype(dtype, copy=False)
 
 
 def rotate(
@@ -810,6 +832,8 @@ def _check_no_skewed_rotation(series: np.ndarray, param_name) -> None:
         If at least one skewed rotation matrix is found in the provided series.
 
     """
+    if kineticstoolkit.config._get_validation_level() != "strict":
+        return
     if (
         len(series.shape) == 3
         and series.shape[1] == 4
@@ -857,7 +881,12 @@ def register_points(
     n_samples = global_points.shape[0]
 
     # Prealloc the transformation matrix
-    T = np.zeros((n_samples, 4, 4))
+    T = np.zeros(
+        (n_samples, 4, 4),
+        dtype=kineticstoolkit.config._get_float_dtype(
+            global_points.dtype, local_points.dtype
+        ),
+    )
     T[:, 3, 3] = np.ones(n_samples)
 
     for i_sample in range(n_samples):
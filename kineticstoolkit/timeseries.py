@@ -32,6 +32,7 @@ __license__ = "Apache 2.0"
 
 
 import kineticstoolkit._repr
+import kineticstoolkit.config
 from kineticstoolkit.decorators import deprecated
 from kineticstoolkit.exceptions import (
     TimeSeriesRangeError,
@@ -47,11 +48,14 @@ import pandas as pd
 import limitedinteraction as li
 from dataclasses import dataclass
 from kineticstoolkit.typing_ import ArrayLike, check_param
-from typing import Any, cast
+from typing import Any, Callable, cast
 from numbers import Real
 
+import sys
+import json
 import warnings
-from ast import literal_eval
+import re
+from bisect import bisect_left
 from copy import deepcopy
 
 import kineticstoolkit as ktk  # For doctests
@@ -61,7 +65,21 @@ WINDOW_PLACEMENT = {"top": 50, "right": 0}
 
 
 class TimeSeriesEventList(list):
-    """Event list that ensures every element is a TimeSeriesEvent."""
+    """
+    Event list that ensures every element is a TimeSeriesEvent.
+
+    The list of TimeSeriesEvent remains the reference storage. Derived
+    structures are cached on demand to speed up operations on many events:
+
+    - a columnar view of the events (float64 times, integer name codes and
+      the list of unique names), used for vectorized sorting, trimming and
+      duplicate removal;
+    - an index of the events by name, sorted by time, so that looking for a
+      given occurrence of an event does not need to scan the whole list.
+
+    These caches are dropped after the list or any TimeSeriesEvent has been
+    modified.
+    """
 
     def __init__(self, source: list = []):
         """Initialize the class instance using a source list."""
@@ -73,13 +91,14 @@ class TimeSeriesEventList(list):
         """Cast the value to a TimeSeriesEvent."""
         check_param("index", index, int)
         try:
-            event = TimeSeriesEvent(time=value.time, name=value.name)
+            event = TimeSeriesEvent._fast_new(value.time, value.name)
         except AttributeError:
             raise AttributeError(
                 f"The provided value {value} cannot be interpreted as a "
                 "TimeSeriesEvent, because it does not have `time` and `name` "
                 "attributes."
             )
+        self._invalidate_cache()
         super(TimeSeriesEventList, self).__setitem__(index, event)
 
     def append(self, value):
@@ -93,12 +112,214 @@ class TimeSeriesEventList(list):
             self.append(value)  # Calls append that calls __setitem__ that
             # does the check.
 
+    def insert(self, index, value):
+        """Ensure the inserted value is a TimeSeriesEvent."""
+        event = TimeSeriesEventList([value])[0]  # Does the check
+        self._invalidate_cache()
+        super(TimeSeriesEventList, self).insert(index, event)
+
+    def __iadd__(self, values):
+        """Ensure the added values are TimeSeriesEvent."""
+        self.extend(values)
+        return self
+
+    def __imul__(self, value):
+        """Invalidate the cache."""
+        self._invalidate_cache()
+        return super(TimeSeriesEventList, self).__imul__(value)
+
+    def __delitem__(self, index):
+        """Invalidate the cache."""
+        self._invalidate_cache()
+        super(TimeSeriesEventList, self).__delitem__(index)
+
+    def pop(self, index=-1):
+        """Invalidate the cache."""
+        self._invalidate_cache()
+        return super(TimeSeriesEventList, self).pop(index)
+
+    def remove(self, value):
+        """Invalidate the cache."""
+        self._invalidate_cache()
+        super(TimeSeriesEventList, self).remove(value)
+
+    def clear(self):
+        """Invalidate the cache."""
+        self._invalidate_cache()
+        super(TimeSeriesEventList, self).clear()
+
+    def sort(self, *args, **kwargs):
+        """Invalidate the cache."""
+        self._invalidate_cache()
+        super(TimeSeriesEventList, self).sort(*args, **kwargs)
+
+    def reverse(self):
+        """Invalidate the cache."""
+        self._invalidate_cache()
+        super(TimeSeriesEventList, self).reverse()
+
+    def __deepcopy__(self, memo):
+        """Copy the events without going through the generic deepcopy."""
+        out = TimeSeriesEventList()
+        memo[id(self)] = out
+        super(TimeSeriesEventList, out).extend(
+            [
+                TimeSeriesEvent._fast_new(event.time, event.name)
+                for event in self
+            ]
+        )
+        try:
+            cache, modification_count = self._cache
+            out._cache = (cache.copy(), modification_count)
+        except AttributeError:
+            pass
+        return out
+
+    def __reduce__(self):
+        """Pickle the events as columns instead of one object per event."""
+        return (
+            TimeSeriesEventList._from_columns,
+            ([event.time for event in self], [event.name for event in self]),
+        )
+
+    @classmethod
+    def _from_columns(cls, times: list, names: list[str]):
+        """Create a TimeSeriesEventList from lists of times and names."""
+        out = cls()
+        out._extend_from_columns(times, names)
+        return out
+
+    def _extend_from_columns(self, times: list, names: list[str]) -> None:
+        """Append events from lists of times and names."""
+        self._invalidate_cache()
+        super(TimeSeriesEventList, self).extend(
+            [
+                TimeSeriesEvent._fast_new(time, name)
+                for time, name in zip(times, names)
+            ]
+        )
+
+    def _invalidate_cache(self) -> None:
+        """Drop the cached structures so that they are rebuilt on next use."""
+        self.__dict__.pop("_cache", None)
+
+    def _get_cache(self) -> dict[str, Any]:
+        """Get the cache dict, emptied if any event has been modified."""
+        try:
+            cache, modification_count = self._cache
+            if modification_count == TimeSeriesEvent._modification_count:
+                return cache
+        except AttributeError:
+            pass
+        cache = {}
+        self._cache = (cache, TimeSeriesEvent._modification_count)
+        return cache
+
+    def _get_columns(self) -> tuple[np.ndarray, np.ndarray, list[str]]:
+        """
+        Get a columnar view of the events.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, list[str]]
+            The events times as a float64 array of length n, the events name
+            codes as an int array of length n, and the names that correspond
+            to each code. These must not be modified.
+
+        """
+        cache = self._get_cache()
+        if "columns" not in cache:
+            codes_by_name = {}  # type: dict[str, int]
+            codes = np.fromiter(
+                (
+                    codes_by_name.setdefault(event.name, len(codes_by_name))
+                    for event in self
+                ),
+                dtype=int,
+                count=len(self),
+            )
+            times = np.fromiter(
+                (event.time for event in self), dtype=float, count=len(self)
+            )
+            cache["columns"] = (times, codes, list(codes_by_name))
+        return cache["columns"]
+
+    def _get_name_index(self) -> dict[str, list[int]]:
+        """
+        Get the index of every event name.
+
+        Returns
+        -------
+        dict[str, list[int]]
+            For each event name, the indexes of its occurrences in the list,
+            sorted by time. This dict must not be modified.
+
+        """
+        cache = self._get_cache()
+        if "name_index" not in cache:
+            times, codes, names = self._get_columns()
+            # Sort by code then by time. lexsort is stable, so that events
+            # of same name and time remain in list order.
+            order = np.lexsort((times, codes))
+            splits = np.searchsorted(codes[order], np.arange(1, len(names)))
+            cache["name_index"] = {
+                name: indexes.tolist()
+                for name, indexes in zip(names, np.split(order, splits))
+            }
+        return cache["name_index"]
+
+    def _select(self, indexes: ArrayLike) -> None:
+        """
+        Keep only the events at the given indexes, in the given order.
+
+        Parameters
+        ----------
+        indexes
+            Indexes of the events to keep, e.g., from a vectorized sort or
+            mask on the columns returned by _get_columns.
+
+        """
+        indexes = np.asarray(indexes, dtype=int)
+        times, codes, names = self._get_columns()
+        events = [list.__getitem__(self, i) for i in indexes.tolist()]
+        self._invalidate_cache()
+        super(TimeSeriesEventList, self).__setitem__(slice(None), events)
+        self._get_cache()["columns"] = (times[indexes], codes[indexes], names)
+
 
 class TimeSeriesDataDict(dict):
-    """Data dictionary that checks sizes and converts to NumPy arrays."""
+    """
+    Data dictionary that checks sizes and converts to NumPy arrays.
+
+    Copies of a TimeSeriesDataDict (using deepcopy, dict.copy or
+    TimeSeries.copy) share their arrays with the original dictionary until
+    these arrays are accessed. An array that is still shared is copied the
+    first time it is read from either dictionary (e.g., `data["Forces"]`,
+    `data.items()`), so that modifying it in place never affects the other
+    dictionary. Replacing or removing a shared array does not copy it. This
+    sharing relies on CPython's reference counts; on other implementations,
+    the arrays are copied immediately.
+
+    """
+
+    def __new__(cls, *args, **kwargs):
+        """Create the instance and its register of shared arrays."""
+        # This is done here and not in __init__, because unpickling calls
+        # __setitem__ without calling __init__ (e.g., for TimeSeries pickled
+        # by versions of Kinetics Toolkit that did not share arrays).
+        out = super(TimeSeriesDataDict, cls).__new__(cls, *args, **kwargs)
+
+        # Arrays shared with other TimeSeriesDataDicts. Each key is mapped to
+        # a one-element list that counts the dicts that share this array.
+        out._shared = {}  # type: dict[str, list[int]]
+        return out
 
     def __init__(self, source: dict = {}):
         """Initialize the class instance using a source dictionary."""
+        if isinstance(source, TimeSeriesDataDict):
+            source._share_with(self)
+            return
+
         check_param("source", source, dict, key_type=str)
         for key in source:
             self[key] = source[key]
@@ -106,7 +327,8 @@ class TimeSeriesDataDict(dict):
     def __setitem__(self, key, value):
         """Cast the added data as a NumPy array."""
         check_param("key", key, str)
-        to_set = np.array(value, copy=True)
+        to_set = np.asarray(value)
+        to_set = np.array(to_set, dtype=_get_stored_dtype(to_set), copy=True)
 
         if len(to_set.shape) == 0:
             raise AttributeError(
@@ -114,8 +336,609 @@ class TimeSeriesDataDict(dict):
                 f"{value} was provided."
             )
 
+        self._release(key)
         super(TimeSeriesDataDict, self).__setitem__(key, to_set)
 
+    def _set_without_copy(self, key, value):
+        """Set an array that is already a NumPy array, without copying it."""
+        self._release(key)
+        super(TimeSeriesDataDict, self).__setitem__(key, value)
+
+    def _get_without_copy(self, key):
+        """Get an array for reading only, without unsharing it."""
+        return super(TimeSeriesDataDict, self).__getitem__(key)
+
+    def _rename(self, old_key, new_key):
+        """Move an array to a new key, without unsharing it."""
+        check_param("new_key", new_key, str)
+        value = super(TimeSeriesDataDict, self).pop(old_key)
+        share_count = self._shared.pop(old_key, None)
+        self._release(new_key)
+        super(TimeSeriesDataDict, self).__setitem__(new_key, value)
+        if share_count is not None:
+            self._shared[new_key] = share_count
+
+    # %% Copy-on-access
+
+    def _share_with(self, other: TimeSeriesDataDict) -> None:
+        """Share every array with another TimeSeriesDataDict."""
+        for key in super(TimeSeriesDataDict, self).keys():
+            other._release(key)
+            share_count = self._shared.get(key, [1])
+
+            # An array that is referenced outside the dicts that share it
+            # (e.g., by a variable or a view) may be modified in place at any
+            # time: copy it now. Without reliable reference counts, copy
+            # every array.
+            if (
+                _SINGLE_OWNER_REFCOUNT is None
+                or _get_dict_value_refcount(self, key)
+                > _SINGLE_OWNER_REFCOUNT + share_count[0] - 1
+            ):
+                dict.__setitem__(
+                    other, key, np.array(self._get_without_copy(key))
+                )
+                continue
+
+            share_count[0] += 1
+            self._shared[key] = share_count
+            dict.__setitem__(other, key, self._get_without_copy(key))
+            other._shared[key] = share_count
+
+    def _release(self, key) -> None:
+        """Stop sharing an array that is about to be replaced or removed."""
+        share_count = self._shared.pop(key, None)
+        if share_count is not None:
+            share_count[0] -= 1
+
+    def _unshare(self, key) -> None:
+        """Copy an array if it is still shared with another dict."""
+        share_count = self._shared.pop(key, None)
+        if share_count is not None:
+            share_count[0] -= 1
+            # Once unshared, an array that is still referenced elsewhere
+            # (e.g., by a view from TimeSeries.get_ts_between_times) could
+            # have been obtained through another dict: copy it too.
+            if (
+                share_count[0] > 0
+                or _get_dict_value_refcount(self, key)
+                > cast(int, _SINGLE_OWNER_REFCOUNT)
+            ):
+                super(TimeSeriesDataDict, self).__setitem__(
+                    key, np.array(self._get_without_copy(key), copy=True)
+                )
+
+    def _unshare_all(self) -> None:
+        """Copy every array that is still shared with another dict."""
+        for key in list(self._shared):
+            self._unshare(key)
+
+    def __del__(self):
+        """Release the shared arrays."""
+        try:
+            for share_count in self._shared.values():
+                share_count[0] -= 1
+        except AttributeError:
+            pass
+
+    def __getitem__(self, key):
+        """Get an array, copying it first if it is shared."""
+        if key in self._shared:
+            self._unshare(key)
+        return super(TimeSeriesDataDict, self).__getitem__(key)
+
+    def __iter__(self):
+        """Iterate over keys."""
+        # Overriding __iter__ ensures that dict(data) and {**data} read the
+        # arrays through __getitem__ and therefore do not alias them.
+        return super(TimeSeriesDataDict, self).__iter__()
+
+    def __delitem__(self, key):
+        """Remove an array."""
+        super(TimeSeriesDataDict, self).__delitem__(key)
+        self._release(key)
+
+    def get(self, key, default=None):
+        """Get an array, or default if the key is not in the dict."""
+        return self[key] if key in self else default
+
+    def values(self):
+        """Return a view of the arrays."""
+        self._unshare_all()
+        return super(TimeSeriesDataDict, self).values()
+
+    def items(self):
+        """Return a view of the (key, array) pairs."""
+        self._unshare_all()
+        return super(TimeSeriesDataDict, self).items()
+
+    def pop(self, key, *args):
+        """Remove an array and return it."""
+        if key in self._shared:
+            self._unshare(key)
+        return super(TimeSeriesDataDict, self).pop(key, *args)
+
+    def popitem(self):
+        """Remove the last inserted array and return it with its key."""
+        if len(self) > 0:
+            key = next(reversed(self.keys()))
+            return (key, self.pop(key))
+        return super(TimeSeriesDataDict, self).popitem()
+
+    def setdefault(self, key, default=None):
+        """Get an array, or set it to default if the key is not in the dict."""
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        """Add or replace arrays, casting them as NumPy arrays."""
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        """Remove every array."""
+        for key in list(self._shared):
+            self._release(key)
+        super(TimeSeriesDataDict, self).clear()
+
+    def copy(self):
+        """Return a copy that shares the arrays until they are accessed."""
+        return TimeSeriesDataDict(self)
+
+    def __copy__(self):
+        """Return a copy that shares the arrays until they are accessed."""
+        return TimeSeriesDataDict(self)
+
+    def __deepcopy__(self, memo):
+        """Return a copy that shares the arrays until they are accessed."""
+        out = TimeSeriesDataDict(self)
+        memo[id(self)] = out
+        return out
+
+    def __reduce__(self):
+        """Pickle the arrays without unsharing them."""
+        return (
+            TimeSeriesDataDict,
+            (dict(super(TimeSeriesDataDict, self).items()),),
+        )
+
+
+def _get_stored_dtype(values: np.ndarray) -> np.dtype:
+    """Get the dtype of an array once assigned to a TimeSeries' data."""
+    float_dtype = kineticstoolkit.config.float_dtype
+    if float_dtype is not None and np.issubdtype(values.dtype, np.floating):
+        return kineticstoolkit.config._check_float_dtype(float_dtype)
+    return values.dtype
+
+
+def _get_dict_value_refcount(the_dict: dict, key: Any) -> int:
+    """Return the reference count of a value stored in a dict."""
+    return sys.getrefcount(dict.__getitem__(the_dict, key))
+
+
+# Reference count of an array that is referenced by a single dict, measured
+# rather than hard-coded since it depends on the CPython version. Sharing
+# arrays between TimeSeriesDataDicts relies on this count to know whether an
+# array is referenced elsewhere. Other implementations (e.g., PyPy) do not
+# use reference counting, in which case this is None and arrays are never
+# shared.
+_SINGLE_OWNER_REFCOUNT = (
+    _get_dict_value_refcount({"": np.empty(0)}, "")
+    if sys.implementation.name == "cpython"
+    else None
+)  # type: int | None
+
+
+def _get_runs_mask(
+    starts: np.ndarray, lengths: np.ndarray, n: int
+) -> np.ndarray:
+    """
+    Build a boolean array that is True over given runs.
+
+    This is the inverse of TimeSeries.get_missing_samples.
+
+    Parameters
+    ----------
+    starts
+        Int array of shape (n_runs,), with the start index of each run.
+    lengths
+        Int array of shape (n_runs,), with the length of each run.
+    n
+        The length of the output array.
+
+    Returns
+    -------
+    np.ndarray
+        Array of bool of shape (n,).
+
+    """
+    # Cumulate +1 at each start and -1 at each stop.
+    changes = np.zeros(n + 1, dtype=int)
+    np.add.at(changes, starts, 1)
+    np.add.at(changes, starts + lengths, -1)
+    return np.cumsum(changes[:-1]) > 0
+
+
+def _isnan_samples(values: np.ndarray) -> np.ndarray:
+    """
+    Tell which samples of an array contain at least one nan.
+
+    Parameters
+    ----------
+    values
+        Array of shape (n, ...).
+
+    Returns
+    -------
+    np.ndarray
+        Array of bool of shape (n,).
+
+    """
+    # Reduce the dimension of values while keeping the time dimension.
+    while len(values.shape) > 1:
+        values = np.sum(values, 1)  # type: ignore
+    return np.isnan(values)
+
+
+# Column names with bracketed indices in DataFrames, e.g., "Forces[0]" or
+# "Rotation[0, 1]". Group 1 is the data key, group 2 is the indices.
+_BRACKETED_COLUMN = re.compile(r"^(.*)\[\s*(\d+(?:\s*,\s*\d+)*)\s*\]$")
+
+
+# Schema metadata keys used by TimeSeries.to_arrow and TimeSeries.from_arrow
+_ARROW_TIME_COLUMN = "time"
+_ARROW_METADATA_KEYS = {
+    "time_info": b"ktk.time_info",
+    "data_info": b"ktk.data_info",
+    "events": b"ktk.events",
+}
+
+
+def _import_pyarrow():
+    """Import the optional module pyarrow."""
+    try:
+        import pyarrow
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "The optional module pyarrow is not installed, but it is required "
+            "to use this function. Please install it using: "
+            "conda install -c conda-forge pyarrow"
+        )
+    return pyarrow
+
+
+def _to_json(value: Any) -> str:
+    """
+    Serialize metadata to JSON, converting NumPy values to Python values.
+
+    NumPy scalars (e.g., np.float32(2.0)) are converted with `item()`, and
+    NumPy arrays are converted to lists.
+    """
+
+    def convert(value):
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable."
+        )
+
+    return json.dumps(value, default=convert)
+
+
+def _array_to_arrow(values: np.ndarray):
+    """
+    Convert a data array to an Arrow array.
+
+    Unidimensional data are converted to a plain Arrow array. Data with more
+    dimensions are converted to a fixed-shape tensor array, whose storage is a
+    FixedSizeList of the flattened samples. Numerical data that are
+    C-contiguous are not copied.
+
+    Parameters
+    ----------
+    values
+        Array of shape (n, ...).
+
+    Returns
+    -------
+    pyarrow.Array
+
+    """
+    pa = _import_pyarrow()
+
+    if values.ndim == 1:
+        return pa.array(values)
+
+    sample_shape = values.shape[1:]
+    flat_values = pa.array(np.ravel(values))
+    storage = pa.FixedSizeListArray.from_arrays(
+        flat_values, int(np.prod(sample_shape))
+    )
+    return pa.ExtensionArray.from_storage(
+        pa.fixed_shape_tensor(flat_values.type, list(sample_shape)), storage
+    )
+
+
+def _arrow_to_array(column) -> np.ndarray:
+    """
+    Convert an Arrow array or chunked array to a data array.
+
+    This is the inverse of _array_to_arrow. Plain FixedSizeList columns
+    (possibly nested) are also converted to multidimensional arrays. When
+    possible, the output array shares the memory of the Arrow column and is
+    therefore read-only.
+
+    Parameters
+    ----------
+    column
+        A pyarrow Array or ChunkedArray.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n, ...).
+
+    """
+    pa = _import_pyarrow()
+
+    if isinstance(column, pa.ChunkedArray):
+        if column.num_chunks == 1:
+            column = column.chunk(0)
+        else:
+            column = column.combine_chunks()
+
+    n_samples = len(column)
+    sample_shape = []  # type: list[int]
+
+    if isinstance(column.type, pa.FixedShapeTensorType):
+        sample_shape = list(column.type.shape)
+        column = column.storage.flatten()
+    else:
+        while pa.types.is_fixed_size_list(column.type):
+            sample_shape.append(column.type.list_size)
+            column = column.flatten()
+
+    return np.reshape(
+        column.to_numpy(zero_copy_only=False), [n_samples] + sample_shape
+    )
+
+
+def _fit_interpolator(
+    time: np.ndarray, arrays: list[np.ndarray], kind: str
+) -> Callable[[np.ndarray], list[np.ndarray]]:
+    """
+    Fit one interpolator on several arrays of same dtype.
+
+    Parameters
+    ----------
+    time
+        Array of shape (n,), with the original times.
+    arrays
+        List of arrays of shape (n, ...), with the original data.
+    kind
+        The interpolation method, as in TimeSeries.resample. Values are
+        always extrapolated outside the original time range.
+
+    Returns
+    -------
+    Callable[[np.ndarray], list[np.ndarray]]
+        A function that takes an array of shape (m,) of new times, and
+        returns a list of arrays of shape (m, ...), one for each array of
+        arrays.
+
+    """
+    # Stack every array column-wise to interpolate them all at once.
+    n_samples = time.shape[0]
+    shapes = [array.shape[1:] for array in arrays]
+    n_columns = [int(np.prod(shape)) for shape in shapes]
+    stacked = np.concatenate(
+        [array.reshape((n_samples, n)) for array, n in zip(arrays, n_columns)],
+        axis=1,
+    )
+
+    if kind == "pchip":
+        f = sp.interpolate.PchipInterpolator(
+            time,
+            stacked,
+            axis=0,
+            extrapolate=True,
+        )
+    else:
+        f = sp.interpolate.interp1d(
+            time,
+            stacked,
+            axis=0,
+            fill_value="extrapolate",
+            kind=kind,
+        )
+
+    def interpolate(new_time: np.ndarray) -> list[np.ndarray]:
+        new_stacked = f(new_time).astype(
+            kineticstoolkit.config._get_float_dtype(stacked.dtype), copy=False
+        )
+
+        # Split back the columns.
+        out = []
+        start = 0
+        for shape, n in zip(shapes, n_columns):
+            out.append(
+                new_stacked[:, start : start + n].reshape(
+                    (new_time.shape[0],) + shape
+                )
+            )
+            start += n
+        return out
+
+    return interpolate
+
+
+def _is_in_open_ranges(
+    values: np.ndarray, lower_bounds: np.ndarray, upper_bounds: np.ndarray
+) -> np.ndarray:
+    """
+    Tell which values are in any of a series of open ranges.
+
+    Parameters
+    ----------
+    values
+        Array of shape (n,).
+    lower_bounds
+        Array of shape (m,), with the lower bound of each range.
+    upper_bounds
+        Array of shape (m,), with the upper bound of each range.
+
+    Returns
+    -------
+    np.ndarray
+        Array of bool of shape (n,), where each element is True if
+        lower_bounds[j] < values[i] < upper_bounds[j] for any j.
+
+    """
+    if lower_bounds.shape[0] == 0:
+        return np.zeros(values.shape[0], dtype=bool)
+
+    # Sort the ranges by lower bound. For each value, the ranges that begin
+    # before this value are the first n_before ranges; the value is in one
+    # of them if the furthest upper bound among these ranges is higher.
+    order = np.argsort(lower_bounds, kind="stable")
+    furthest_upper_bounds = np.maximum.accumulate(upper_bounds[order])
+    n_before = np.searchsorted(lower_bounds[order], values, side="left")
+    is_in_range = np.zeros(values.shape[0], dtype=bool)
+    has_range_before = n_before > 0
+    is_in_range[has_range_before] = (
+        furthest_upper_bounds[n_before[has_range_before] - 1]
+        > values[has_range_before]
+    )
+    return is_in_range
+
+
+def _isclose_to_sorted(values: np.ndarray, sorted_values: np.ndarray):
+    """
+    Tell which values are close to any value of a sorted array.
+
+    Parameters
+    ----------
+    values
+        Array of shape (n,).
+    sorted_values
+        Array of shape (m,), sorted in ascending order.
+
+    Returns
+    -------
+    np.ndarray
+        Array of bool of shape (n,), where each element is True if
+        np.isclose(values[i], sorted_values[j]) for any j.
+
+    """
+    # Since the tolerance of np.isclose(a, b) grows with |b| much slower than
+    # the distance between a and b, the closest sorted value on each side of
+    # a value is always the best candidate on this side.
+    if sorted_values.shape[0] == 0:
+        return np.zeros(values.shape[0], dtype=bool)
+    right = np.searchsorted(sorted_values, values)
+    left = np.maximum(right - 1, 0)
+    right = np.minimum(right, sorted_values.shape[0] - 1)
+    return np.isclose(values, sorted_values[left]) | np.isclose(
+        values, sorted_values[right]
+    )
+
+
+def _get_duplicate_indexes(times: np.ndarray, codes: np.ndarray) -> list[int]:
+    """
+    Find the events that duplicate a previous event of same name and time.
+
+    Events are processed in order. An event is a duplicate if
+    np.isclose(previous_time, time) for any previous, non-duplicate event of
+    the same name code.
+
+    Parameters
+    ----------
+    times
+        Times of the events, as an array of shape (n,).
+    codes
+        Name codes of the events, as an int array of shape (n,).
+
+    Returns
+    -------
+    list[int]
+        The sorted indexes of the duplicate events.
+
+    """
+    if len(times) < 2:
+        return []
+
+    # Sort by name code and time. Two consecutive events in this order can
+    # only be close if they share the same code and if their gap is within
+    # the largest tolerance of np.isclose for both times. Moreover, any two
+    # events separated by a larger gap cannot be close, since the tolerance
+    # grows with time by a factor of rtol only. Therefore, we split the
+    # sorted events in clusters where consecutive events are linked; only
+    # events of a same cluster may be duplicates.
+    order = np.lexsort((times, codes))
+    sorted_times = times[order]
+    sorted_codes = codes[order]
+    tolerance = 1e-8 + 1e-5 * np.maximum(
+        np.abs(sorted_times[1:]), np.abs(sorted_times[:-1])
+    )
+    with np.errstate(invalid="ignore"):
+        linked = (sorted_codes[1:] == sorted_codes[:-1]) & (
+            (np.abs(np.diff(sorted_times)) <= tolerance)
+            & np.isfinite(tolerance)
+            | (sorted_times[1:] == sorted_times[:-1])  # Infinite times
+        )
+    if not np.any(linked):
+        return []
+
+    clusters = np.concatenate(([0], np.cumsum(~linked)))
+    in_cluster = np.bincount(clusters)[clusters] > 1
+
+    # Process the events of these clusters in their original order. For each
+    # cluster, keep the sorted times of its unique events. Since the
+    # tolerance only depends on the time of the tested event, only the
+    # closest unique time on each side needs to be compared.
+    candidates = order[in_cluster]
+    candidate_clusters = clusters[in_cluster]
+    candidate_order = np.argsort(candidates)
+    unique_times = {}  # type: dict[int, list[float]]
+    out = []
+
+    def isclose(unique_time, time):
+        """Scalar version of np.isclose."""
+        if unique_time == time:
+            return True
+        if not (np.isfinite(unique_time) and np.isfinite(time)):
+            return False
+        return abs(unique_time - time) <= 1e-8 + 1e-5 * abs(time)
+
+    for i_event, cluster in zip(
+        candidates[candidate_order].tolist(),
+        candidate_clusters[candidate_order].tolist(),
+    ):
+        time = float(times[i_event])
+        these_unique_times = unique_times.setdefault(cluster, [])
+        position = bisect_left(these_unique_times, time)
+        if (
+            position > 0 and isclose(these_unique_times[position - 1], time)
+        ) or (
+            position < len(these_unique_times)
+            and isclose(these_unique_times[position], time)
+        ):
+            out.append(i_event)
+        else:
+            these_unique_times.insert(position, time)
+
+    return out
+
+
+def _read_only_view(array: np.ndarray) -> np.ndarray:
+    """Return a read-only view on an array, leaving the array writeable."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
 
 @dataclass
 class TimeSeriesEvent:
@@ -144,6 +967,23 @@ class TimeSeriesEvent:
     time: float = 0.0
     name: str = "event"
 
+    # Number of modifications of any existing TimeSeriesEvent, used to
+    # invalidate the name index of TimeSeriesEventList.
+    _modification_count = 0
+
+    def __setattr__(self, name, value):
+        """Keep track of modifications of existing events."""
+        if name in self.__dict__:
+            TimeSeriesEvent._modification_count += 1
+        super().__setattr__(name, value)
+
+    @classmethod
+    def _fast_new(cls, time: float, name: str) -> TimeSeriesEvent:
+        """Create a TimeSeriesEvent without going through __setattr__."""
+        event = object.__new__(cls)
+        object.__setattr__(event, "__dict__", {"time": time, "name": name})
+        return event
+
     def __lt__(self, other):
         """Define < operator."""
         return self.time < other.time
@@ -500,6 +1340,7 @@ class TimeSeries:
         """Return the directory for the TimeSeries."""
         return [
             "copy",
+            "get_memory_usage",
             # Data info management
             "add_data_info",
             "remove_data_info",
@@ -513,16 +1354,20 @@ class TimeSeries:
             "shift",
             "get_sample_rate",
             "resample",
+            "get_interpolator",
             # Event management
             "add_event",
+            "add_events",
             "rename_event",
             "remove_event",
+            "remove_events",
             "count_events",
             "remove_duplicate_events",
             "sort_events",
             "trim_events",
             # Get index from time
             "get_index_at_time",
+            "get_indexes_at_times",
             "get_index_before_time",
             "get_index_after_time",
             # Get index from event
@@ -541,8 +1386,10 @@ class TimeSeries:
             "get_ts_before_event",
             "get_ts_after_event",
             "get_ts_between_events",
+            "segment",
             # Missing data
             "isnan",
+            "get_missing_samples",
             "fill_missing_samples",
             # Interactive and plotting
             "ui_edit_events",
@@ -551,6 +1398,8 @@ class TimeSeries:
             # IO
             "to_dataframe",
             "from_dataframe",
+            "to_arrow",
+            "from_arrow",
             "from_array",
         ]
 
@@ -568,6 +1417,7 @@ class TimeSeries:
         return kineticstoolkit._repr._format_class_attributes(
             self,
             overrides={"_time": "time", "_data": "data", "_events": "events"},
+            hide_private=True,
         )
 
     def __repr__(self):
@@ -640,8 +1490,8 @@ class TimeSeries:
             for one_data in data:
                 try:
                     if not compare(
-                        self.data[one_data],
-                        ts.data[one_data],
+                        self.data._get_without_copy(one_data),
+                        ts.data._get_without_copy(one_data),
                         atol=atol,
                         rtol=rtol,
                     ):
@@ -677,13 +1527,13 @@ class TimeSeries:
 
         This is the most basic check: Every component of a TimeSeries must
         be of the correct type at each step of a code. Therefore, any other
-        check* starts by calling this function. This is not a performance hit
-        because apart from interactive functions (which are not affected by
-        test overhead), the check functions are run in case of error only,
-        to help the users in fixing their code.
+        check* starts by calling this function.
+
+        The time vector is checked in O(n) when it is strictly increasing,
+        and in O(n log n) otherwise.
 
-        *except _check_increasing_time, which is run in proprocessing and not
-        only in failures.
+        Follows ktk.config.validation_level: with "cheap", the time vector
+        and the events are not scanned; with "off", nothing is checked.
 
         Raises
         ------
@@ -694,6 +1544,10 @@ class TimeSeries:
             If the TimeSeries' attributes are of wrong type.
 
         """
+        validation_level = kineticstoolkit.config._get_validation_level()
+        if validation_level == "off":
+            return
+
         # Ensure that the TimeSeries has all its attributes
         try:
             self.time
@@ -737,7 +1591,14 @@ class TimeSeries:
                 f"However, the current time type is {type(self.time)}."
             )
 
-        if not np.all(~np.isnan(self.time)):
+        if validation_level == "cheap" or self._time_check_passed(
+            "well_typed"
+        ):
+            pass
+        elif self._is_increasing_time():
+            # Strictly increasing: no nan and no duplicate.
+            self._set_time_check_passed("well_typed")
+        elif not np.all(~np.isnan(self.time)):
             raise TypeError(
                 "A TimeSeries' time attribute must not contain nans. "
                 f"However, a total of {np.sum(~np.isnan(self.time.shape))} "
@@ -745,12 +1606,14 @@ class TimeSeries:
                 "the TimeSeries."
             )
 
-        if not np.array_equal(np.unique(self.time), np.sort(self.time)):
+        elif not np.array_equal(np.unique(self.time), np.sort(self.time)):
             raise TypeError(
                 "A TimeSeries' time attribute must not contain duplicates. "
                 f"However, while the TimeSeries has {len(self.time)} samples, "
                 f"only {len(np.unique(self.time))} are unique."
             )
+        else:
+            self._set_time_check_passed("well_typed")
 
         # Ensure that the data attribute is a dict
         if not isinstance(self.data, dict):
@@ -762,7 +1625,7 @@ class TimeSeries:
 
         # Ensure that each data are numpy arrays
         for key in self.data:
-            data = self.data[key]
+            data = self.data._get_without_copy(key)
 
             if not isinstance(data, np.ndarray):
                 raise TypeError(
@@ -780,15 +1643,21 @@ class TimeSeries:
                 f"{type(self.events)}."
             )
 
-        # Ensure that all events are an instance of TimeSeriesEvent
-        for i_event, event in enumerate(self.events):
-            if not isinstance(event, TimeSeriesEvent):
-                raise TypeError(
-                    "The TimeSeries' events attribute must be a list of "
-                    "TimeSeriesEvent. However, at least one element of this "
-                    f"list is not: element {i_event} is "
-                    f"of type {type(event)}."
-                )
+        # Ensure that all events are an instance of TimeSeriesEvent. This is
+        # already ensured by TimeSeriesEventList.
+        if validation_level == "cheap" or isinstance(
+            self.events, TimeSeriesEventList
+        ):
+            pass
+        else:
+            for i_event, event in enumerate(self.events):
+                if not isinstance(event, TimeSeriesEvent):
+                    raise TypeError(
+                        "The TimeSeries' events attribute must be a list of "
+                        "TimeSeriesEvent. However, at least one element of "
+                        f"this list is not: element {i_event} is "
+                        f"of type {type(event)}."
+                    )
 
         # Ensure that TimeInfo is a dict
         if not isinstance(self.time_info, dict):
@@ -826,6 +1695,8 @@ class TimeSeries:
             If the TimeSeries' time and data do not concord in shape.
 
         """
+        if kineticstoolkit.config._get_validation_level() == "off":
+            return
         self._check_well_typed()
         if len(self.time.shape) != 1:
             raise TypeError(
@@ -836,7 +1707,7 @@ class TimeSeries:
             )
 
         for key in self.data:
-            data = self.data[key]
+            data = self.data._get_without_copy(key)
             # Ensure that it's coherent in shape with time
             if data.shape[0] != self.time.shape[0]:
                 raise ValueError(
@@ -857,6 +1728,8 @@ class TimeSeries:
             If the TimeSeries time is empty
 
         """
+        if kineticstoolkit.config._get_validation_level() == "off":
+            return
         if self.time.shape[0] == 0:
             raise ValueError(
                 "The TimeSeries is empty: the length of its time "
@@ -873,7 +1746,11 @@ class TimeSeries:
             If the TimeSeries' time is not always increasing.
 
         """
-        if not np.array_equal(self.time, np.sort(self.time)):
+        if kineticstoolkit.config._get_validation_level() != "strict":
+            return
+        if not self._is_increasing_time() and not np.array_equal(
+            self.time, np.sort(self.time)
+        ):
             raise ValueError(
                 "The TimeSeries' time attribute is not always increasing, "
                 "which is required by the requested function. You can "
@@ -881,6 +1758,75 @@ class TimeSeries:
                 "using ts = ts.resample(np.sort(ts.time))."
             )
 
+    def _time_check_passed(self, check: str) -> bool:
+        """
+        Tell if a time check already passed on the current time vector.
+
+        Parameters
+        ----------
+        check
+            Name of the check, e.g., "well_typed" or "increasing".
+
+        The record is only used when ktk.config.validation_level is not
+        "strict": since the time vector can be modified in place, which is
+        not tracked, the strict level always checks the time vector again.
+
+        Returns
+        -------
+        bool
+            True if this check already passed on this exact time vector.
+
+        """
+        if kineticstoolkit.config._get_validation_level() == "strict":
+            return False
+        try:
+            time, passed_checks = self._time_checks
+        except AttributeError:
+            return False
+        return time is self._time and check in passed_checks
+
+    def _set_time_check_passed(self, check: str) -> None:
+        """
+        Record that a time check passed on the current time vector.
+
+        The record is dropped as soon as a new time vector is assigned.
+
+        Parameters
+        ----------
+        check
+            Name of the check, e.g., "well_typed" or "increasing".
+
+        """
+        try:
+            time, passed_checks = self._time_checks
+        except AttributeError:
+            time, passed_checks = None, set()
+        if time is not self._time:
+            passed_checks = set()
+        passed_checks.add(check)
+        self._time_checks = (self._time, passed_checks)
+
+    def _is_increasing_time(self) -> bool:
+        """
+        Tell if the time vector is strictly increasing, in O(n).
+
+        A strictly increasing time vector is also free of nans and duplicates.
+        Unless ktk.config.validation_level is "strict", the result is cached
+        until a new time vector is assigned.
+
+        Returns
+        -------
+        bool
+            True if the time vector is strictly increasing.
+
+        """
+        if self._time_check_passed("increasing"):
+            return True
+        if self.time.ndim != 1 or not np.all(np.diff(self.time) > 0):
+            return False
+        self._set_time_check_passed("increasing")
+        return True
+
     def _check_constant_sample_rate(self) -> None:
         """
         Check that the TimeSeries's sampling rate is constant.
@@ -891,6 +1837,8 @@ class TimeSeries:
             If the TimeSeries's sampling rate is not constant.
 
         """
+        if kineticstoolkit.config._get_validation_level() != "strict":
+            return
         if np.isnan(self.get_sample_rate()):
             raise ValueError(
                 "The TimeSeries's sample rate is not constant, which is "
@@ -910,6 +1858,8 @@ class TimeSeries:
             If the TimeSeries as no time
 
         """
+        if kineticstoolkit.config._get_validation_level() == "off":
+            return
         if len(self.data) == 0:
             raise ValueError(
                 "The TimeSeries is empty: it does not contain any data."
@@ -966,6 +1916,21 @@ class TimeSeries:
         TimeSeries
             A deep copy of the TimeSeries.
 
+        Notes
+        -----
+        The data arrays are copied on their first read: the copy shares its
+        data arrays with the original TimeSeries until an array is read from
+        one of both TimeSeries (e.g., `ts.data["Forces"]`,
+        `ts.data.items()`), at which point only this array is copied.
+        Therefore, copying a TimeSeries to modify its events or metadata
+        (e.g., `add_event`, `shift`, `rename_data`, `add_data_info`) does not
+        duplicate its data. Since an array that was already read could be
+        modified in place at any time, arrays that are still referenced
+        elsewhere at the time of the copy (e.g., `forces = ts.data["Forces"]`
+        or a view on this array) are copied immediately instead of being
+        shared. On Python implementations other than CPython, every array is
+        copied immediately.
+
         """
         check_param("copy_time", copy_time, bool)
         check_param("copy_data", copy_data, bool)
@@ -983,7 +1948,7 @@ class TimeSeries:
             if copy_time:
                 ts.time = deepcopy(self.time)
             if copy_data:
-                ts.data = deepcopy(self.data)
+                ts.data = self.data  # Shared until read
             if copy_time_info:
                 ts.time_info = deepcopy(self.time_info)
             if copy_data_info:
@@ -992,6 +1957,91 @@ class TimeSeries:
                 ts.events = deepcopy(self.events)
             return ts
 
+    def get_memory_usage(self) -> dict[str, Any]:
+        """
+        Get the memory used by the TimeSeries' time, data and events.
+
+        Returns
+        -------
+        dict[str, Any]
+            A dict with the following entries:
+
+            - "Time": a dict with the entries "Bytes" (number of bytes of the
+              time array) and "IsView" (True if the time array is a view on
+              another array, in which case its memory belongs to this other
+              array);
+            - "Data": a dict with one entry per data key, each of them being a
+              dict with the entries "Bytes" and "IsView" as above, plus
+              "IsShared" (True if the array is shared with a copy of the
+              TimeSeries until it is read; see `TimeSeries.copy`);
+            - "Events": a dict with the entry "Bytes", which is an
+              approximation of the memory used by the event list;
+            - "Total": the sum of every "Bytes" above.
+
+        See Also
+        --------
+        ktk.TimeSeries.copy
+
+        Notes
+        -----
+        Views and shared arrays are counted in full, even if their memory is
+        also used by other arrays or TimeSeries. The Python objects that
+        contain the arrays (e.g., the TimeSeries itself) are not counted.
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries(time=np.arange(1000) / 100)
+        >>> ts = ts.add_data("Forces", np.zeros((1000, 4)))
+        >>> usage = ts.get_memory_usage()
+        >>> usage["Time"]
+        {'Bytes': 8000, 'IsView': False}
+
+        >>> usage["Data"]
+        {'Forces': {'Bytes': 32000, 'IsView': False, 'IsShared': False}}
+
+        >>> ts2 = ts.copy()
+        >>> ts2.get_memory_usage()["Data"]
+        {'Forces': {'Bytes': 32000, 'IsView': False, 'IsShared': True}}
+
+        """
+        self._check_well_typed()
+
+        out = {}  # type: dict[str, Any]
+        out["Time"] = {
+            "Bytes": self.time.nbytes,
+            "IsView": self.time.base is not None,
+        }
+
+        out["Data"] = {}
+        for key in self.data:
+            value = self.data._get_without_copy(key)
+            out["Data"][key] = {
+                "Bytes": value.nbytes,
+                "IsView": value.base is not None,
+                "IsShared": (
+                    key in self.data._shared and self.data._shared[key][0] > 1
+                ),
+            }
+
+        out["Events"] = {
+            "Bytes": sys.getsizeof(self.events)
+            + sum(
+                [
+                    sys.getsizeof(event)
+                    + sys.getsizeof(event.time)
+                    + sys.getsizeof(event.name)
+                    for event in self.events
+                ]
+            )
+        }
+
+        out["Total"] = (
+            out["Time"]["Bytes"]
+            + sum([_["Bytes"] for _ in out["Data"].values()])
+            + out["Events"]["Bytes"]
+        )
+        return out
+
     # %% Data info management
 
     def add_data_info(
@@ -1236,11 +2286,11 @@ class TimeSeries:
 
         # Check that the data fits with other data (if it exists)
         for key in ts.data:
-            if ts.data[key].shape[0] != data_to_add.shape[0]:
+            n_samples = ts.data._get_without_copy(key).shape[0]
+            if n_samples != data_to_add.shape[0]:
                 raise ValueError(
                     f"This data has {data_to_add.shape[0]} samples while "
-                    f"this TimeSeries' data {key} has {ts.data[key].shape[0]} "
-                    "samples."
+                    f"this TimeSeries' data {key} has {n_samples} samples."
                 )
 
         # Check that we would not overwrite by mistake
@@ -1316,7 +2366,7 @@ class TimeSeries:
 
         ts = self if in_place else self.copy()
         try:
-            ts.data[new_data_key] = ts.data.pop(old_data_key)
+            ts.data._rename(old_data_key, new_data_key)
         except KeyError:
             self._raise_data_key_error(old_data_key)
 
@@ -1387,7 +2437,7 @@ class TimeSeries:
 
         ts = self if in_place else self.copy()
         try:
-            ts.data.pop(data_key)
+            del ts.data[data_key]
         except KeyError:
             self._raise_data_key_error(data_key)
         try:
@@ -1416,6 +2466,9 @@ class TimeSeries:
         """
         self._check_well_typed()
 
+        if isinstance(self.events, TimeSeriesEventList):
+            return list(self.events._get_name_index().get(name, []))
+
         # list all events with correct name
         event_times = []
         event_indexes = []
@@ -1464,8 +2517,11 @@ class TimeSeries:
 
         # Get the event occurrence
         try:
-            return self._get_event_indexes(name)[occurrence]
-        except IndexError:
+            if isinstance(self.events, TimeSeriesEventList):
+                return self.events._get_name_index()[name][occurrence]
+            else:
+                return self._get_event_indexes(name)[occurrence]
+        except (IndexError, KeyError):
             raise TimeSeriesEventNotFoundError(
                 f"The occurrence {occurrence} of event '{name}' could not "
                 "be found in the TimeSeries. A total of "
@@ -1504,30 +2560,8 @@ class TimeSeries:
         """
         self._check_well_typed()
 
-        # Sort all events in a dict with key being tuple(time, name)
-        sorted_events = {}  # type: dict[tuple[float, str], list[int]]
-        for i_event, event in enumerate(self.events):
-            tup_event = event._to_tuple()
-
-            # Check if this event already exist in the list.
-            # If it does, add it to the list.
-            found = False
-            for key in sorted_events:
-                if np.isclose(key[0], event.time) and (key[1] == event.name):
-                    sorted_events[key].append(i_event)
-                    found = True
-                    break
-            if not found:
-                # Otherwise, create it in the list
-                sorted_events[tup_event] = [i_event]
-
-        # Convert this dict to the desired list of lists
-        out = []
-        for key in sorted_events:
-            if len(sorted_events[key]) > 1:
-                out.extend(sorted_events[key][1:])
-
-        return sorted(out)
+        times, codes, _ = self.events._get_columns()
+        return _get_duplicate_indexes(times, codes)
 
     def add_event(
         self,
@@ -1598,6 +2632,108 @@ class TimeSeries:
         ts.events.append(TimeSeriesEvent(time, name))
         return ts
 
+    def add_events(
+        self,
+        times: ArrayLike,
+        names: str | list[str] = "event",
+        *,
+        in_place: bool = False,
+        unique: bool = False,
+    ) -> TimeSeries:
+        """
+        Add several events to the TimeSeries at once.
+
+        This is equivalent to calling `TimeSeries.add_event` for each event,
+        but much faster when adding many events.
+
+        Parameters
+        ----------
+        times
+            The times of the events, in the same unit as `time_info["Unit"]`,
+            as an array of length n.
+        names
+            Optional. The names of the events, either as a list of length n or
+            as a single name common to every event. Default is "event".
+        in_place
+            Optional. True to modify and return the original TimeSeries. False
+            to return a modified copy of the TimeSeries while leaving the
+            original TimeSeries intact. Default is False.
+        unique
+            Optional. True to prevent duplicating events. In this case, an
+            event is not added if an event with the same name and a close
+            time (according to np.isclose) already exists or is already
+            being added. Default is False.
+
+        Returns
+        -------
+        TimeSeries
+            The TimeSeries with the added events.
+
+        See Also
+        --------
+        ktk.TimeSeries.add_event
+        ktk.TimeSeries.remove_events
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries()
+        >>> ts = ts.add_events([5.5, 10.8, 2.3], ["event1", "event2", "event2"])
+        >>> ts.events
+        [TimeSeriesEvent(time=5.5, name='event1'),
+         TimeSeriesEvent(time=10.8, name='event2'),
+         TimeSeriesEvent(time=2.3, name='event2')]
+
+        >>> ts = ts.add_events([2.3, 3.0, 3.0], "event2", unique=True)
+        >>> ts.events
+        [TimeSeriesEvent(time=5.5, name='event1'),
+         TimeSeriesEvent(time=10.8, name='event2'),
+         TimeSeriesEvent(time=2.3, name='event2'),
+         TimeSeriesEvent(time=3.0, name='event2')]
+
+        """
+        times_array = np.array(times)
+        if isinstance(names, str):
+            names = [names] * times_array.size
+        check_param("times", times_array, np.ndarray, ndims=1)
+        check_param("names", names, list, contents_type=str)
+        check_param("in_place", in_place, bool)
+        check_param("unique", unique, bool)
+        if len(names) != times_array.shape[0]:
+            raise ValueError(
+                "times and names must have the same length. However, "
+                f"times has a length of {times_array.shape[0]} while names "
+                f"has a length of {len(names)}."
+            )
+        self._check_well_typed()
+
+        ts = self if in_place else self.copy()
+
+        if unique and times_array.shape[0] > 0:
+            new_events = TimeSeriesEventList._from_columns(
+                times_array.tolist(), names
+            )
+            new_times, new_codes, new_names = new_events._get_columns()
+            name_index = ts.events._get_name_index()
+            existing_times = ts.events._get_columns()[0]
+
+            # Remove the events that already exist in the TimeSeries
+            to_keep = np.ones(times_array.shape[0], dtype=bool)
+            for code, name in enumerate(new_names):
+                if name in name_index:
+                    is_code = new_codes == code
+                    to_keep[is_code] = ~_isclose_to_sorted(
+                        new_times[is_code], existing_times[name_index[name]]
+                    )
+
+            # Remove the duplicates among the new events
+            to_keep[_get_duplicate_indexes(new_times, new_codes)] = False
+
+            times_array = times_array[to_keep]
+            names = [name for name, keep in zip(names, to_keep) if keep]
+
+        ts.events._extend_from_columns(times_array.tolist(), names)
+        return ts
+
     def rename_event(
         self,
         old_name: str,
@@ -1720,52 +2856,121 @@ class TimeSeries:
 
         Example
         -------
-        >>> # Instanciate a timeseries with some events
+        >>> # Instanciate a timeseries with some events
+        >>> ts = ktk.TimeSeries()
+        >>> ts = ts.add_event(5.5, "event1")
+        >>> ts = ts.add_event(10.8, "event2")
+        >>> ts = ts.add_event(2.3, "event2")
+
+        >>> ts.events
+        [TimeSeriesEvent(time=5.5, name='event1'),
+         TimeSeriesEvent(time=10.8, name='event2'),
+         TimeSeriesEvent(time=2.3, name='event2')]
+
+        >>> ts = ts.remove_event("event1")
+        >>> ts.events
+        [TimeSeriesEvent(time=10.8, name='event2'),
+         TimeSeriesEvent(time=2.3, name='event2')]
+
+        >>> ts = ts.remove_event("event2", 1)
+        >>> ts.events
+        [TimeSeriesEvent(time=2.3, name='event2')]
+
+        """
+        check_param("name", name, str)
+        check_param("occurrence", occurrence, (int, None))
+        check_param("in_place", in_place, bool)
+        self._check_well_typed()
+
+        ts = self if in_place else self.copy()
+
+        if occurrence is None:  # Remove all occurrences
+            ts._get_event_index(name, 0)  # Raise if there is none
+            for event_index in sorted(
+                ts._get_event_indexes(name), reverse=True
+            ):
+                ts.events.pop(event_index)
+
+        else:  # Remove only the specified occurrence
+            event_index = ts._get_event_index(name, occurrence)
+            ts.events.pop(event_index)
+        return ts
+
+    def remove_events(
+        self,
+        times: ArrayLike,
+        names: str | list[str] = "event",
+        *,
+        in_place: bool = False,
+    ) -> TimeSeries:
+        """
+        Remove several events from the TimeSeries at once.
+
+        Every event with the same name and a close time (according to
+        np.isclose) as one of the specified events is removed. Specified
+        events that cannot be found are ignored.
+
+        Parameters
+        ----------
+        times
+            The times of the events to remove, as an array of length n.
+        names
+            Optional. The names of the events to remove, either as a list of
+            length n or as a single name common to every event. Default is
+            "event".
+        in_place
+            Optional. True to modify and return the original TimeSeries. False
+            to return a modified copy of the TimeSeries while leaving the
+            original TimeSeries intact. Default is False.
+
+        Returns
+        -------
+        TimeSeries
+            The TimeSeries with the removed events.
+
+        See Also
+        --------
+        ktk.TimeSeries.remove_event
+        ktk.TimeSeries.add_events
+
+        Example
+        -------
         >>> ts = ktk.TimeSeries()
-        >>> ts = ts.add_event(5.5, "event1")
-        >>> ts = ts.add_event(10.8, "event2")
-        >>> ts = ts.add_event(2.3, "event2")
-
-        >>> ts.events
-        [TimeSeriesEvent(time=5.5, name='event1'),
-         TimeSeriesEvent(time=10.8, name='event2'),
-         TimeSeriesEvent(time=2.3, name='event2')]
-
-        >>> ts = ts.remove_event("event1")
-        >>> ts.events
-        [TimeSeriesEvent(time=10.8, name='event2'),
-         TimeSeriesEvent(time=2.3, name='event2')]
-
-        >>> ts = ts.remove_event("event2", 1)
+        >>> ts = ts.add_events([5.5, 10.8, 2.3], ["event1", "event2", "event2"])
+        >>> ts = ts.remove_events([5.5, 2.3], ["event1", "event2"])
         >>> ts.events
-        [TimeSeriesEvent(time=2.3, name='event2')]
+        [TimeSeriesEvent(time=10.8, name='event2')]
 
         """
-        check_param("name", name, str)
-        check_param("occurrence", occurrence, (int, None))
+        times_array = np.array(times)
+        if isinstance(names, str):
+            names = [names] * times_array.size
+        check_param("times", times_array, np.ndarray, ndims=1)
+        check_param("names", names, list, contents_type=str)
         check_param("in_place", in_place, bool)
+        if len(names) != times_array.shape[0]:
+            raise ValueError(
+                "times and names must have the same length. However, "
+                f"times has a length of {times_array.shape[0]} while names "
+                f"has a length of {len(names)}."
+            )
         self._check_well_typed()
 
         ts = self if in_place else self.copy()
 
-        if occurrence is None:  # Remove all occurrences
-            event_index = ts._get_event_index(name, 0)
-            try:
-                # Continually remove the first event of this name, until
-                # there are no more.
-                count = 0
-                while True:
-                    ts.remove_event(name, occurrence=0, in_place=True)
-                    count += 1
-            except TimeSeriesEventNotFoundError:
-                if count == 0:  # No event of that name was even found.
-                    raise TimeSeriesEventNotFoundError(
-                        f"No event named {name} could be found."
-                    )
+        event_times, event_codes, event_names = ts.events._get_columns()
+        to_remove = np.zeros(len(ts.events), dtype=bool)
+        times_array = times_array.astype(float)
+        names_array = np.array(names, dtype=object)
+        for code, name in enumerate(event_names):
+            is_name = names_array == name
+            if np.any(is_name):
+                is_code = event_codes == code
+                to_remove[is_code] = _isclose_to_sorted(
+                    event_times[is_code], np.sort(times_array[is_name])
+                )
 
-        else:  # Remove only the specified occurrence
-            event_index = ts._get_event_index(name, occurrence)
-            ts.events.pop(event_index)
+        ts.events._select(np.nonzero(~to_remove)[0])
         return ts
 
     def count_events(self, name: str) -> int:
@@ -1854,9 +3059,9 @@ class TimeSeries:
         self._check_well_typed()
 
         ts = self if in_place else self.copy()
-        duplicates = ts._get_duplicate_event_indexes()
-        for event_index in duplicates[-1::-1]:
-            ts.events.pop(event_index)
+        to_keep = np.ones(len(ts.events), dtype=bool)
+        to_keep[ts._get_duplicate_event_indexes()] = False
+        ts.events._select(np.nonzero(to_keep)[0])
         return ts
 
     def sort_events(
@@ -1923,7 +3128,8 @@ class TimeSeries:
         ts = self if in_place else self.copy()
         if unique:
             ts.remove_duplicate_events(in_place=True)
-        ts.events = sorted(ts.events)
+        times = ts.events._get_columns()[0]
+        ts.events._select(np.argsort(times, kind="stable"))
         return ts
 
     def trim_events(self, *, in_place: bool = False) -> TimeSeries:
@@ -1980,11 +3186,10 @@ class TimeSeries:
 
         ts = self if in_place else self.copy()
 
-        events = deepcopy(ts.events)
-        ts.events = []
-        for event in events:
-            if event.time <= np.max(ts.time) and event.time >= np.min(ts.time):
-                ts.add_event(event.time, event.name, in_place=True)
+        if len(ts.events) > 0:
+            times = ts.events._get_columns()[0]
+            to_keep = (times <= np.max(ts.time)) & (times >= np.min(ts.time))
+            ts.events._select(np.nonzero(to_keep)[0])
         return ts
 
     # %% get_index methods
@@ -2033,7 +3238,136 @@ class TimeSeries:
         self._check_well_shaped()
 
         self._check_not_empty_time()
-        return int(np.argmin(np.abs(self.time - float(time))))
+        return int(self._get_indexes_at_times(np.array([float(time)]))[0])
+
+    def get_indexes_at_times(self, times: ArrayLike) -> np.ndarray:
+        """
+        Get the time indexes that are closest to the specified times.
+
+        This is a vectorized version of ktk.TimeSeries.get_index_at_time,
+        which is much faster to get the indexes of many times at once.
+
+        Parameters
+        ----------
+        times
+            Times to look for in the TimeSeries' time vector, as an array of
+            any shape.
+
+        Returns
+        -------
+        np.ndarray
+            The indexes in the time vector, as an int array of the same
+            shape as `times`.
+
+        See Also
+        --------
+        ktk.TimeSeries.get_index_at_time
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries(time=np.array([0, 0.5, 1, 1.5, 2]))
+
+        >>> ts.get_indexes_at_times([0.9, 1, 1.1, 2.1])
+        array([2, 2, 2, 4])
+
+        """
+        times_array = np.array(times, dtype=float)
+        self._check_well_shaped()
+
+        self._check_not_empty_time()
+        return self._get_indexes_at_times(times_array)
+
+    def _get_indexes_at_times(self, times: np.ndarray) -> np.ndarray:
+        """
+        Get the time indexes that are closest to the specified times.
+
+        Uses a binary search if the time vector is increasing. Ties are
+        resolved to the lowest index, as with np.argmin.
+
+        Parameters
+        ----------
+        times
+            Array of float of any shape.
+
+        Returns
+        -------
+        np.ndarray
+            Array of int of the same shape as times.
+
+        """
+        if not self._is_increasing_time():
+            return np.array(
+                [np.argmin(np.abs(self.time - time)) for time in times.flat],
+                dtype=int,
+            ).reshape(times.shape)
+
+        last_index = self.time.shape[0] - 1
+        right = np.minimum(np.searchsorted(self.time, times), last_index)
+        left = np.maximum(right - 1, 0)
+        left_distance = np.abs(self.time[left] - times)
+        right_distance = np.abs(self.time[right] - times)
+        indexes = np.where(left_distance <= right_distance, left, right)
+        # np.argmin returns the first index when comparing to nan.
+        indexes[np.isnan(times)] = 0
+        return indexes
+
+    def _get_indexes_before_times(
+        self, times: np.ndarray, inclusive: bool
+    ) -> np.ndarray:
+        """
+        Get the time indexes that are just before the specified times.
+
+        The time vector must be increasing.
+
+        Parameters
+        ----------
+        times
+            Array of float of any shape.
+        inclusive
+            True to include the given times in the comparison.
+
+        Returns
+        -------
+        np.ndarray
+            Array of int of the same shape as times, where -1 means that
+            there is no data before the given time.
+
+        """
+        indexes = (
+            np.searchsorted(
+                self.time, times, side=("right" if inclusive else "left")
+            )
+            - 1
+        )
+        indexes[np.isnan(times)] = -1
+        return indexes
+
+    def _get_indexes_after_times(
+        self, times: np.ndarray, inclusive: bool
+    ) -> np.ndarray:
+        """
+        Get the time indexes that are just after the specified times.
+
+        The time vector must be increasing.
+
+        Parameters
+        ----------
+        times
+            Array of float of any shape.
+        inclusive
+            True to include the given times in the comparison.
+
+        Returns
+        -------
+        np.ndarray
+            Array of int of the same shape as times, where len(self.time)
+            means that there is no data after the given time.
+
+        """
+        # nan is sorted after any time, therefore we get len(self.time).
+        return np.searchsorted(
+            self.time, times, side=("left" if inclusive else "right")
+        )
 
     def get_index_before_time(
         self, time: float, *, inclusive: bool = False
@@ -2095,15 +3429,15 @@ class TimeSeries:
 
         self._check_increasing_time()
 
-        if inclusive:
-            mask = np.nonzero(self.time <= time)
-        else:
-            mask = np.nonzero(self.time < time)
-
-        if mask[0].shape == (0,):
+        index = int(
+            self._get_indexes_before_times(
+                np.array([float(time)]), inclusive
+            )[0]
+        )
+        if index < 0:
             _raise()
 
-        return int(mask[0][-1])
+        return index
 
     def get_index_after_time(
         self, time: float, *, inclusive: bool = False
@@ -2165,15 +3499,15 @@ class TimeSeries:
 
         self._check_increasing_time()
 
-        if inclusive:
-            mask = np.nonzero(self.time >= time)
-        else:
-            mask = np.nonzero(self.time > time)
-
-        if mask[0].shape == (0,):
+        index = int(
+            self._get_indexes_after_times(
+                np.array([float(time)]), inclusive
+            )[0]
+        )
+        if index >= self.time.shape[0]:
             _raise()
 
-        return int(mask[0][0])
+        return index
 
     def get_index_at_event(self, name: str, occurrence: int = 0) -> int:
         """
@@ -2365,7 +3699,7 @@ class TimeSeries:
     # %% get_ts methods
 
     def get_ts_before_index(
-        self, index: int, *, inclusive: bool = False
+        self, index: int, *, inclusive: bool = False, view: bool = False
     ) -> TimeSeries:
         """
         Get a TimeSeries before the specified time index.
@@ -2376,6 +3710,10 @@ class TimeSeries:
             Time index
         inclusive
             Optional. True to include the given time index.
+        view
+            Optional. True to return a TimeSeries whose time and data are
+            read-only views on this TimeSeries' arrays instead of copies.
+            See ktk.TimeSeries.get_ts_between_indexes. Default is False.
 
         Returns
         -------
@@ -2409,6 +3747,7 @@ class TimeSeries:
         """
         check_param("index", index, int)
         check_param("inclusive", inclusive, bool)
+        check_param("view", view, bool)
         self._check_well_shaped()
         self._check_increasing_time()
 
@@ -2418,11 +3757,11 @@ class TimeSeries:
             )
 
         return self.get_ts_between_indexes(
-            0, index, inclusive=(True, inclusive)
+            0, index, inclusive=(True, inclusive), view=view
         )
 
     def get_ts_after_index(
-        self, index: int, *, inclusive: bool = False
+        self, index: int, *, inclusive: bool = False, view: bool = False
     ) -> TimeSeries:
         """
         Get a TimeSeries after the specified time index.
@@ -2433,6 +3772,10 @@ class TimeSeries:
             Time index
         inclusive
             Optional. True to include the given time index.
+        view
+            Optional. True to return a TimeSeries whose time and data are
+            read-only views on this TimeSeries' arrays instead of copies.
+            See ktk.TimeSeries.get_ts_between_indexes. Default is False.
 
         Returns
         -------
@@ -2466,6 +3809,7 @@ class TimeSeries:
         """
         check_param("index", index, int)
         check_param("inclusive", inclusive, bool)
+        check_param("view", view, bool)
         self._check_well_shaped()
         self._check_increasing_time()
 
@@ -2479,7 +3823,10 @@ class TimeSeries:
             )
 
         return self.get_ts_between_indexes(
-            index, self.time.shape[0] - 1, inclusive=(inclusive, True)
+            index,
+            self.time.shape[0] - 1,
+            inclusive=(inclusive, True),
+            view=view,
         )
 
     def get_ts_between_indexes(
@@ -2488,6 +3835,7 @@ class TimeSeries:
         index2: int,
         *,
         inclusive: bool | tuple[bool, bool] = False,
+        view: bool = False,
     ) -> TimeSeries:
         """
         Get a TimeSeries between two specified time indexes.
@@ -2505,6 +3853,15 @@ class TimeSeries:
             - (True, False): index1 <= index < index2
             - (False, True): index1 < index <= index2
 
+        view
+            Optional. True to return a TimeSeries whose time and data are
+            views on this TimeSeries' arrays instead of copies. This avoids
+            copying the data, which is useful when many segments are
+            extracted from a long TimeSeries. The views are read-only since
+            they share their memory with this TimeSeries; use
+            TimeSeries.copy() on the result to obtain a writable TimeSeries.
+            Default is False.
+
         Returns
         -------
         TimeSeries
@@ -2537,9 +3894,17 @@ class TimeSeries:
 
         >>> ts.get_ts_between_indexes(2, 5, inclusive=[True, False]).time
         array([0.2, 0.3, 0.4])
+
+        >>> subts = ts.get_ts_between_indexes(2, 5, view=True)
+        >>> np.shares_memory(subts.time, ts.time)
+        True
+        >>> subts.time.flags.writeable
+        False
+
         """
         check_param("index1", index1, int)
         check_param("index2", index2, int)
+        check_param("view", view, bool)
         if isinstance(inclusive, bool):
             inclusive = (inclusive, inclusive)
         try:
@@ -2579,16 +3944,46 @@ class TimeSeries:
             )
         index2 += int(inclusive[1])
 
-        index_range = range(index1 + 1, index2)
+        return self._get_ts_from_slice(slice(index1 + 1, index2), view=view)
+
+    def _get_ts_from_slice(self, index_slice: slice, view: bool) -> TimeSeries:
+        """
+        Get a TimeSeries on a slice of time indexes, without any check.
+
+        Parameters
+        ----------
+        index_slice
+            The slice of time indexes to keep.
+        view
+            True to return read-only views on this TimeSeries' time and data
+            instead of copies.
+
+        Returns
+        -------
+        TimeSeries
+            A new TimeSeries with every event and metadata.
 
+        """
         out_ts = self.copy(copy_data=False, copy_time=False)
-        out_ts.time = self.time[index_range]
-        for the_data in self.data.keys():
-            out_ts.data[the_data] = self.data[the_data][index_range]
+        if view:
+            out_ts._time = _read_only_view(self.time[index_slice])
+            for the_data in self.data.keys():
+                out_ts.data._set_without_copy(
+                    the_data,
+                    _read_only_view(
+                        self.data._get_without_copy(the_data)[index_slice]
+                    ),
+                )
+        else:
+            out_ts.time = self.time[index_slice]
+            for the_data in self.data.keys():
+                out_ts.data[the_data] = self.data._get_without_copy(the_data)[
+                    index_slice
+                ]
         return out_ts
 
     def get_ts_before_time(
-        self, time: float, *, inclusive: bool = False
+        self, time: float, *, inclusive: bool = False, view: bool = False
     ) -> TimeSeries:
         """
         Get a TimeSeries before the specified time.
@@ -2599,6 +3994,10 @@ class TimeSeries:
             Time to look for in the TimeSeries' time vector.
         inclusive
             Optional. True to include the given time in the comparison.
+        view
+            Optional. True to return a TimeSeries whose time and data are
+            read-only views on this TimeSeries' arrays instead of copies.
+            See ktk.TimeSeries.get_ts_between_indexes. Default is False.
 
         Returns
         -------
@@ -2632,6 +4031,7 @@ class TimeSeries:
         """
         check_param("time", time, float)
         check_param("inclusive", inclusive, bool)
+        check_param("view", view, bool)
         self._check_well_shaped()
         self._check_increasing_time()
 
@@ -2645,11 +4045,11 @@ class TimeSeries:
             )
 
         return self.get_ts_between_times(
-            self.time[0], time, inclusive=(True, inclusive)
+            self.time[0], time, inclusive=(True, inclusive), view=view
         )
 
     def get_ts_after_time(
-        self, time: float, *, inclusive: bool = False
+        self, time: float, *, inclusive: bool = False, view: bool = False
     ) -> TimeSeries:
         """
         Get a TimeSeries after the specified time.
@@ -2660,6 +4060,10 @@ class TimeSeries:
             Time to look for in the TimeSeries' time vector.
         inclusive
             Optional. True to include the given time in the comparison.
+        view
+            Optional. True to return a TimeSeries whose time and data are
+            read-only views on this TimeSeries' arrays instead of copies.
+            See ktk.TimeSeries.get_ts_between_indexes. Default is False.
 
         Returns
         -------
@@ -2693,6 +4097,7 @@ class TimeSeries:
         """
         check_param("time", time, float)
         check_param("inclusive", inclusive, bool)
+        check_param("view", view, bool)
         self._check_well_shaped()
         self._check_increasing_time()
 
@@ -2706,7 +4111,7 @@ class TimeSeries:
             )
 
         return self.get_ts_between_times(
-            time, self.time[-1], inclusive=(inclusive, True)
+            time, self.time[-1], inclusive=(inclusive, True), view=view
         )
 
     def get_ts_between_times(
@@ -2715,6 +4120,7 @@ class TimeSeries:
         time2: float,
         *,
         inclusive: bool | tuple[bool, bool] = False,
+        view: bool = False,
     ) -> TimeSeries:
         """
         Get a TimeSeries between two specified times.
@@ -2731,6 +4137,10 @@ class TimeSeries:
             - True or (True, True): time1 <= time <= time2
             - (True, False): time1 <= time < time2
             - (False, True): time1 < time <= time2
+        view
+            Optional. True to return a TimeSeries whose time and data are
+            read-only views on this TimeSeries' arrays instead of copies.
+            See ktk.TimeSeries.get_ts_between_indexes. Default is False.
 
         Returns
         -------
@@ -2766,6 +4176,7 @@ class TimeSeries:
         """
         check_param("time1", time1, float)
         check_param("teim2", time2, float)
+        check_param("view", view, bool)
         if isinstance(inclusive, bool):
             inclusive = (inclusive, inclusive)
         try:
@@ -2790,10 +4201,17 @@ class TimeSeries:
 
         index1 = self.get_index_after_time(time1, inclusive=inclusive[0])
         index2 = self.get_index_before_time(time2, inclusive=inclusive[1])
-        return self.get_ts_between_indexes(index1, index2, inclusive=True)
+        return self.get_ts_between_indexes(
+            index1, index2, inclusive=True, view=view
+        )
 
     def get_ts_before_event(
-        self, name: str, occurrence: int = 0, *, inclusive: bool = False
+        self,
+        name: str,
+        occurrence: int = 0,
+        *,
+        inclusive: bool = False,
+        view: bool = False,
     ) -> TimeSeries:
         """
         Get a TimeSeries before the specified event.
@@ -2807,6 +4225,10 @@ class TimeSeries:
             list, starting at 0.
         inclusive
             Optional. True to include the given time in the comparison.
+        view
+            Optional. True to return a TimeSeries whose time and data are
+            read-only views on this TimeSeries' arrays instead of copies.
+            See ktk.TimeSeries.get_ts_between_indexes. Default is False.
 
         Returns
         -------
@@ -2849,6 +4271,7 @@ class TimeSeries:
         check_param("name", name, str)
         check_param("occurrence", occurrence, int)
         check_param("inclusive", inclusive, bool)
+        check_param("view", view, bool)
         self._check_well_shaped()
 
         try:
@@ -2857,6 +4280,7 @@ class TimeSeries:
                     name, occurrence, inclusive=inclusive
                 ),
                 inclusive=True,
+                view=view,
             )
         except TimeSeriesRangeError:
             time = self.events[self._get_event_index(name, occurrence)].time
@@ -2869,7 +4293,12 @@ class TimeSeries:
             return retval
 
     def get_ts_after_event(
-        self, name: str, occurrence: int = 0, *, inclusive: bool = False
+        self,
+        name: str,
+        occurrence: int = 0,
+        *,
+        inclusive: bool = False,
+        view: bool = False,
     ) -> TimeSeries:
         """
         Get a TimeSeries after the specified event.
@@ -2883,6 +4312,10 @@ class TimeSeries:
             list, starting at 0.
         inclusive
             Optional. True to include the given event in the comparison.
+        view
+            Optional. True to return a TimeSeries whose time and data are
+            read-only views on this TimeSeries' arrays instead of copies.
+            See ktk.TimeSeries.get_ts_between_indexes. Default is False.
 
         Returns
         -------
@@ -2925,6 +4358,7 @@ class TimeSeries:
         check_param("name", name, str)
         check_param("occurrence", occurrence, int)
         check_param("inclusive", inclusive, bool)
+        check_param("view", view, bool)
         self._check_well_shaped()
 
         try:
@@ -2933,6 +4367,7 @@ class TimeSeries:
                     name, occurrence, inclusive=inclusive
                 ),
                 inclusive=True,
+                view=view,
             )
         except TimeSeriesRangeError:
             time = self.events[self._get_event_index(name, occurrence)].time
@@ -2952,6 +4387,7 @@ class TimeSeries:
         occurrence2: int = 0,
         *,
         inclusive: bool | tuple[bool, bool] = False,
+        view: bool = False,
     ) -> TimeSeries:
         """
         Get a TimeSeries between two specified events.
@@ -2971,6 +4407,10 @@ class TimeSeries:
             - True or (True, True): event1.time <= time <= event2.time
             - (True, False): event1.time <= time < event2.time
             - (False, True): event1.time < time <= event2.time
+        view
+            Optional. True to return a TimeSeries whose time and data are
+            read-only views on this TimeSeries' arrays instead of copies.
+            See ktk.TimeSeries.get_ts_between_indexes. Default is False.
 
         Returns
         -------
@@ -3009,6 +4449,7 @@ class TimeSeries:
         check_param("name2", name2, str)
         check_param("occurrence1", occurrence2, int)
         check_param("occurrence1", occurrence2, int)
+        check_param("view", view, bool)
         if isinstance(inclusive, bool):
             inclusive = (inclusive, inclusive)
         try:
@@ -3045,7 +4486,122 @@ class TimeSeries:
         index2 = self.get_index_before_event(
             name2, occurrence2, inclusive=inclusive[1]
         )
-        return self.get_ts_between_indexes(index1, index2, inclusive=True)
+        return self.get_ts_between_indexes(
+            index1, index2, inclusive=True, view=view
+        )
+
+    def segment(
+        self,
+        name1: str,
+        name2: str,
+        *,
+        inclusive: bool | tuple[bool, bool] = False,
+        view: bool = False,
+    ) -> list[TimeSeries]:
+        """
+        Get every TimeSeries between two events at once.
+
+        Each occurrence of event `name1` is paired with the first occurrence
+        of event `name2` that happens strictly after it, and the TimeSeries
+        between both events is extracted, as with
+        ktk.TimeSeries.get_ts_between_events. This is much faster than
+        calling ktk.TimeSeries.get_ts_between_events in a loop, especially
+        with `view=True`.
+
+        Parameters
+        ----------
+        name1, name2
+            Name of the events. Can be the same name, e.g., to extract every
+            cycle between consecutive heel strikes.
+        inclusive
+            Optional. Either a bool or a tuple of two bools. Used to
+            specify which times are returned:
+
+            - False or (False, False) (default): event1.time < time < event2.time
+            - True or (True, True): event1.time <= time <= event2.time
+            - (True, False): event1.time <= time < event2.time
+            - (False, True): event1.time < time <= event2.time
+
+        view
+            Optional. True to return TimeSeries whose time and data are
+            read-only views on this TimeSeries' arrays instead of copies.
+            See ktk.TimeSeries.get_ts_between_indexes. Default is False.
+
+        Returns
+        -------
+        list[TimeSeries]
+            One TimeSeries per pair of events, sorted by time. Pairs for
+            which there is no data between the events are skipped.
+
+        See Also
+        --------
+        ktk.TimeSeries.get_ts_between_events
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries(time=np.arange(10)/10)
+        >>> ts = ts.add_event(0.2, "start")
+        >>> ts = ts.add_event(0.55, "start")
+        >>> ts = ts.add_event(0.4, "end")
+        >>> ts = ts.add_event(0.8, "end")
+
+        >>> [subts.time for subts in ts.segment("start", "end")]
+        [array([0.3]), array([0.6, 0.7])]
+
+        >>> [subts.time for subts in ts.segment("start", "start")]
+        [array([0.3, 0.4, 0.5])]
+
+        """
+        check_param("name1", name1, str)
+        check_param("name2", name2, str)
+        check_param("view", view, bool)
+        if isinstance(inclusive, bool):
+            inclusive = (inclusive, inclusive)
+        try:
+            inclusive = cast(tuple[bool, bool], tuple(inclusive))
+            check_param(
+                "inclusive",
+                inclusive,
+                tuple,
+                length=2,
+                contents_type=bool,
+            )
+        except TypeError:
+            raise TypeError(
+                "inclusive must be either a bool or a tuple of two bools."
+            )
+
+        self._check_well_shaped()
+        self._check_increasing_time()
+
+        # Pair each event1 with the first event2 that is strictly after.
+        name_index = self.events._get_name_index()
+        event_times = self.events._get_columns()[0]
+        times1 = event_times[name_index.get(name1, [])]
+        times2 = event_times[name_index.get(name2, [])]
+        indexes2 = np.searchsorted(times2, times1, side="right")
+        is_paired = indexes2 < times2.shape[0]
+        times1 = times1[is_paired]
+        times2 = times2[indexes2[is_paired]]
+
+        # Same indexes as get_index_after_event and get_index_before_event
+        if inclusive[0]:
+            index1 = self._get_indexes_before_times(times1, inclusive=True)
+        else:
+            index1 = self._get_indexes_after_times(times1, inclusive=False)
+        if inclusive[1]:
+            index2 = self._get_indexes_after_times(times2, inclusive=True)
+        else:
+            index2 = self._get_indexes_before_times(times2, inclusive=False)
+
+        n_samples = self.time.shape[0]
+        is_valid = (index1 >= 0) & (index2 < n_samples) & (index2 >= index1)
+        return [
+            self._get_ts_from_slice(slice(begin, end + 1), view=view)
+            for begin, end in zip(
+                index1[is_valid].tolist(), index2[is_valid].tolist()
+            )
+        ]
 
     # %% Time management
 
@@ -3096,7 +4652,7 @@ class TimeSeries:
         ts = self if in_place else self.copy()
         for event in ts.events:
             event.time += time
-        ts.time += time
+        ts.time = ts.time + time
         return ts
 
     def get_sample_rate(self) -> float:
@@ -3195,6 +4751,7 @@ class TimeSeries:
         --------
         ktk.TimeSeries.get_sample_rate
         ktk.TimeSeries.fill_missing_samples
+        ktk.TimeSeries.get_interpolator
 
         Examples
         --------
@@ -3251,92 +4808,69 @@ class TimeSeries:
                 "(https://github.com/felixchenier/kineticstoolkit/issues/174)."
             )
 
-        self._check_well_shaped()
+        interpolator = TimeSeriesInterpolator(
+            self, kind, extrapolate=extrapolate
+        )
+        new_time = interpolator._get_new_time(target)
+        new_data = interpolator.interpolate_data(new_time)
 
         ts = self if in_place else self.copy()
+        ts.time = new_time
+        ts.data = new_data
+        return ts
 
-        # --------------------------------------------------------------
-        # Create the new time if a frequency was provided instead
-        if isinstance(target, Real):
-            # We specifically use arange instead of linspace, because what
-            # is defined is a frequency, not a number of points.
-            new_time = np.arange(
-                ts.time[0],
-                ts.time[-1] + 1 / target,
-                1 / target,
-            )
-            # Work around the numerical instability of using arange with floats
-            # by ensuring that the time point is not higher than the original
-            # last time point
-            if new_time[-1] > ts.time[-1]:
-                new_time = new_time[:-1]
-        else:
-            new_time = np.array(target)  # type: ignore
-        # --------------------------------------------------------------
+    def get_interpolator(
+        self, kind: str = "linear", *, extrapolate: bool = False
+    ) -> TimeSeriesInterpolator:
+        """
+        Get a reusable interpolator to resample the TimeSeries many times.
 
-        if np.any(np.isnan(new_time)):
-            raise ValueError("new_time must not contain nans")
+        The interpolators are fit once on every data of the TimeSeries. The
+        returned object can then be called with any target to get the
+        resampled TimeSeries, which is equivalent to calling
+        `TimeSeries.resample(target, kind, extrapolate=extrapolate)` but
+        without fitting the interpolators again. Its `interpolate_data`
+        method returns only the interpolated data, as a dict.
 
-        # We will progressively fill these data
-        new_data = {}  # type: dict[str, np.ndarray]
+        Parameters
+        ----------
+        kind
+            Optional. The interpolation method, as in TimeSeries.resample.
+            Default is "linear".
+        extrapolate
+            Optional. True to extrapolate outside the original time range.
+            Default is False.
 
-        for key in ts.data.keys():
-            index = ~ts.isnan(key)
+        Returns
+        -------
+        TimeSeriesInterpolator
+            A callable that takes a target frequency or new times as in
+            TimeSeries.resample, and returns the resampled TimeSeries.
 
-            if sum(index) < 3:  # Only Nans, cannot interpolate.
-                # We generate an array of nans of the expected size.
-                new_shape = [len(new_time)]
-                for i in range(1, len(self.data[key].shape)):
-                    new_shape.append(self.data[key].shape[i])
-                new_data[key] = np.empty(new_shape)
-                new_data[key][:] = np.nan
-                continue
+        See Also
+        --------
+        ktk.TimeSeries.resample
 
-            # Express nans as a range of times to
-            # remove from the final, interpolated timeseries
-            nan_indexes = np.argwhere(~index)
+        Caution
+        -------
+        The interpolator works on the data at the time it was created:
+        further modifications to the TimeSeries are not reflected in the
+        interpolator.
 
-            # initialize with times outside of the original time range
-            time_ranges_to_remove: list[tuple[float, float]] = []
-            if not extrapolate:
-                time_ranges_to_remove.append((-np.inf, ts.time[0]))
-                time_ranges_to_remove.append((ts.time[-1], np.inf))
+        Examples
+        --------
+        >>> ts = ktk.TimeSeries(time=np.arange(10.))
+        >>> ts = ts.add_data("data", ts.time ** 2)
+        >>> interpolator = ts.get_interpolator()
 
-            length = ts.time.shape[0]
-            for i in nan_indexes:
-                if i > 0 and i < length - 1:
-                    time_range = (ts.time[i - 1], ts.time[i + 1])
-                elif i == 0:
-                    time_range = (-np.inf, ts.time[i + 1])
-                else:
-                    time_range = (ts.time[i - 1], np.inf)
-                time_ranges_to_remove.append(time_range)
-
-            if kind == "pchip":
-                P = sp.interpolate.PchipInterpolator(
-                    ts.time[index],
-                    ts.data[key][index],
-                    axis=0,
-                    extrapolate=True,
-                )
-                new_data[key] = P(new_time)
-            else:
-                f = sp.interpolate.interp1d(
-                    ts.time[index],
-                    ts.data[key][index],
-                    axis=0,
-                    fill_value="extrapolate",
-                    kind=kind,
-                )
-                new_data[key] = f(new_time)
+        >>> interpolator([0.0, 0.5, 1.0]).data["data"]
+        array([0. , 0.5, 1. ])
 
-            # Put back nans in the originally missing data
-            for j in time_ranges_to_remove:
-                new_data[key][(new_time > j[0]) & (new_time < j[1])] = np.nan
+        >>> interpolator([8.0, 8.5, 9.0]).data["data"]
+        array([64. , 72.5, 81. ])
 
-        ts.time = new_time
-        ts.data = new_data
-        return ts
+        """
+        return TimeSeriesInterpolator(self, kind, extrapolate=extrapolate)
 
     # %% Subsetting and merging
 
@@ -3403,7 +4937,7 @@ class TimeSeries:
 
         for key in data_keys:
             try:
-                ts.data[key] = self.data[key].copy()
+                ts.data[key] = self.data._get_without_copy(key)
             except KeyError:
                 raise KeyError(
                     f"The key '{key}' could not be found among the "
@@ -3530,15 +5064,45 @@ class TimeSeries:
                             in_place=True,
                         )
 
-        # Merge events
-        for event in ts.events:
-            ts_out.add_event(
-                event.time, event.name, in_place=True, unique=True
+        # Merge events
+        ts_out.add_events(
+            [event.time for event in ts.events],
+            [event.name for event in ts.events],
+            in_place=True,
+            unique=True,
+        )
+        ts_out.sort_events(in_place=True)
+        return ts_out
+
+    # %% Missing sample management
+
+    def _group_by_missing_samples(self) -> list[tuple[np.ndarray, list[str]]]:
+        """
+        Group the data keys that miss the same samples.
+
+        Only the data keys that also share the same dtype are grouped, so
+        that the data of a group can be stacked and processed together.
+
+        Returns
+        -------
+        list[tuple[np.ndarray, list[str]]]
+            One (is_visible, data_keys) tuple per group, where is_visible is
+            the negation of TimeSeries.isnan for every key of data_keys.
+
+        """
+        groups = {}  # type: dict[tuple, tuple[np.ndarray, list[str]]]
+        self._check_well_shaped()
+        for key in self.data:
+            is_visible = ~_isnan_samples(self.data._get_without_copy(key))
+            group = (
+                is_visible.tobytes(),
+                self.data._get_without_copy(key).dtype,
             )
-        ts_out.sort_events(in_place=True)
-        return ts_out
-
-    # %% Missing sample management
+            try:
+                groups[group][1].append(key)
+            except KeyError:
+                groups[group] = (is_visible, [key])
+        return list(groups.values())
 
     def isnan(self, data_key: str) -> np.ndarray:
         """
@@ -3559,6 +5123,7 @@ class TimeSeries:
         See Also
         --------
         ktk.TimeSeries.fill_missing_samples
+        ktk.TimeSeries.get_missing_samples
 
         Example
         -------
@@ -3575,11 +5140,95 @@ class TimeSeries:
         check_param("data_key", data_key, str)
         self._check_well_shaped()
 
-        values = self.data[data_key].copy()
-        # Reduce the dimension of values while keeping the time dimension.
-        while len(values.shape) > 1:
-            values = np.sum(values, 1)  # type: ignore
-        return np.isnan(values)
+        return _isnan_samples(self.data._get_without_copy(data_key))
+
+    def get_missing_samples(
+        self, data_keys: str | list[str] = []
+    ) -> dict[str, dict[str, np.ndarray]]:
+        """
+        Report the runs of consecutive missing samples of each data.
+
+        Parameters
+        ----------
+        data_keys
+            Optional. The data keys to analyze. If left empty, all the data
+            keys are analyzed.
+
+        Returns
+        -------
+        dict[str, dict[str, np.ndarray]]
+            A dict with one entry per data key. Each entry is a dict of
+            three int arrays of shape (n_runs,), where n_runs is the number
+            of runs of consecutive missing samples (as reported by
+            TimeSeries.isnan) for this data key:
+
+            - "StartIndex": the index of the first missing sample of each run;
+            - "EndIndex": the index of the last missing sample of each run;
+            - "Length": the number of missing samples of each run.
+
+        See Also
+        --------
+        ktk.TimeSeries.isnan
+        ktk.TimeSeries.fill_missing_samples
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries(time=np.arange(10))
+        >>> ts = ts.add_data("data", np.arange(10.0))
+        >>> ts.data["data"][[1, 2, 6, 9]] = np.nan
+        >>> ts.data
+        {'data': array([ 0., nan, nan,  3.,  4.,  5., nan,  7.,  8., nan])}
+
+        >>> ts.get_missing_samples()
+        {'data': {'StartIndex': array([1, 6, 9]), 'EndIndex': array([2, 6, 9]), 'Length': array([2, 1, 1])}}
+
+        """
+        try:
+            check_param("data_keys", data_keys, str)
+        except TypeError:
+            try:
+                data_keys = list(data_keys)
+                check_param("data_keys", data_keys, list, contents_type=str)
+            except TypeError:
+                raise TypeError(
+                    "data_keys must be a string or a list of strings."
+                )
+        self._check_well_shaped()
+
+        if len(data_keys) == 0:
+            data_keys = list(self.data.keys())
+        elif isinstance(data_keys, str):
+            data_keys = [data_keys]
+
+        # Stack the missing samples of every key, padded with one visible
+        # sample on each side so that every run has a start and a stop.
+        n_samples = self.time.shape[0]
+        is_missing = np.zeros((len(data_keys), n_samples + 2), dtype=np.int8)
+        for i_key, key in enumerate(data_keys):
+            if key not in self.data:
+                self._raise_data_key_error(key)
+            is_missing[i_key, 1:-1] = _isnan_samples(
+                self.data._get_without_copy(key)
+            )
+
+        # A run starts where is_missing goes from 0 to 1, and stops where it
+        # goes from 1 to 0. np.nonzero returns these edges sorted by key,
+        # then by index.
+        edges = np.diff(is_missing, axis=1)
+        start_keys, starts = np.nonzero(edges == 1)
+        stops = np.nonzero(edges == -1)[1]
+        key_bounds = np.searchsorted(start_keys, np.arange(len(data_keys) + 1))
+
+        out = {}  # type: dict[str, dict[str, np.ndarray]]
+        for i_key, key in enumerate(data_keys):
+            key_starts = starts[key_bounds[i_key] : key_bounds[i_key + 1]]
+            key_stops = stops[key_bounds[i_key] : key_bounds[i_key + 1]]
+            out[key] = {
+                "StartIndex": key_starts,
+                "EndIndex": key_stops - 1,
+                "Length": key_stops - key_starts,
+            }
+        return out
 
     def fill_missing_samples(
         self,
@@ -3619,6 +5268,7 @@ class TimeSeries:
         See Also
         --------
         ktk.TimeSeries.isnan
+        ktk.TimeSeries.get_missing_samples
 
         """
         check_param("max_missing_samples", max_missing_samples, int)
@@ -3631,32 +5281,49 @@ class TimeSeries:
 
         ts_out = self if in_place else self.copy()
 
-        for data in ts_out.data:
+        if max_missing_samples > 0:
+            missing_samples = self.get_missing_samples()
+
+        # Fill the data keys that miss the same samples together.
+        for is_visible, keys in ts_out._group_by_missing_samples():
             # Fill missing samples
-            is_visible = ~ts_out.isnan(data)
-            ts = ts_out.get_subset(data)
-            ts.data[data] = ts.data[data][is_visible]
-            ts.time = ts.time[is_visible]
-            ts = ts.resample(ts_out.time, method, extrapolate=True)
+            if np.count_nonzero(is_visible) < 3:  # Cannot interpolate
+                filled = []
+                for key in keys:
+                    values = ts_out.data._get_without_copy(key)
+                    filled.append(
+                        np.full(
+                            values.shape,
+                            np.nan,
+                            dtype=kineticstoolkit.config._get_float_dtype(
+                                values.dtype
+                            ),
+                        )
+                    )
+            else:
+                filled = _fit_interpolator(
+                    ts_out.time[is_visible],
+                    [
+                        ts_out.data._get_without_copy(key)[is_visible]
+                        for key in keys
+                    ],
+                    method,
+                )(ts_out.time)
 
             # Put back missing samples in holes longer than max_missing_samples
             if max_missing_samples > 0:
-                still_visible_index = -1
-                to_keep = np.ones(self.time.shape)
-                for current_index in range(ts.time.shape[0]):
-                    if is_visible[current_index]:
-                        still_visible_index = current_index
-                    elif (
-                        current_index - still_visible_index
-                        > max_missing_samples
-                    ):
-                        to_keep[
-                            still_visible_index + 1 : current_index + 1
-                        ] = 0
-
-                ts.data[data][to_keep == 0] = np.nan
+                runs = missing_samples[keys[0]]
+                is_long = runs["Length"] > max_missing_samples
+                to_remove = _get_runs_mask(
+                    runs["StartIndex"][is_long],
+                    runs["Length"][is_long],
+                    is_visible.shape[0],
+                )
+                for values in filled:
+                    values[to_remove] = np.nan
 
-            ts_out.data[data] = ts.data[data]
+            for key, values in zip(keys, filled):
+                ts_out.data[key] = values
 
         return ts_out
 
@@ -4263,82 +5930,96 @@ class TimeSeries:
         of the inner data_info dictionary for this data. For instance,
         an element of the list could be: {"Unit": "N"}.
         """
-        # Init
-        df_out = pd.DataFrame()
-        info_out = []
+        column_names = []  # type: list[str]
+        info_out = []  # type: list[dict[str, Any]]
+
+        # The reshaped data of same dtype are concatenated in one block, so
+        # that the DataFrame is built at once while keeping each dtype.
+        blocks = {}  # type: dict[np.dtype, list[np.ndarray]]
+        block_columns = {}  # type: dict[np.dtype, list[int]]
+
+        # The column name suffixes (e.g., "[0,0]", "[0,1]", ...) for each
+        # data shape, since many data often share the same shape.
+        suffixes = {}  # type: dict[tuple[int, ...], list[str]]
 
         # Go through data
-        the_keys = self.data.keys()
-        for the_key in the_keys:
-            # Assign data
-            original_data = self.data[the_key]
+        for the_key in self.data:
+            original_data = self.data._get_without_copy(the_key)
 
             if original_data.shape[0] > 0:  # Not empty
-                original_data_shape = original_data.shape
                 data_length = original_data.shape[0]
-
                 reshaped_data = np.reshape(original_data, (data_length, -1))
-                reshaped_data_shape = reshaped_data.shape
-
-                df_data = pd.DataFrame(reshaped_data)
-
-                # Get the column names index from the shape of the original data
-                # The strategy here is to build matrices of indices, that have
-                # the same shape as the original data, then reshape these matrices
-                # the same way we reshaped the original data. Then we know where
-                # the original indices are in the new reshaped data.
-                original_indices = np.indices(original_data_shape[1:])
-                reshaped_indices = np.reshape(
-                    original_indices, (-1, reshaped_data_shape[1])
-                )
 
-                # Hint for my future self:
-                # For a one-dimension series, reshaped_indices will be:
-                # [[0]].
-                # For a two-dimension series, reshaped_indices will be:
-                # [[0 1 2 ...]].
-                # For a three-dimension series, reshaped_indices will be:
-                # [[0 0 0 ... 1 1 1 ... 2 2 2 ...]
-                #   0 1 2 ... 0 1 2 ... 0 1 2 ...]]
-                # and so on.
-
-                # Assign column names
-                column_names = []
-                for i_column in range(0, len(df_data.columns)):
-                    this_column_name = the_key
-                    n_indices = np.shape(reshaped_indices)[0]
-                    if n_indices > 0:
-                        # This data is expressed in more than one dimension.
-                        # We must add brackets to the column names to specify
-                        # the indices.
-                        this_column_name += "["
-
-                        for i_indice in range(0, n_indices):
-                            this_column_name += str(
-                                reshaped_indices[i_indice, i_column]
-                            )
-                            if i_indice == n_indices - 1:
-                                this_column_name += "]"
-                            else:
-                                this_column_name += ","
-
-                    column_names.append(this_column_name)
-
-                df_data.columns = column_names
+                # Get the column names from the shape of the original data.
+                # For a one-dimension series, the column name is the key. For
+                # more dimensions, we add the indices in brackets, in the
+                # same order as the reshaped data (C order), for instance
+                # "key[0,0]", "key[0,1]", ..., "key[1,0]", ...
+                data_shape = original_data.shape[1:]
+                if len(data_shape) == 0:
+                    these_column_names = [the_key]
+                else:
+                    try:
+                        these_suffixes = suffixes[data_shape]
+                    except KeyError:
+                        these_suffixes = [
+                            "[" + ",".join([str(_) for _ in indices]) + "]"
+                            for indices in np.ndindex(data_shape)
+                        ]
+                        suffixes[data_shape] = these_suffixes
+                    these_column_names = [
+                        the_key + suffix for suffix in these_suffixes
+                    ]
 
             else:  # empty data
-                df_data = pd.DataFrame(columns=[the_key])
-
-            # Merge this dataframe with the output dataframe
-            df_out = pd.concat([df_out, df_data], axis=1)
+                reshaped_data = np.empty((0, 1), dtype=object)
+                these_column_names = [the_key]
+
+            # Add these columns to the block of their dtype
+            dtype = reshaped_data.dtype
+            if dtype not in blocks:
+                blocks[dtype] = []
+                block_columns[dtype] = []
+            blocks[dtype].append(reshaped_data)
+            block_columns[dtype].extend(
+                range(
+                    len(column_names),
+                    len(column_names) + len(these_column_names),
+                )
+            )
+            column_names.extend(these_column_names)
 
             # Add the data_info that correspond to this key
-            for i in df_data.columns:
-                try:
-                    data_info = self.data_info[the_key]
-                    info_out.append(deepcopy(data_info))
-                except KeyError:
-                    info_out.append({})
+            try:
+                data_info = deepcopy(self.data_info[the_key])
+            except KeyError:
+                data_info = {}
+            info_out.extend(
+                [data_info.copy() for _ in range(len(these_column_names))]
+            )
+
+        # Create the DataFrame
+        if len(blocks) == 0:
+            df_out = pd.DataFrame()
+        else:
+            df_out = pd.concat(
+                [
+                    pd.DataFrame(
+                        np.concatenate(blocks[dtype], axis=1),
+                        columns=[
+                            column_names[i] for i in block_columns[dtype]
+                        ],
+                    )
+                    for dtype in blocks
+                ],
+                axis=1,
+            )
+            if len(blocks) > 1:
+                # Put back the columns in the order of the data keys
+                column_order = np.concatenate(
+                    [block_columns[dtype] for dtype in blocks]
+                )
+                df_out = df_out.iloc[:, np.argsort(column_order)]
 
         df_out.index = self.time
 
@@ -4540,54 +6221,247 @@ class TimeSeries:
             events=events,
         )
 
-        # Remove spaces in indexes between brackets
-        columns = dataframe.columns
-        new_columns = []
-        for i_column, column in enumerate(columns):
-            splitted = column.split("[")
-            if len(splitted) > 1:  # There are brackets
-                new_columns.append(
-                    splitted[0] + "[" + splitted[1].replace(" ", "")
-                )
-            else:
-                new_columns.append(column)
-        dataframe.columns = columns
-
-        # Search for the column names and their dimensions
-        # At the end, we end with something like:
-        #    dimensions['Data1'] = []
-        #    dimensions['Data2'] = [[0], [1], [2]]
-        #    dimensions['Data3'] = [[0,0],[0,1],[1,0],[1,1]]
-        dimensions = dict()  # type: dict[str, list]
-        for column in dataframe.columns:
-            splitted = column.split("[")
-            if len(splitted) == 1:  # No brackets
-                dimensions[column] = []
+        # Search for the column names and their indices. At the end, we end
+        # with something like:
+        #    positions['Data1'] = [0]
+        #    positions['Data2'] = [1, 2, 3]
+        #    positions['Data3'] = [4, 5, 6, 7]
+        #    indices['Data1'] = []
+        #    indices['Data2'] = [(0,), (1,), (2,)]
+        #    indices['Data3'] = [(0, 0), (0, 1), (1, 0), (1, 1)]
+        # where positions are the column positions in the DataFrame.
+        positions = {}  # type: dict[Any, list[int]]
+        indices = {}  # type: dict[Any, list[tuple[int, ...]]]
+        for i_column, column in enumerate(dataframe.columns):
+            match = (
+                _BRACKETED_COLUMN.match(column)
+                if isinstance(column, str)
+                else None
+            )
+            if match is None:  # No brackets
+                positions[column] = [i_column]
+                indices[column] = []
             else:  # With brackets
-                key = splitted[0]
-                index = literal_eval("[" + splitted[1])
-
-                if key in dimensions:
-                    dimensions[key].append(index)
+                key = match.group(1)
+                index = tuple(int(_) for _ in match.group(2).split(","))
+                if key in indices and len(indices[key]) > 0:
+                    positions[key].append(i_column)
+                    indices[key].append(index)
                 else:
-                    dimensions[key] = [index]
+                    positions[key] = [i_column]
+                    indices[key] = [index]
 
         n_samples = len(dataframe)
 
-        # Assign the columns to the output
-        for key in dimensions:
-            if len(dimensions[key]) == 0:
-                ts.data[key] = dataframe[key].to_numpy()
+        # Convert the DataFrame to an array once if possible. Otherwise, we
+        # convert each key separately to keep each column's dtype.
+        if dataframe.dtypes.nunique() == 1:
+            values = dataframe.to_numpy()
+        else:
+            values = None
+
+        def get_values(key_positions: ArrayLike) -> np.ndarray:
+            if values is not None:
+                return values[:, key_positions]
             else:
-                highest_dims = np.max(np.array(dimensions[key]), axis=0)
+                return dataframe.iloc[:, key_positions].to_numpy()
+
+        # Assign the columns to the output
+        for key in positions:
+            if len(indices[key]) == 0:
+                ts.data[key] = get_values(positions[key][0])
+                continue
+
+            key_indices = np.array(indices[key])
+            if key_indices.ndim != 2:
+                raise ValueError(
+                    f"The columns of data {key} do not all have the same "
+                    "number of indices between brackets."
+                )
+            shape = tuple((np.max(key_indices, axis=0) + 1).tolist())
+
+            # Sort the columns in the order of the reshaped data (C order),
+            # ensuring that every index of the data is present exactly once.
+            flat_indices = np.ravel_multi_index(key_indices.T, shape)
+            n_columns = int(np.prod(shape))
+            if (
+                len(flat_indices) != n_columns
+                or len(np.unique(flat_indices)) != n_columns
+            ):
+                raise ValueError(
+                    f"The columns of data {key} do not form a complete array "
+                    f"of shape {shape}: {len(flat_indices)} columns were "
+                    f"found while {n_columns} columns with unique indices "
+                    "were expected."
+                )
+            sorted_positions = np.empty(len(flat_indices), dtype=int)
+            sorted_positions[flat_indices] = positions[key]
+
+            ts.data[key] = np.reshape(
+                get_values(sorted_positions), (n_samples,) + shape
+            )
+
+        return ts
+
+    def to_arrow(self):
+        """
+        Create an Apache Arrow table with the TimeSeries contents.
+
+        The time is stored in a column named "time", and each data key is
+        stored in its own column. Unidimensional data are stored as plain
+        columns, while data with more dimensions are stored as fixed-shape
+        tensor columns (a FixedSizeList of the flattened samples) that keep
+        the shape of each sample. Numerical data are not copied when they
+        are C-contiguous.
+
+        The TimeSeries' `time_info`, `data_info` and events are stored as
+        JSON in the table's schema metadata, under the keys
+        "ktk.time_info", "ktk.data_info" and "ktk.events". NumPy scalars and
+        arrays in this metadata are stored as Python numbers and lists.
+
+        Returns
+        -------
+        pyarrow.Table
+            The TimeSeries as an Arrow table.
+
+        Raises
+        ------
+        ValueError
+            If a data key is named "time".
+        TypeError
+            If the metadata contains values that cannot be stored as JSON.
+
+        See Also
+        --------
+        ktk.TimeSeries.from_arrow
+        ktk.TimeSeries.to_dataframe
+
+        Notes
+        -----
+        This method relies on `pyarrow`, which is an optional dependency
+        of Kinetics Toolkit. Please install pyarrow before using this
+        method.
+
+        Examples
+        --------
+        >>> ts = ktk.TimeSeries(time=np.arange(3) / 10)
+        >>> ts = ts.add_data("Force", np.array([0.0, 2.0, 3.0]))
+        >>> ts = ts.add_data("Position", np.zeros((3, 4)))
+        >>> table = ts.to_arrow()
+        >>> table.column_names
+        ['time', 'Force', 'Position']
 
-                columns = [
-                    key + str(dim).replace(" ", "")
-                    for dim in sorted(dimensions[key])
+        >>> ts2 = ktk.TimeSeries.from_arrow(table)
+        >>> ts2.data["Position"].shape
+        (3, 4)
+
+        """
+        pa = _import_pyarrow()
+        self._check_well_shaped()
+
+        if _ARROW_TIME_COLUMN in self.data:
+            raise ValueError(
+                f"The TimeSeries cannot be converted to an Arrow table "
+                f"because it contains a data key named "
+                f"'{_ARROW_TIME_COLUMN}', which is reserved for the time. "
+                f"Please rename this data key first."
+            )
+
+        columns = {_ARROW_TIME_COLUMN: _array_to_arrow(self.time)}
+        for key in self.data:
+            columns[key] = _array_to_arrow(self.data._get_without_copy(key))
+
+        metadata = {
+            _ARROW_METADATA_KEYS["time_info"]: _to_json(self.time_info),
+            _ARROW_METADATA_KEYS["data_info"]: _to_json(self.data_info),
+            _ARROW_METADATA_KEYS["events"]: _to_json(
+                [
+                    {"time": event.time, "name": event.name}
+                    for event in self.events
                 ]
-                ts.data[key] = dataframe[columns].to_numpy()
-                ts.data[key] = np.reshape(
-                    ts.data[key], [n_samples] + (highest_dims + 1).tolist()
+            ),
+        }
+
+        return pa.table(columns, metadata=metadata)
+
+    @staticmethod
+    def from_arrow(table, /) -> TimeSeries:
+        """
+        Create a new TimeSeries from an Apache Arrow table.
+
+        The table must have a column named "time". Every other column is
+        converted to a data key. Fixed-shape tensor columns and
+        FixedSizeList columns are converted to multidimensional data.
+
+        If the table was created by `TimeSeries.to_arrow`, the `time_info`,
+        `data_info` and events are also read from the schema metadata.
+
+        Parameters
+        ----------
+        table
+            A pyarrow Table.
+
+        Returns
+        -------
+        TimeSeries
+            The converted TimeSeries.
+
+        Raises
+        ------
+        ValueError
+            If the table has no column named "time".
+
+        See Also
+        --------
+        ktk.TimeSeries.to_arrow
+        ktk.TimeSeries.from_dataframe
+
+        Notes
+        -----
+        This method relies on `pyarrow`, which is an optional dependency
+        of Kinetics Toolkit. Please install pyarrow before using this
+        method.
+
+        When possible, the data are not copied: the resulting arrays share
+        the memory of the Arrow table and are therefore read-only. Use
+        `TimeSeries.copy` to obtain writeable arrays.
+
+        """
+        pa = _import_pyarrow()
+        check_param("table", table, pa.Table)
+
+        if _ARROW_TIME_COLUMN not in table.column_names:
+            raise ValueError(
+                f"The Arrow table must have a column named "
+                f"'{_ARROW_TIME_COLUMN}'."
+            )
+
+        metadata = table.schema.metadata
+        if metadata is None:
+            metadata = {}
+
+        ts = TimeSeries(time=_arrow_to_array(table.column(_ARROW_TIME_COLUMN)))
+        if _ARROW_METADATA_KEYS["time_info"] in metadata:
+            ts.time_info = json.loads(
+                metadata[_ARROW_METADATA_KEYS["time_info"]]
+            )
+        if _ARROW_METADATA_KEYS["data_info"] in metadata:
+            ts.data_info = json.loads(
+                metadata[_ARROW_METADATA_KEYS["data_info"]]
+            )
+        if _ARROW_METADATA_KEYS["events"] in metadata:
+            events = json.loads(metadata[_ARROW_METADATA_KEYS["events"]])
+            ts.add_events(
+                [event["time"] for event in events],
+                [event["name"] for event in events],
+                in_place=True,
+            )
+
+        for i_column, key in enumerate(table.column_names):
+            if key != _ARROW_TIME_COLUMN:
+                values = _arrow_to_array(table.column(i_column))
+                ts.data._set_without_copy(
+                    key, values.astype(_get_stored_dtype(values), copy=False)
                 )
 
         return ts
@@ -4841,6 +6715,188 @@ class TimeSeries:
         )
 
 
+class TimeSeriesInterpolator:
+    """
+    Resample a TimeSeries on any new times, using interpolators fit once.
+
+    This class is not meant to be instanciated directly. Please use
+    ktk.TimeSeries.get_interpolator.
+
+    """
+
+    def __init__(
+        self,
+        ts: TimeSeries,
+        kind: str = "linear",
+        *,
+        extrapolate: bool = False,
+    ):
+        """Fit the interpolators on every data of a TimeSeries."""
+        check_param("kind", kind, str)
+        check_param("extrapolate", extrapolate, bool)
+        ts._check_well_shaped()
+
+        # Copy of the TimeSeries, without its data
+        self._ts = ts.copy(copy_data=False)
+        self._keys = list(ts.data.keys())
+
+        # One (keys, shapes, dtype, interpolate, lower_bounds, upper_bounds)
+        # tuple per group of data keys that miss the same samples and have
+        # the same dtype, where interpolate is None if there are too few
+        # samples to interpolate.
+        self._groups: list[
+            tuple[
+                list[str],
+                list[tuple],
+                np.dtype,
+                Callable | None,
+                np.ndarray,
+                np.ndarray,
+            ]
+        ] = []
+
+        for index, keys in ts._group_by_missing_samples():
+            shapes = [ts.data._get_without_copy(key).shape[1:] for key in keys]
+            dtype = ts.data._get_without_copy(keys[0]).dtype
+
+            if np.count_nonzero(index) < 3:  # Only Nans, cannot interpolate.
+                self._groups.append(
+                    (keys, shapes, dtype, None, np.array([]), np.array([]))
+                )
+                continue
+
+            interpolate = _fit_interpolator(
+                ts.time[index],
+                [ts.data._get_without_copy(key)[index] for key in keys],
+                kind,
+            )
+
+            # Express nans as ranges of times to remove from the final,
+            # interpolated timeseries: each missing sample removes the open
+            # range between its previous and next samples.
+            nan_indexes = np.flatnonzero(~index)
+            length = ts.time.shape[0]
+            lower_bounds = np.where(
+                nan_indexes > 0,
+                ts.time[np.maximum(nan_indexes - 1, 0)],
+                -np.inf,
+            )
+            upper_bounds = np.where(
+                nan_indexes < length - 1,
+                ts.time[np.minimum(nan_indexes + 1, length - 1)],
+                np.inf,
+            )
+
+            # Add the times outside of the original time range
+            if not extrapolate:
+                lower_bounds = np.append(lower_bounds, [-np.inf, ts.time[-1]])
+                upper_bounds = np.append(upper_bounds, [ts.time[0], np.inf])
+
+            self._groups.append(
+                (keys, shapes, dtype, interpolate, lower_bounds, upper_bounds)
+            )
+
+    def __call__(self, target: ArrayLike | float) -> TimeSeries:
+        """
+        Resample the TimeSeries.
+
+        Parameters
+        ----------
+        target
+            To resample to a target frequency, use a float that represents
+            the sample rate of the output TimeSeries, in Hz. To resample to
+            specific times, use an array of float that will become the time
+            property of the output TimeSeries.
+
+        Returns
+        -------
+        TimeSeries
+            The resampled TimeSeries.
+
+        """
+        new_time = self._get_new_time(target)
+        ts = self._ts.copy()
+        ts.time = new_time
+        ts.data = self.interpolate_data(new_time)
+        return ts
+
+    def _get_new_time(self, target: ArrayLike | float) -> np.ndarray:
+        """Create the new time, as in TimeSeries.resample."""
+        # Create the new time if a frequency was provided instead
+        if isinstance(target, Real):
+            # We specifically use arange instead of linspace, because what
+            # is defined is a frequency, not a number of points.
+            new_time = np.arange(
+                self._ts.time[0],
+                self._ts.time[-1] + 1 / target,
+                1 / target,
+            )
+            # Work around the numerical instability of using arange with floats
+            # by ensuring that the time point is not higher than the original
+            # last time point
+            if new_time[-1] > self._ts.time[-1]:
+                new_time = new_time[:-1]
+        else:
+            new_time = np.array(target)  # type: ignore
+
+        if np.any(np.isnan(new_time)):
+            raise ValueError("new_time must not contain nans")
+
+        return new_time
+
+    def interpolate_data(self, new_time: ArrayLike) -> dict[str, np.ndarray]:
+        """
+        Interpolate every data on new times, without creating a TimeSeries.
+
+        This is faster than calling the interpolator when only the data is
+        needed, e.g., to interpolate many short ranges of a long TimeSeries.
+
+        Parameters
+        ----------
+        new_time
+            Array of float of shape (n,) of the times to interpolate at.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The interpolated data, where each array has n samples.
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries(time=np.arange(10.))
+        >>> ts = ts.add_data("data", ts.time ** 2)
+        >>> ts.get_interpolator().interpolate_data([0.5, 8.5])
+        {'data': array([ 0.5, 72.5])}
+
+        """
+        new_time = np.asarray(new_time)
+        new_data = {}  # type: dict[str, np.ndarray]
+
+        for group in self._groups:
+            keys, shapes, dtype, interpolate, lower_bounds, upper_bounds = (
+                group
+            )
+            if interpolate is None:
+                # We generate arrays of nans of the expected size.
+                for key, shape in zip(keys, shapes):
+                    new_data[key] = np.full(
+                        (len(new_time),) + shape,
+                        np.nan,
+                        dtype=kineticstoolkit.config._get_float_dtype(dtype),
+                    )
+                continue
+
+            # Put back nans in the originally missing data
+            to_remove = _is_in_open_ranges(
+                new_time, lower_bounds, upper_bounds
+            )
+            for key, values in zip(keys, interpolate(new_time)):
+                values[to_remove] = np.nan
+                new_data[key] = values
+
+        return {key: new_data[key] for key in self._keys}
+
+
 # %% Main
 
 if __name__ == "__main__":  # pragma: no cover
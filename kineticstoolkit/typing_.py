@@ -24,6 +24,7 @@ __copyright__ = "Copyright (C) 2020-2024 Félix Chénier"
 __email__ = "chenier.felix@uqam.ca"
 __license__ = "Apache 2.0"
 
+import kineticstoolkit.config
 from numbers import Integral, Real, Complex
 from typing import NewType, TYPE_CHECKING
 from numpy.typing import ArrayLike as npt_ArrayLike
@@ -90,6 +91,11 @@ def check_param(
     Any
         The value
 
+    Notes
+    -----
+    This check follows ktk.config.validation_level: with "cheap", the
+    contents and keys of the value are not checked; with "off", nothing is
+    checked.
 
     Raises
     ------
@@ -100,6 +106,10 @@ def check_param(
         If the value does not meet the given criteria.
 
     """
+    validation_level = kineticstoolkit.config._get_validation_level()
+    if validation_level == "off":
+        return value
+
     if isinstance(expected_type, tuple):
         mapped_expected_type = tuple(
             [PARAM_MAPPING.get(_, _) for _ in expected_type]
@@ -114,7 +124,7 @@ def check_param(
             f"{type(value)}, with a value of {value}."
         )
     # Other specs
-    if contents_type is not None:
+    if contents_type is not None and validation_level != "cheap":
 
         if isinstance(contents_type, tuple):
             mapped_contents_type = tuple(
@@ -168,7 +178,7 @@ def check_param(
                     f"{value_shape}."
                 )
 
-    if key_type is not None:
+    if key_type is not None and validation_level != "cheap":
 
         if isinstance(key_type, tuple):
             mapped_key_type = tuple(
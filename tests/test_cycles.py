@@ -289,6 +289,58 @@ def test_time_normalize():
 #     plt.grid(True)
 
 
+def test_time_normalize_regression():
+    """Compare with time-normalizing each cycle separately."""
+    ts = ktk.TimeSeries(time=np.linspace(0, 20, 201))
+    ts.data["test"] = np.sin(ts.time)
+    ts.data["points"] = np.stack([np.cos(ts.time), ts.time**2], axis=1)
+    ts.data["points"][35] = np.nan  # Missing sample inside a cycle
+    for time in [1.0, 3.0, 5.03, 7.07]:
+        ts = ts.add_event(time, "push")
+    # A recovery at the same time as a push does not end this push's cycle
+    for time in [2.0, 3.0, 3.95, 6.05, 8.0]:
+        ts = ts.add_event(time, "recovery")
+    # Events at a cycle's begin are kept, at a cycle's end are dropped
+    for time in [1.0, 2.0, 3.5]:
+        ts = ts.add_event(time, "contact")
+
+    tn = ktk.cycles.time_normalize(ts, "push", "recovery")
+    cycles = [(1.0, 2.0), (3.0, 3.95), (5.03, 6.05), (7.07, 8.0)]
+    assert tn.time.shape[0] == 100 * len(cycles)
+
+    # Previous implementation: resample each cycle separately. The points
+    # between a cycle's bounds and its first or last sample were then
+    # extrapolated from inside the cycle, so only the others are compared.
+    for i_cycle, (begin, end) in enumerate(cycles):
+        subts = ts.get_ts_between_times(begin, end, inclusive=True)
+        new_time = np.linspace(begin, end, 101)
+        expected = subts.resample(new_time, extrapolate=True)
+        interior = (new_time[:100] >= subts.time[0]) & (
+            new_time[:100] <= subts.time[-1]
+        )
+        for key in ts.data:
+            assert np.allclose(
+                tn.data[key][100 * i_cycle : 100 * (i_cycle + 1)][interior],
+                expected.data[key][:100][interior],
+                equal_nan=True,
+            )
+
+    # The missing sample is still missing
+    assert np.sum(tn.isnan("points")) > 0
+    assert np.sum(tn.isnan("test")) == 0
+
+    contacts = [event.time for event in tn.events if event.name == "contact"]
+    assert np.allclose(contacts, [0.0, 100.0 + 50.0 / 0.95])
+
+    # A cycle without any sample cannot be time-normalized
+    ts = ts.add_event(10.02, "push").add_event(10.08, "recovery")
+    try:
+        ktk.cycles.time_normalize(ts, "push", "recovery")
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+
 def test_most_repeatable_cycles():
     # Create a TimeSeries with 5 cycles, one of those is different from
     # the others
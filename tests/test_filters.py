@@ -25,6 +25,7 @@ __license__ = "Apache 2.0"
 
 import kineticstoolkit as ktk
 import numpy as np
+import scipy.signal as sgl
 import warnings
 
 
@@ -231,6 +232,102 @@ def test_butter():
     )
 
 
+def test_streaming_butter():
+    """Test that filtering by chunks equals filtering at once."""
+    ts = ktk.TimeSeries(time=np.arange(1000) / 100)
+    ts.data["points"] = np.random.rand(1000, 4)
+    ts.data["points"][[0, 1, 500, 501, 502, 999]] = np.nan
+    ts.data["int"] = np.arange(1000)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        whole = ktk.filters.StreamingButter(
+            (1.0, 10.0), order=3, btype="bandpass"
+        ).filter(ts)
+
+        stream = ktk.filters.StreamingButter(
+            (1.0, 10.0), order=3, btype="bandpass"
+        )
+        bounds = [0, 2, 3, 250, 501, 502, 1000]
+        chunks = [
+            stream.filter(
+                ts.get_ts_between_indexes(i1, i2 - 1, inclusive=True)
+            )
+            for i1, i2 in zip(bounds[:-1], bounds[1:])
+        ]
+
+    for key in ts.data:
+        assert np.array_equal(
+            np.concatenate([chunk.data[key] for chunk in chunks]),
+            whole.data[key],
+            equal_nan=True,
+        )
+        assert np.all(whole.isnan(key) == ts.isnan(key))
+
+    # No transient at the beginning of a constant signal
+    ts = ktk.TimeSeries(time=np.arange(100) / 100)
+    ts.data["constant"] = np.full(100, 5.0)
+    filtered = ktk.filters.StreamingButter(5.0).filter(ts)
+    assert np.allclose(filtered.data["constant"], 5.0)
+
+    # Chunks must follow each other
+    stream = ktk.filters.StreamingButter(5.0)
+    stream.filter(ts)
+    try:
+        stream.filter(ts)
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+    stream.reset()
+    stream.filter(ts)  # Works after a reset
+
+    # A gap between chunks fails, including for a single-sample chunk
+    stream = ktk.filters.StreamingButter(5.0)
+    stream.filter(ts.get_ts_before_index(50))
+    for index in [51, 99]:
+        try:
+            stream.filter(ts.get_ts_after_index(index, inclusive=True))
+            raise AssertionError("This should fail.")
+        except ValueError:
+            pass
+    stream.filter(ts.get_ts_after_index(50, inclusive=True))
+
+    # A change of sample rate between chunks fails
+    stream = ktk.filters.StreamingButter(5.0)
+    stream.filter(ts)
+    chunk = ktk.TimeSeries(time=1 + np.arange(100) / 200)
+    chunk.data["constant"] = np.full(100, 5.0)
+    try:
+        stream.filter(chunk)
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+    chunk = ktk.TimeSeries(time=1 + np.arange(100) / 100)
+    chunk.data["constant"] = np.full(100, 5.0)
+    stream.filter(chunk)
+
+    # A chunk that fails does not advance the stream
+    ts = ktk.TimeSeries(time=np.arange(100) / 100)
+    ts.data["a"] = np.random.rand(100)
+    ts.data["b"] = np.random.rand(100)
+    whole = ktk.filters.StreamingButter(5.0).filter(ts)
+    stream = ktk.filters.StreamingButter(5.0)
+    first = stream.filter(ts.get_ts_before_index(50))
+    bad_chunk = ts.get_ts_after_index(50, inclusive=True)
+    bad_chunk.data["b"] = np.random.rand(50, 2)  # Shape changes: fails
+    try:
+        stream.filter(bad_chunk)
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+    second = stream.filter(ts.get_ts_after_index(50, inclusive=True))
+    for key in ts.data:
+        assert np.allclose(
+            np.concatenate([first.data[key], second.data[key]]),
+            whole.data[key],
+        )
+
+
 def test_median():
     """Test median filter."""
     ts = ktk.TimeSeries(time=np.arange(0, 0.5, 0.1))
@@ -339,6 +436,222 @@ def test_validate_input():
         pass
 
 
+def test_multiple_keys():
+    """Test that filtering several keys equals filtering them one by one."""
+    ts = ktk.TimeSeries(time=np.arange(200) / 100)
+    ts.data["points"] = np.random.rand(200, 4, 3)
+    ts.data["points"][[0, 50, 51, 199], 1, 2] = np.nan
+    ts.data["forces"] = np.random.rand(200, 4)
+    ts.data["forces"][100:110] = np.nan
+    ts.data["int"] = np.arange(200)
+    ts.data["nans"] = np.full(200, np.nan)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for function in [
+            lambda ts: ktk.filters.butter(ts, 10.0),
+            lambda ts: ktk.filters.savgol(ts, window_length=7, poly_order=2),
+        ]:
+            filtered = function(ts)
+            for key in ts.data:
+                expected = function(ts.get_subset(key)).data[key]
+                assert filtered.data[key].dtype == expected.dtype
+                assert np.allclose(
+                    filtered.data[key], expected, equal_nan=True
+                )
+                assert np.all(filtered.isnan(key) == ts.isnan(key))
+
+
+def test_n_jobs():
+    """Test that filtering in several threads gives the same results."""
+    ts = ktk.TimeSeries(time=np.arange(200) / 100)
+    ts.data["points"] = np.random.rand(200, 4, 3)
+    ts.data["points"][50:55] = np.nan
+    ts.data["forces"] = np.random.rand(200, 4)
+    ts.data["int"] = np.arange(200)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for function in [
+            lambda ts: ktk.filters.butter(ts, 10.0),
+            lambda ts: ktk.filters.savgol(ts, window_length=7, poly_order=2),
+            lambda ts: ktk.filters.smooth(ts, window_length=7),
+            lambda ts: ktk.filters.median(ts, window_length=5),
+            lambda ts: ktk.filters.deriv(ts, n=2),
+        ]:
+            expected = function(ts)
+            with ktk.config.temporary_n_jobs(3):
+                filtered = function(ts)
+            assert filtered._is_equivalent(expected, equal=True)
+
+    # The thread pool is kept between calls, and changing n_jobs does not
+    # shut down the pool that another thread could still be using
+    with ktk.config.temporary_n_jobs(3):
+        executor = ktk.filters._get_executor()
+        assert ktk.filters._get_executor() is executor
+    with ktk.config.temporary_n_jobs(2):
+        assert ktk.filters._get_executor() is not executor
+    assert list(executor.map(abs, [-1, -2])) == [1, 2]
+    with ktk.config.temporary_n_jobs(3):
+        assert ktk.filters._get_executor() is executor
+
+    try:
+        with ktk.config.temporary_n_jobs(0):
+            pass
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+
+def test_cache():
+    """Test that filter coefficients are cached and give the same results."""
+    ktk.filters.clear_cache()
+    ts = ktk.TimeSeries(time=np.arange(100) / 100)
+    ts.data["points"] = np.random.rand(100, 4, 3)
+    ts.data["int"] = np.arange(100)
+
+    for window_length, poly_order, deriv in [
+        (7, 2, 0),
+        (8, 2, 0),
+        (11, 3, 1),
+        (9, 4, 2),
+    ]:
+        for i in range(2):
+            filtered = ktk.filters.savgol(
+                ts,
+                window_length=window_length,
+                poly_order=poly_order,
+                deriv=deriv,
+            )
+        for key in ts.data:
+            expected = sgl.savgol_filter(
+                ts.data[key],
+                window_length,
+                poly_order,
+                deriv,
+                delta=0.01,
+                axis=0,
+            )
+            assert filtered.data[key].dtype == expected.dtype
+            assert np.allclose(filtered.data[key], expected)
+
+    for i in range(3):
+        ktk.filters.butter(ts, 10.0)
+    ktk.filters.butter(ts, 20.0)
+
+    info = ktk.filters.get_cache_info()
+    assert info["savgol"]["Misses"] == 4
+    assert info["savgol"]["Hits"] == 12  # 2 calls x 2 dtypes per settings
+    assert info["butter"] == {
+        "Hits": 2,
+        "Misses": 2,
+        "Size": 2,
+        "MaxSize": 128,
+    }
+
+    ktk.filters.clear_cache()
+    assert ktk.filters.get_cache_info()["butter"]["Size"] == 0
+
+
+def test_gaps():
+    """Test that gaps="split" filters each segment independently."""
+    ts = ktk.TimeSeries(time=np.arange(200) / 100)
+    ts.data["points"] = np.random.rand(200, 4)
+    ts.data["points"][100:103] = np.nan  # Segments [0, 100[ and [103, 200[
+    ts.data["points"][150] = np.nan  # Segments [103, 150[ and [151, 200[
+    ts.data["short"] = np.random.rand(200)
+    ts.data["short"][5] = np.nan  # Segment [0, 5[ may be too short
+    ts.data["int"] = np.arange(200)
+
+    segments = {
+        "points": [(0, 100), (103, 150), (151, 200)],
+        "short": [(0, 5), (6, 200)],
+        "int": [(0, 200)],
+    }
+
+    def filter_segments(function, min_length):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            filtered = function(ts, "split")
+        for key in ts.data:
+            expected = np.full(ts.data[key].shape, np.nan)
+            for start, stop in segments[key]:
+                if stop - start < min_length:
+                    continue  # Too short, remains NaN
+                expected[start:stop] = function(
+                    ts.get_ts_between_indexes(
+                        start, stop - 1, inclusive=True
+                    ).get_subset(key),
+                    "interpolate",
+                ).data[key]
+            assert np.allclose(filtered.data[key], expected, equal_nan=True)
+
+    filter_segments(
+        lambda ts, gaps: ktk.filters.butter(ts, 10.0, gaps=gaps), 10
+    )
+    filter_segments(
+        lambda ts, gaps: ktk.filters.butter(
+            ts, 10.0, filtfilt=False, gaps=gaps
+        ),
+        1,
+    )
+    filter_segments(
+        lambda ts, gaps: ktk.filters.savgol(
+            ts, window_length=7, poly_order=2, gaps=gaps
+        ),
+        7,
+    )
+    filter_segments(lambda ts, gaps: ktk.filters.smooth(ts, 7, gaps=gaps), 7)
+
+    # Default behaviour is unchanged
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        filtered = ktk.filters.butter(ts, 10.0)
+    assert np.allclose(
+        filtered.data["points"],
+        ktk.filters.butter(ts, 10.0, gaps="interpolate").data["points"],
+        equal_nan=True,
+    )
+
+    # Same result when the segments are filtered in several threads
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = ktk.filters.butter(ts, 10.0, gaps="split")
+        for n_jobs in [2, 3, 8]:
+            with ktk.config.temporary_n_jobs(n_jobs):
+                filtered = ktk.filters.butter(ts, 10.0, gaps="split")
+            assert filtered._is_equivalent(expected, equal=True)
+
+    try:
+        ktk.filters.butter(ts, 10.0, gaps="nope")
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+
+def test_float_dtype():
+    """Test that filters keep float32 data in float32."""
+    ts = ktk.TimeSeries(time=np.arange(100) / 100)
+    ts.data["float32"] = np.random.rand(100, 3).astype(np.float32)
+    ts.data["float64"] = np.random.rand(100)
+    ts.data["int"] = np.arange(100)
+
+    for filtered in [
+        ktk.filters.butter(ts, 10.0),
+        ktk.filters.butter(ts, 10.0, filtfilt=False),
+        ktk.filters.savgol(ts, window_length=5, poly_order=2),
+        ktk.filters.deriv(ts),
+    ]:
+        assert filtered.data["float32"].dtype == np.float32
+        assert filtered.data["float64"].dtype == np.float64
+        assert filtered.data["int"].dtype == np.float64
+
+    with ktk.config.temporary_float_dtype(np.float32):
+        filtered = ktk.filters.butter(ts, 10.0)
+    assert filtered.data["float64"].dtype == np.float32
+    assert filtered.data["int"].dtype == np.float32
+
+
 if __name__ == "__main__":
     import pytest
 
@@ -76,6 +76,26 @@ def test_matmul():
     assert np.sum(np.abs(result - np.array([3, 4, 5]))) < 1e-15
 
 
+def test_float_dtype():
+    """Test that geometry functions keep float32 inputs in float32."""
+    transforms = ktk.geometry.create_transforms(
+        "z", np.array([[10.0], [20.0]], dtype=np.float32)
+    )
+    assert transforms.dtype == np.float32
+    assert ktk.geometry.inv(transforms).dtype == np.float32
+    points = np.ones((2, 4), dtype=np.float32)
+    assert ktk.geometry.matmul(transforms, points).dtype == np.float32
+    assert (
+        ktk.geometry.get_local_coordinates(points, transforms).dtype
+        == np.float32
+    )
+
+    # Integers give float64 as before
+    assert ktk.geometry.matmul(np.eye(2, dtype=int)[None], [[1, 2]]).dtype == (
+        np.float64
+    )
+
+
 def test_inv():
     """Test inverse matrix series."""
     # Try with simple rotations and translations
@@ -28,6 +28,7 @@ __email__ = "chenier.felix@uqam.ca"
 __license__ = "Apache 2.0"
 
 import kineticstoolkit._repr as _repr
+import numpy as np
 
 
 def test_format_dict_entries():
@@ -58,6 +59,23 @@ def test_format_dict_entries():
     )
 
 
+def test_format_dict_entries_memory():
+    """Test that large abbreviated arrays show their memory usage."""
+    d = {
+        "small": np.zeros(100),
+        "large": np.zeros((2**17, 2)),
+        "dict": {"a": np.zeros(2**17), "b": np.zeros(2**17)},
+    }
+    assert _repr._format_dict_entries(d) == (
+        "    'small': <array of shape (100,)>\n"
+        "    'large': <array of shape (131072, 2), 2.0 MiB>\n"
+        "     'dict': <dict with 2 entries, 2.0 MiB>\n"
+    )
+    assert _repr._format_nbytes(512) == "512 B"
+    assert _repr._format_nbytes(1536) == "1.5 KiB"
+    assert _repr._format_nbytes(3 * 2**40) == "3.0 TiB"
+
+
 if __name__ == "__main__":
     import pytest
 
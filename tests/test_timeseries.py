@@ -28,6 +28,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 import warnings
+import pickle
+import base64
+import pytest
+from copy import deepcopy
 from kineticstoolkit.exceptions import (
     TimeSeriesRangeError,
     TimeSeriesEventNotFoundError,
@@ -202,6 +206,93 @@ def test_copy():
     assert ts2.events[2].time == 100
 
 
+def test_copy_on_write():
+    """Test that copies share their data until it is accessed."""
+
+    def is_shared(ts1, ts2, key1, key2=None):
+        return dict.__getitem__(ts1.data, key1) is dict.__getitem__(
+            ts2.data, key1 if key2 is None else key2
+        )
+
+    ts1 = ktk.TimeSeries(time=np.arange(10.0))
+    ts1.data["signal1"] = np.arange(10.0)
+    ts1.data["signal2"] = np.ones((10, 4))
+
+    # Metadata-only methods do not duplicate data
+    ts2 = (
+        ts1.add_event(1.0, "event")
+        .shift(1.0)
+        .add_data_info("signal1", "Unit", "m")
+    )
+    assert is_shared(ts1, ts2, "signal1")
+    assert is_shared(ts1, ts2, "signal2")
+    ts3 = ts1.rename_data("signal1", "signal3")
+    assert is_shared(ts1, ts3, "signal1", "signal3")
+
+    # Writing to a copy does not affect the original, and vice-versa
+    ts2.data["signal1"][0] = 100.0
+    ts1.data["signal2"][0] = 100.0
+    assert ts1.data["signal1"][0] == 0.0
+    assert ts2.data["signal2"][0, 0] == 1.0
+    assert ts3.data["signal3"][0] == 0.0
+    assert ts3.data["signal2"][0, 0] == 1.0
+
+    # Arrays exposed through dict methods are unshared too
+    ts2 = ts1.copy()
+    for value in ts2.data.values():
+        value[1] = -1.0
+    ts3 = ts1.copy()
+    dict(ts3.data)["signal1"][2] = -1.0
+    ts4 = ts1.copy()
+    {**ts4.data}["signal1"][3] = -1.0
+    assert np.all(ts1.data["signal1"][1:4] == [1.0, 2.0, 3.0])
+
+    # Arrays that are referenced elsewhere are not shared
+    signal = ts1.data["signal1"]
+    ts2 = ts1.copy()
+    assert not is_shared(ts1, ts2, "signal1")
+    assert is_shared(ts1, ts2, "signal2")
+    signal[0] = -1.0
+    assert ts2.data["signal1"][0] == 0.0
+
+    # Deep copy and pickle
+    assert deepcopy(ts1) == ts1
+    assert pickle.loads(pickle.dumps(ts1)) == ts1
+
+
+def test_unpickle_previous_version():
+    """Test that TimeSeries pickled before data sharing can be loaded."""
+    # ktk.TimeSeries(time=np.arange(3) / 10,
+    #                data={"Forces": np.arange(6.0).reshape(3, 2)})
+    # with an event "push" at 0.1 s, pickled before TimeSeriesDataDict
+    # tracked its shared arrays.
+    pickled = base64.b64decode(
+        "gASV5gEAAAAAAACMGmtpbmV0aWNzdG9vbGtpdC50aW1lc2VyaWVzlIwKVGltZVNlcm"
+        "llc5STlCmBlH2UKIwFX3RpbWWUjBVudW1weS5jb3JlLm11bHRpYXJyYXmUjAxfcmVj"
+        "b25zdHJ1Y3SUk5SMBW51bXB5lIwHbmRhcnJheZSTlEsAhZRDAWKUh5RSlChLAUsDhZ"
+        "RoCYwFZHR5cGWUk5SMAmY4lImIh5RSlChLA4wBPJROTk5K/////0r/////SwB0lGKJ"
+        "QxgAAAAAAAAAAJqZmZmZmbk/mpmZmZmZyT+UdJRijAVfZGF0YZRoAIwSVGltZVNlcm"
+        "llc0RhdGFEaWN0lJOUKYGUjAZGb3JjZXOUaAhoC0sAhZRoDYeUUpQoSwFLA0sChpRo"
+        "FYlDMAAAAAAAAAAAAAAAAAAA8D8AAAAAAAAAQAAAAAAAAAhAAAAAAAAAEEAAAAAAAA"
+        "AUQJR0lGJzjAl0aW1lX2luZm+UfZSMBFVuaXSUjAFzlHOMCWRhdGFfaW5mb5R9lIwH"
+        "X2V2ZW50c5RoAIwTVGltZVNlcmllc0V2ZW50TGlzdJSTlCmBlGgAjA9UaW1lU2VyaW"
+        "VzRXZlbnSUk5QpgZR9lCiMBHRpbWWURz+5mZmZmZmajARuYW1llIwEcHVzaJR1YmF1"
+        "Yi4="
+    )
+    ts = pickle.loads(pickled)
+
+    expected = ktk.TimeSeries(time=np.arange(3) / 10)
+    expected.data["Forces"] = np.arange(6.0).reshape(3, 2)
+    expected = expected.add_event(0.1, "push")
+    assert ts == expected
+
+    # The loaded TimeSeries behaves normally
+    ts2 = ts.copy()
+    ts2.data["Forces"][0, 0] = 100.0
+    assert ts.data["Forces"][0, 0] == 0.0
+    assert pickle.loads(pickle.dumps(ts)) == ts
+
+
 def test_time_property():
     # Set time on constructor
     ts = ktk.TimeSeries(time=[1, 2, 3])
@@ -310,6 +401,60 @@ def test_check_well_typed():
     ts._check_well_typed()
 
 
+def test_check_well_typed_cache():
+    ts = ktk.TimeSeries(time=np.arange(10.0))
+    ts._check_well_typed()
+    ts._check_increasing_time()
+
+    # The cache is only used when the validation level is not strict
+    assert not ts._time_check_passed("increasing")
+    with ktk.config.temporary_validation_level("cheap"):
+        assert ts._time_check_passed("well_typed")
+        assert ts._time_check_passed("increasing")
+
+    # In strict mode, in-place modifications of time are detected
+    assert ts.get_index_before_time(5.5) == 5
+    ts.time[3] = ts.time[1]
+    try:
+        ts._check_well_typed()
+        raise AssertionError("This should fail.")
+    except TypeError:
+        pass
+    ts.time[3] = 3.0
+
+    # Assigning a new time invalidates the cache
+    ts.time = np.array([0.0, 2.0, 1.0])
+    with ktk.config.temporary_validation_level("cheap"):
+        assert not ts._time_check_passed("well_typed")
+    ts._check_well_typed()
+    try:
+        ts._check_increasing_time()
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+    ts.time = np.array([0.0, 1.0, 1.0])
+    try:
+        ts._check_well_typed()
+        raise AssertionError("This should fail.")
+    except TypeError:
+        pass
+
+    # The cache is not part of the representation
+    assert "_time_checks" not in str(ts)
+
+    # Events added to the list by any means are TimeSeriesEvent
+    ts.events.insert(0, ktk.TimeSeriesEvent(1.0, "a"))
+    ts.events += [ktk.TimeSeriesEvent(2.0, "b")]
+    for event in ts.events:
+        assert isinstance(event, ktk.TimeSeriesEvent)
+    try:
+        ts.events.insert(0, "not an event")
+        raise AssertionError("This should fail.")
+    except AttributeError:
+        pass
+
+
 def test_check_well_shaped():
     ts = ktk.TimeSeries()  # Should pass
     ts._check_well_shaped()
@@ -460,6 +605,102 @@ def test_from_to_dataframe():
 #     assert np.all(df == df2)
 
 
+def test_to_dataframe_mixed_dtypes():
+    """Test that to_dataframe keeps the column order and dtypes."""
+    ts = ktk.TimeSeries(time=np.arange(5.0))
+    ts.data["int"] = np.arange(5)
+    ts.data["frames"] = np.random.rand(5, 2, 2)
+    ts.data["bool"] = np.arange(5) > 2
+    ts.data["float"] = np.random.rand(5)
+    ts.data_info["frames"] = {"Unit": "m"}
+
+    df, info = ts._to_dataframe_and_info()
+    assert list(df.columns) == [
+        "int",
+        "frames[0,0]",
+        "frames[0,1]",
+        "frames[1,0]",
+        "frames[1,1]",
+        "bool",
+        "float",
+    ]
+    assert df["int"].dtype == int
+    assert df["bool"].dtype == bool
+    assert df["frames[1,0]"].dtype == float
+    assert np.all(df["frames[1,0]"] == ts.data["frames"][:, 1, 0])
+    assert np.all(df.index == ts.time)
+    assert info == [{}] + [{"Unit": "m"}] * 4 + [{}, {}]
+
+
+def test_from_dataframe_column_parsing():
+    """Test that from_dataframe reorders and validates indexed columns."""
+    df = pd.DataFrame(
+        np.arange(12).reshape(2, 6),
+        columns=["r[1, 1]", "r[0,0]", "t[1]", "r[0, 1]", "t[0]", "r[1,0]"],
+    )
+    ts = ktk.TimeSeries.from_dataframe(df)
+    assert list(ts.data) == ["r", "t"]
+    assert np.all(ts.data["r"][0] == [[1, 3], [5, 0]])
+    assert np.all(ts.data["t"][1] == [10, 8])
+
+    # Missing column
+    try:
+        ktk.TimeSeries.from_dataframe(df.drop(columns=["r[0,0]"]))
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+    # Inconsistent number of indices
+    try:
+        ktk.TimeSeries.from_dataframe(df.rename(columns={"r[0,0]": "r[0]"}))
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+
+def test_to_from_arrow():
+    pytest.importorskip("pyarrow")
+
+    ts = ktk.TimeSeries(time=np.arange(5.0))
+    ts.data["float"] = np.random.rand(5)
+    ts.data["frames"] = np.random.rand(5, 4, 4)
+    ts.data["int"] = np.arange(10).reshape(5, 2)
+    ts.data["bool"] = np.arange(5) > 2
+    ts.add_data_info("frames", "Unit", "m", in_place=True)
+    ts.add_events([1.0, 2.5], ["a", "b"], in_place=True)
+
+    table = ts.to_arrow()
+    assert table.column_names == ["time", "float", "frames", "int", "bool"]
+
+    ts2 = ktk.TimeSeries.from_arrow(table)
+    assert ts2._is_equivalent(ts)
+    for key in ts.data:
+        assert ts2.data[key].dtype == ts.data[key].dtype
+
+    # Numerical data are not copied
+    assert np.shares_memory(
+        ts.data._get_without_copy("frames"),
+        ts2.data._get_without_copy("frames"),
+    )
+
+    # NumPy scalars in metadata and event times are stored as Python numbers
+    ts.add_data_info("float", "Scale", np.float32(2.0), in_place=True)
+    ts.add_data_info("float", "Offset", np.int64(3), in_place=True)
+    ts.add_event(np.float32(3.5), "c", in_place=True)
+    ts2 = ktk.TimeSeries.from_arrow(ts.to_arrow())
+    assert ts2.data_info["float"]["Scale"] == 2.0
+    assert ts2.data_info["float"]["Offset"] == 3
+    assert ts2.events[-1].time == 3.5
+
+    # A data key named "time" is refused
+    ts.data["time"] = ts.time
+    try:
+        ts.to_arrow()
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+
 def test_from_array():
     # From array
     ts = ktk.TimeSeries.from_array(
@@ -683,6 +924,52 @@ def test_add_event():
     assert len(ts.events) == 3
 
 
+def test_add_events():
+    # Compare to add_event in a loop
+    rng = np.random.default_rng(0)
+    times = np.round(rng.uniform(0, 10, 500), 1)
+    names = [f"event{i}" for i in rng.integers(0, 3, 500)]
+
+    ts = ktk.TimeSeries()
+    ts = ts.add_event(5.5, "event1")
+    for unique in [False, True]:
+        ts1 = ts.copy()
+        for time, name in zip(times, names):
+            ts1.add_event(time, name, in_place=True, unique=unique)
+        ts2 = ts.add_events(times, names, unique=unique)
+        assert ts1.events == ts2.events
+
+    # Single name
+    ts = ktk.TimeSeries().add_events([1.0, 2.0], "test")
+    assert ts.events == [
+        ktk.TimeSeriesEvent(1.0, "test"),
+        ktk.TimeSeriesEvent(2.0, "test"),
+    ]
+
+    # Length mismatch
+    try:
+        ts.add_events([1.0, 2.0], ["a"])
+        raise Exception("This should fail.")
+    except ValueError:
+        pass
+
+
+def test_remove_events():
+    ts = ktk.TimeSeries()
+    ts = ts.add_events(
+        [5.5, 10.8, 2.3, 2.3, 4.0], ["event1", "event2", "event2", "a", "a"]
+    )
+    ts2 = ts.remove_events([2.3, 5.5 + 1e-9, 7.0], ["event2", "event1", "a"])
+    assert ts2.events == [
+        ktk.TimeSeriesEvent(10.8, "event2"),
+        ktk.TimeSeriesEvent(2.3, "a"),
+        ktk.TimeSeriesEvent(4.0, "a"),
+    ]
+    ts.remove_events([2.3, 4.0], "a", in_place=True)
+    assert ts.count_events("a") == 0
+    assert len(ts.events) == 3
+
+
 def test_rename_event():
     # Original doctest
     ts = ktk.TimeSeries()
@@ -791,6 +1078,36 @@ def test_remove_duplicate_events():
     assert ts2.events[2].name == "event3"
 
 
+def test_remove_duplicate_events_many():
+    # Compare with a direct implementation using np.isclose
+    def get_duplicate_indexes(events):
+        unique_events = []
+        out = []
+        for i_event, event in enumerate(events):
+            for unique_event in unique_events:
+                if unique_event.name == event.name and np.isclose(
+                    unique_event.time, event.time
+                ):
+                    out.append(i_event)
+                    break
+            else:
+                unique_events.append(event)
+        return out
+
+    rng = np.random.default_rng(0)
+    for scale in [1e-9, 1e-5, 1.0]:
+        # Times that are close to each other relative to the tolerance
+        times = np.round(rng.uniform(0, 100, 300))
+        times *= 1 + scale * rng.random(300)
+        times[::50] = np.nan
+        times[1::50] = np.inf
+        names = [f"event{i}" for i in rng.integers(0, 3, 300)]
+        ts = ktk.TimeSeries().add_events(times, names)
+        assert ts._get_duplicate_event_indexes() == get_duplicate_indexes(
+            ts.events
+        )
+
+
 def test_sort_events():
     # Original doctest
     ts = ktk.TimeSeries(time=np.arange(100) / 10)
@@ -841,6 +1158,73 @@ def test_get_event_indexes_count_index_time():
     assert ts.get_event_time("event2", 1) == 10.8
 
 
+def test_event_name_index():
+    # The event index must follow every modification of the events
+    ts = ktk.TimeSeries()
+    ts = ts.add_event(5.5, "event1")
+    ts = ts.add_event(10.8, "event2")
+    ts = ts.add_event(2.3, "event2")
+    assert ts._get_event_indexes("event2") == [2, 1]
+
+    ts.events[2].time = 12.0  # Modify an event
+    assert ts._get_event_indexes("event2") == [1, 2]
+
+    ts.events[0].name = "event2"  # Rename an event
+    assert ts._get_event_indexes("event2") == [0, 1, 2]
+    assert ts._get_event_indexes("event1") == []
+
+    ts.events.pop(0)  # Remove an event
+    assert ts._get_event_indexes("event2") == [0, 1]
+
+    ts.events.insert(0, ktk.TimeSeriesEvent(0.0, "event2"))  # Insert
+    assert ts._get_event_index("event2", 0) == 0
+
+    ts.events[0] = ktk.TimeSeriesEvent(20.0, "event2")  # Replace
+    assert ts._get_event_index("event2", 2) == 0
+
+    ts.events.reverse()
+    assert ts._get_event_index("event2", 2) == 2
+
+    del ts.events[2]
+    assert ts.count_events("event2") == 2
+
+
+def test_event_columns():
+    ts = ktk.TimeSeries(time=np.arange(10.0))
+    ts = ts.add_event(5.5, "event1")
+    ts = ts.add_event(10.8, "event2")
+    ts = ts.add_event(2, "event2")
+
+    times, codes, names = ts.events._get_columns()
+    assert np.array_equal(times, [5.5, 10.8, 2.0])
+    assert [names[code] for code in codes] == ["event1", "event2", "event2"]
+
+    # Vectorized operations keep the events and their cache consistent
+    ts2 = ts.sort_events()
+    assert ts2.events == sorted(ts.events)
+    assert np.array_equal(ts2.events._get_columns()[0], [2.0, 5.5, 10.8])
+    assert ts2._get_event_indexes("event2") == [0, 2]
+    ts2 = ts2.trim_events()
+    assert ts2.events == [
+        ktk.TimeSeriesEvent(2, "event2"),
+        ktk.TimeSeriesEvent(5.5, "event1"),
+    ]
+    assert ts2.events[0].time == 2  # Original type is kept
+    assert isinstance(ts2.events[0].time, int)
+
+    # Copies and pickles are independent TimeSeriesEventList
+    for events in [
+        deepcopy(ts.events),
+        pickle.loads(pickle.dumps(ts.events)),
+    ]:
+        assert isinstance(events, ktk.timeseries.TimeSeriesEventList)
+        assert events == ts.events
+        assert events[0] is not ts.events[0]
+        events[0].time = 0.0
+        assert ts.events[0].time == 5.5
+        assert events._get_columns()[0][0] == 0.0
+
+
 # %% Sample rate, merge, resample
 
 
@@ -983,6 +1367,81 @@ def test_resample_with_nans():
     )
 
 
+def test_resample_with_many_gaps():
+    """Test that resample masks every gap, whatever their number."""
+    ts = ktk.TimeSeries(time=np.arange(1000) / 100)
+    ts.data["data"] = np.random.rand(1000, 2)
+    ts.data["data"][np.random.rand(1000) < 0.3] = np.nan
+    ts.data["data"][500:700] = np.nan
+    ts1 = ts.resample(np.linspace(-1, 11, 3001), extrapolate=True)
+
+    # Brute-force reference: a new sample is missing if it lies strictly
+    # between the neighbours of a missing sample.
+    expected = np.zeros(3001, dtype=bool)
+    for i in np.flatnonzero(ts.isnan("data")):
+        lower = ts.time[i - 1] if i > 0 else -np.inf
+        upper = ts.time[i + 1] if i < 999 else np.inf
+        expected |= (ts1.time > lower) & (ts1.time < upper)
+    assert np.all(ts1.isnan("data") == expected)
+
+
+def test_resample_fill_many_keys():
+    """Test that keys resampled together match keys resampled alone."""
+    ts = ktk.TimeSeries(time=np.arange(100) / 10)
+    ts.data["int"] = np.arange(100)
+    for i in range(6):
+        ts.data[f"data{i}"] = np.random.rand(100, 2, 2)
+        ts.data[f"data{i}"][(10 * (i % 3)) : (10 * (i % 3) + 5)] = np.nan
+    ts.data["data5"][50] = np.nan
+    ts.data["empty"] = np.nan * np.ones((100, 3))
+
+    for kind in ["linear", "pchip"]:
+        ts1 = ts.resample(np.linspace(-1, 11, 97), kind)
+        ts2 = ts.fill_missing_samples(2)
+        assert list(ts1.data) == list(ts.data)
+        assert list(ts2.data) == list(ts.data)
+        for key in ts.data:
+            assert np.array_equal(
+                ts1.data[key],
+                ts.get_subset(key).resample(ts1.time, kind).data[key],
+                equal_nan=True,
+            )
+            assert np.array_equal(
+                ts2.data[key],
+                ts.get_subset(key).fill_missing_samples(2).data[key],
+                equal_nan=True,
+            )
+
+
+def test_get_interpolator():
+    """Test that an interpolator gives the same results as resample."""
+    ts = ktk.TimeSeries(time=np.arange(100) / 10)
+    ts.data["data1"] = np.random.rand(100, 4)
+    ts.data["data1"][[0, 10, 11, 50]] = np.nan
+    ts.data["data2"] = np.random.rand(100)
+    ts = ts.add_event(1.0, "event")
+    ts = ts.add_data_info("data2", "Unit", "m")
+
+    for kind in ["linear", "pchip"]:
+        for extrapolate in [False, True]:
+            interpolator = ts.get_interpolator(kind, extrapolate=extrapolate)
+            for target in [
+                20.0,
+                np.linspace(-1, 11, 97),
+                np.linspace(1.05, 1.15, 3),
+            ]:
+                assert interpolator(target) == ts.resample(
+                    target, kind, extrapolate=extrapolate
+                )
+
+    # Modifying the TimeSeries does not affect the interpolator
+    interpolator = ts.get_interpolator()
+    ts1 = interpolator(ts.time)
+    ts.data["data2"][:] = 0.0
+    ts.add_event(2.0, "event", in_place=True)
+    assert interpolator(ts.time) == ts1
+
+
 def test_resample_no_extrapolation():
     ts = ktk.TimeSeries(time=np.arange(2, 12) / 5)
     ts.data["data"] = ts.time**2
@@ -1126,6 +1585,101 @@ def test_fill_missing_samples():
     )
 
 
+def test_get_memory_usage():
+    ts = ktk.TimeSeries(time=np.arange(100.0))
+    ts.data["a"] = np.zeros((100, 4))
+    ts.data["b"] = np.zeros(100, dtype=np.float32)
+    ts.add_events([1.0, 2.0], ["x", "y"], in_place=True)
+
+    usage = ts.get_memory_usage()
+    assert usage["Time"] == {"Bytes": 800, "IsView": False}
+    assert usage["Data"]["a"] == {
+        "Bytes": 3200,
+        "IsView": False,
+        "IsShared": False,
+    }
+    assert usage["Data"]["b"]["Bytes"] == 400
+    assert usage["Events"]["Bytes"] > 0
+    assert usage["Total"] == 800 + 3200 + 400 + usage["Events"]["Bytes"]
+
+    # Copies and views
+    ts2 = ts.copy()
+    assert ts2.get_memory_usage()["Data"]["a"]["IsShared"]
+    ts2.data["a"]  # Reading unshares the array
+    assert not ts2.get_memory_usage()["Data"]["a"]["IsShared"]
+    assert not ts.get_memory_usage()["Data"]["a"]["IsShared"]
+    subset = ts.get_ts_between_indexes(10, 19, view=True)
+    assert subset.get_memory_usage()["Data"]["a"]["IsView"]
+
+
+def test_float_dtype():
+    ts = ktk.TimeSeries(time=np.arange(10.0))
+    ts.data["float32"] = np.arange(10, dtype=np.float32)
+    ts.data["float32"][3] = np.nan
+    ts.data["float64"] = np.arange(10.0)
+    ts.data["int"] = np.arange(10)
+
+    # Without policy, floating-point dtypes are preserved
+    for ts_out in [
+        ts.resample(2.0),
+        ts.resample(2.0, "pchip"),
+        ts.fill_missing_samples(0),
+    ]:
+        assert ts_out.data["float32"].dtype == np.float32
+        assert ts_out.data["float64"].dtype == np.float64
+        assert ts_out.data["int"].dtype == np.float64
+
+    # With a policy, floating-point data are converted on assignment
+    with ktk.config.temporary_float_dtype("float32"):
+        ts2 = ktk.TimeSeries(time=np.arange(10.0))
+        ts2.data["float64"] = np.arange(10.0)
+        ts2.data["int"] = np.arange(10)
+        assert ts2.time.dtype == np.float64
+        assert ts2.data["float64"].dtype == np.float32
+        assert ts2.data["int"].dtype == int
+        assert ts2.resample(2.0).data["int"].dtype == np.float32
+
+    try:
+        with ktk.config.temporary_float_dtype(int):
+            pass
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+
+def test_get_missing_samples():
+    ts = ktk.TimeSeries(time=np.arange(10))
+    ts.data["full"] = np.zeros((10, 2))
+    ts.data["gaps"] = np.arange(10.0)
+    ts.data["gaps"][[0, 1, 4, 5, 6, 9]] = np.nan
+    ts.data["empty"] = np.nan * np.zeros((10, 2, 2))
+    ts.data["empty"][5, 0, 0] = 0.0  # Still missing
+
+    missing = ts.get_missing_samples()
+    assert list(missing) == ["full", "gaps", "empty"]
+    assert missing["full"]["StartIndex"].shape == (0,)
+    assert missing["full"]["EndIndex"].shape == (0,)
+    assert missing["full"]["Length"].shape == (0,)
+    assert np.all(missing["gaps"]["StartIndex"] == [0, 4, 9])
+    assert np.all(missing["gaps"]["EndIndex"] == [1, 6, 9])
+    assert np.all(missing["gaps"]["Length"] == [2, 3, 1])
+    assert np.all(missing["empty"]["StartIndex"] == [0])
+    assert np.all(missing["empty"]["EndIndex"] == [9])
+    assert np.all(missing["empty"]["Length"] == [10])
+
+    # Subset of keys
+    assert list(ts.get_missing_samples("gaps")) == ["gaps"]
+    assert list(ts.get_missing_samples(["empty", "full"])) == [
+        "empty",
+        "full",
+    ]
+    try:
+        ts.get_missing_samples("nonexistent")
+        raise AssertionError("This should fail.")
+    except KeyError:
+        pass
+
+
 # %% get_index
 
 
@@ -1139,6 +1693,22 @@ def test_get_index_at_time():
     assert ts.get_index_at_time(2.1) == 4
 
 
+def test_get_indexes_at_times():
+    rng = np.random.default_rng(0)
+    times = np.concatenate(([-1.0, 0.25, 0.3, 11.0], rng.uniform(-1, 11, 100)))
+
+    # Increasing time, including ties between two samples
+    ts = ktk.TimeSeries(time=np.arange(0, 10.5, 0.5))
+    expected = [np.argmin(np.abs(ts.time - time)) for time in times]
+    assert np.array_equal(ts.get_indexes_at_times(times), expected)
+    assert ts.get_indexes_at_times(times.reshape(2, -1)).shape == (2, 52)
+
+    # Unsorted time
+    ts = ktk.TimeSeries(time=rng.permutation(np.arange(0, 10.5, 0.5)))
+    expected = [np.argmin(np.abs(ts.time - time)) for time in times]
+    assert np.array_equal(ts.get_indexes_at_times(times), expected)
+
+
 def test_get_index_before_time():
     ts = ktk.TimeSeries(time=[0.2, 0.5, 1, 1.5, 2])
     try:
@@ -1495,6 +2065,109 @@ def test_get_ts_between_events():
         pass
 
 
+def test_segment():
+    ts = ktk.TimeSeries(
+        time=np.arange(100) / 10,
+        data={"data": np.arange(200).reshape(100, 2)},
+    )
+    ts = ts.add_events([-1.0, 0.05, 2.0, 4.0, 4.02, 9.5], "start")
+    ts = ts.add_events([1.0, 3.0, 3.5, 4.01, 7.0, 20.0], "end")
+
+    for inclusive in [False, True, (True, False), (False, True)]:
+        # Compare with get_ts_between_events in a loop
+        expected = []
+        for occurrence1 in range(ts.count_events("start")):
+            time1 = ts.events[ts._get_event_index("start", occurrence1)].time
+            for occurrence2 in range(ts.count_events("end")):
+                index = ts._get_event_index("end", occurrence2)
+                if ts.events[index].time > time1:
+                    break
+            try:
+                expected.append(
+                    ts.get_ts_between_events(
+                        "start",
+                        "end",
+                        occurrence1,
+                        occurrence2,
+                        inclusive=inclusive,
+                    )
+                )
+            except (ValueError, TimeSeriesRangeError):
+                pass
+
+        for view in [False, True]:
+            segments = ts.segment(
+                "start", "end", inclusive=inclusive, view=view
+            )
+            assert segments == expected
+
+    # Same begin and end events
+    segments = ts.segment("start", "start")
+    assert len(segments) == 4
+    assert np.allclose(segments[0].time, [0.0])
+    assert np.allclose(segments[1].time, np.arange(1, 20) / 10)
+    assert ts.segment("none", "end") == []
+
+
+def test_get_ts_view():
+    ts = ktk.TimeSeries(
+        time=np.linspace(0, 9, 10),
+        data={"data": np.arange(20).reshape(10, 2)},
+    )
+    ts.add_event(2, "event1", in_place=True)
+    ts.add_event(6, "event2", in_place=True)
+
+    for args, kwargs, method in [
+        ((2,), {}, ts.get_ts_before_index),
+        ((2,), {}, ts.get_ts_after_index),
+        ((2, 5), {"inclusive": True}, ts.get_ts_between_indexes),
+        ((2.5,), {}, ts.get_ts_before_time),
+        ((2.5,), {}, ts.get_ts_after_time),
+        ((2.5, 6.5), {}, ts.get_ts_between_times),
+        (("event1",), {}, ts.get_ts_before_event),
+        (("event1",), {}, ts.get_ts_after_event),
+        (("event1", "event2"), {}, ts.get_ts_between_events),
+    ]:
+        copied = method(*args, **kwargs)
+        viewed = method(*args, **kwargs, view=True)
+        assert viewed == copied
+        assert not np.shares_memory(copied.time, ts.time)
+        assert not np.shares_memory(copied.data["data"], ts.data["data"])
+        assert np.shares_memory(viewed.time, ts.time)
+        assert np.shares_memory(viewed.data["data"], ts.data["data"])
+
+        # Views are read-only, but the original is still writeable
+        try:
+            viewed.data["data"][0] = 0
+            raise AssertionError("This should fail.")
+        except ValueError:
+            pass
+        assert ts.data["data"].flags.writeable
+        assert ts.time.flags.writeable
+
+        # A copy of a view is writeable and independent
+        viewed_copy = viewed.copy()
+        viewed_copy.data["data"][0] = -1
+        assert viewed_copy.time.flags.writeable
+        assert not np.any(ts.data["data"] == -1)
+
+    # A view of a copy shares memory with the source, without copying the
+    # shared data first
+    ts = ktk.TimeSeries(time=np.linspace(0, 9, 10))
+    ts.data["data"] = np.arange(20).reshape(10, 2)
+    copied_ts = ts.copy()
+    viewed = copied_ts.get_ts_between_times(2.5, 6.5, view=True)
+    source = dict.__getitem__(ts.data, "data")
+    assert np.shares_memory(viewed.data["data"], source)
+    assert dict.__getitem__(copied_ts.data, "data") is source
+
+    # Writing to either TimeSeries afterwards does not affect the view
+    expected = viewed.data["data"].copy()
+    ts.data["data"][:] = -1
+    copied_ts.data["data"][:] = -2
+    assert np.array_equal(viewed.data["data"], expected)
+
+
 # %% plot
 
 
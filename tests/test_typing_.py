@@ -26,6 +26,7 @@ __license__ = "Apache 2.0"
 
 from kineticstoolkit.typing_ import check_param
 from kineticstoolkit import TimeSeries, TimeSeriesEvent
+import kineticstoolkit as ktk
 import numpy as np
 import pandas as pd
 
@@ -137,6 +138,55 @@ def test_check_param():
         pass
 
 
+def test_check_param_validation_level():
+    # Cheap: the type is checked but not the contents
+    with ktk.config.temporary_validation_level("cheap"):
+        check_param("test", [1, "a"], list, contents_type=int)
+        try:
+            check_param("test", "a", int)
+            raise Exception("This should fail.")
+        except TypeError:
+            pass
+
+    # Off: nothing is checked
+    with ktk.config.temporary_validation_level("off"):
+        check_param("test", "a", int)
+        ts = TimeSeries(time=[0.0, 2.0, 1.0])
+        ts._check_well_shaped()
+        ts._check_increasing_time()
+
+    # Back to strict
+    assert ktk.config.validation_level == "strict"
+    try:
+        check_param("test", [1, "a"], list, contents_type=int)
+        raise Exception("This should fail.")
+    except TypeError:
+        pass
+    try:
+        ts._check_increasing_time()
+        raise Exception("This should fail.")
+    except ValueError:
+        pass
+
+    # Invalid level
+    try:
+        with ktk.config.temporary_validation_level("none"):
+            pass
+        raise Exception("This should fail.")
+    except ValueError:
+        pass
+
+    # Invalid level assigned directly
+    ktk.config.validation_level = "Off"
+    try:
+        check_param("test", 1, int)
+        raise Exception("This should fail.")
+    except ValueError:
+        pass
+    finally:
+        ktk.config.validation_level = "strict"
+
+
 if __name__ == "__main__":
     import pytest
 